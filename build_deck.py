@@ -1,10 +1,17 @@
+import argparse
 import os
+import sys
+import tempfile
 
 from hadron_anki.catalog.loader import load_catalog
 from hadron_anki.catalog.canonical_loader import load_canonical_catalog
 from hadron_anki.catalog.build import build_specs
-from hadron_anki.deck.apkg import build_apkg
+from hadron_anki.catalog.index import ParticleFilter, load_canonical_subset
+from hadron_anki.deck.apkg import build_apkg, verify_build_determinism
+from hadron_anki.deck.media import render_media_set
 from hadron_anki.preview.generator import generate_preview, generate_feynman_preview
+from hadron_anki.render.cache import RenderCache
+from hadron_anki.render.config import get_style_config
 from hadron_anki.render.math_labels import generate_math_label_preview
 
 # --- CONFIGURATION ---
@@ -14,47 +21,123 @@ CARD_TYPES = ["summary", "composition", "identity", "mass", "decay"]
 
 CANONICAL_CATALOG = "catalogs/core_particles.canonical.yaml"
 DECAYS_CATALOG = "catalogs/core_decays.yaml"
+RENDER_CACHE_DIR = ".cache/render"
+DEFAULT_OUT_DIR = "decks"
 
 
 def main():
-    out_dir = "decks"
+    parser = argparse.ArgumentParser(description="Build the Hadron Anki decks and preview gallery.")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for SVG rendering (default: 1)",
+    )
+    parser.add_argument(
+        "--verify-determinism",
+        action="store_true",
+        help="Build the combined deck with --jobs 1 and --jobs N, compare bytes, and exit",
+    )
+    parser.add_argument(
+        "--filter",
+        help="Only build particles matching a filter, queried from the catalog's SQLite index "
+             "(e.g. 'hadron_type=baryon,strange=true,max_mass=1500')",
+    )
+    parser.add_argument(
+        "--out",
+        metavar="DIR",
+        help=f"Directory for the decks (default: {DEFAULT_OUT_DIR}); required with --filter so a "
+             "subset build never overwrites the full decks",
+    )
+    parser.add_argument(
+        "--inline-svg-max-bytes",
+        type=int,
+        default=None,
+        metavar="BYTES",
+        help="Embed SVGs up to this size in the card HTML instead of shipping them as media "
+             "(default: ship every SVG as media)",
+    )
+    args = parser.parse_args()
+    if args.filter and (
+        args.out is None or os.path.abspath(args.out) == os.path.abspath(DEFAULT_OUT_DIR)
+    ):
+        parser.error(f"--filter needs an --out directory other than {DEFAULT_OUT_DIR!r}")
+
+    out_dir = args.out or DEFAULT_OUT_DIR
     os.makedirs(out_dir, exist_ok=True)
     out_apkg = os.path.join(out_dir, "hadron_core.apkg")
 
     deck_name = "Hadron Anki::Core Particles"
-    preview_dir = "_preview_out"
+    preview_dir = os.path.join(out_dir, "_preview_out") if args.out else "_preview_out"
 
     # 1. Load canonical particles + decay data, then assemble display-ready specs.
-    canonical = load_canonical_catalog(CANONICAL_CATALOG)
+    if args.filter:
+        canonical = load_canonical_subset(CANONICAL_CATALOG, ParticleFilter.parse(args.filter))
+        if not canonical["particles"]:
+            print(f"No particles match --filter {args.filter!r}.")
+            return 1
+    else:
+        canonical = load_canonical_catalog(CANONICAL_CATALOG)
     decays_by_id = load_catalog(DECAYS_CATALOG)
     specs = build_specs(canonical, decays_by_id)
+    style = get_style_config()
 
-    # 2. Build the combined deck.
-    print(f"Building full deck ({len(specs)} particles) to {out_apkg}...")
-    build_apkg(
-        specs=specs,
-        out_path=out_apkg,
-        deck_name=deck_name,
-        template_version="v3.0-canonical",
-        model_version="v3.0-canonical",
-        card_types=CARD_TYPES,
-    )
+    if args.verify_determinism:
+        jobs = max(args.jobs, 2)
+        print(f"Verifying deterministic output for jobs=1 vs jobs={jobs}...")
+        identical = verify_build_determinism(
+            specs,
+            jobs,
+            deck_name=deck_name,
+            template_version="v3.0-canonical",
+            model_version="v3.0-canonical",
+            card_types=CARD_TYPES,
+            style=style,
+        )
+        print("OK: outputs are byte-identical." if identical else "FAIL: outputs differ.")
+        return 0 if identical else 1
 
-    # 3. Build modular decks, one card type per deck.
-    for ctype in CARD_TYPES:
-        modular_apkg = os.path.join(out_dir, f"hadron_{ctype}.apkg")
-        modular_deck = f"Hadron Anki::{ctype.capitalize()}"
-        print(f"Building modular deck to {modular_apkg}...")
-        build_apkg(
+    cache = RenderCache(RENDER_CACHE_DIR)
+
+    with tempfile.TemporaryDirectory() as media_dir:
+        # 2. Render composition + Feynman SVGs once; every deck variant reuses them.
+        print(f"Rendering media for {len(specs)} particles...")
+        media = render_media_set(specs, media_dir, style=style, cache=cache, jobs=args.jobs)
+
+        # 3. Build the combined deck.
+        print(f"Building full deck ({len(specs)} particles) to {out_apkg}...")
+        report = build_apkg(
             specs=specs,
-            out_path=modular_apkg,
-            deck_name=modular_deck,
-            template_version=f"v3.0-canonical-{ctype}",
-            model_version=f"v3.0-canonical-{ctype}",
-            card_types=[ctype],
+            out_path=out_apkg,
+            deck_name=deck_name,
+            template_version="v3.0-canonical",
+            model_version="v3.0-canonical",
+            card_types=CARD_TYPES,
+            media=media,
+            incremental=True,
+            inline_svg_max_bytes=args.inline_svg_max_bytes,
         )
+        print(f"  {report.summary()}")
+
+        # 4. Build modular decks, one card type per deck.
+        for ctype in CARD_TYPES:
+            modular_apkg = os.path.join(out_dir, f"hadron_{ctype}.apkg")
+            modular_deck = f"Hadron Anki::{ctype.capitalize()}"
+            print(f"Building modular deck to {modular_apkg}...")
+            report = build_apkg(
+                specs=specs,
+                out_path=modular_apkg,
+                deck_name=modular_deck,
+                template_version=f"v3.0-canonical-{ctype}",
+                model_version=f"v3.0-canonical-{ctype}",
+                card_types=[ctype],
+                media=media,
+                incremental=True,
+                inline_svg_max_bytes=args.inline_svg_max_bytes,
+            )
+            print(f"  {report.summary()}")
 
-    # 4. Feynman diagram previews (from the same specs).
+    # 5. Feynman diagram previews (from the same specs).
     feynman_decays = [
         {
             "id": f"{spec.id}_decay",
@@ -65,18 +148,21 @@ def main():
         if spec.decay_diagram
     ]
     print("Generating Feynman diagram previews...")
-    feynman_html = generate_feynman_preview(feynman_decays, preview_dir)
+    feynman_html = generate_feynman_preview(feynman_decays, preview_dir, cache=cache)
 
-    # 5. HTML preview gallery (includes the summary card).
+    # 6. HTML preview gallery (includes the summary card).
     print(f"Generating HTML preview gallery to {preview_dir}...")
     generate_preview(
         specs,
         preview_dir,
         card_types=CARD_TYPES,
         feynman_html=feynman_html,
+        style=style,
+        cache=cache,
+        jobs=args.jobs,
     )
 
-    # 6. Math label preview.
+    # 7. Math label preview.
     math_label_exprs = [
         r"\pi^+", r"\pi^-", r"\pi^0",
         r"\mu^+", r"\nu_\mu",
@@ -88,8 +174,10 @@ def main():
     print(f"Generating math label preview to {math_label_dir}...")
     generate_math_label_preview(math_label_exprs, math_label_dir)
 
-    print("Done. Check the 'decks/' folder for the generated packages.")
+    print(cache.report())
+    print(f"Done. Check the '{out_dir}/' folder for the generated packages.")
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -1,14 +1,41 @@
-import sys
+import argparse
 
 from hadron_anki.catalog.loader import load_catalog
 from hadron_anki.catalog.bootstrap_particle import enrich_particle_metadata
+from hadron_anki.catalog.index import ParticleFilter, open_catalog_index
+
+
+def inspect_subset(catalog_path, filter_text):
+    """Query a canonical catalog through its SQLite index (built on first use)."""
+    particle_filter = ParticleFilter.parse(filter_text)
+    with open_catalog_index(catalog_path) as index:
+        ids = index.ids(particle_filter)
+        print(f"{len(ids)} of {index.count()} particles in {catalog_path} match {filter_text!r}")
+        for record in index.records(particle_filter):
+            exact = record["exact"]
+            print(f"  - {record['id']}: {exact['hadron_type']}, {exact['family']}, {exact['mass_mev_exact']} MeV")
+
 
 def main():
-    if len(sys.argv) > 1:
-        catalog_path = sys.argv[1]
-    else:
-        catalog_path = "catalogs/core_particles.yaml"
-        
+    parser = argparse.ArgumentParser(description="Inspect a particle catalog.")
+    parser.add_argument("catalog_path", nargs="?", default="catalogs/core_particles.yaml")
+    parser.add_argument(
+        "--filter",
+        help="Query a canonical catalog (default: catalogs/core_particles.canonical.yaml) via its SQLite index, "
+             "e.g. 'hadron_type=baryon,strange=true,max_mass=1500'",
+    )
+    args = parser.parse_args()
+    catalog_path = args.catalog_path
+
+    if args.filter:
+        if args.catalog_path == parser.get_default("catalog_path"):
+            catalog_path = "catalogs/core_particles.canonical.yaml"
+        try:
+            inspect_subset(catalog_path, args.filter)
+        except (OSError, ValueError) as e:
+            print(f"Error querying catalog: {e}")
+        return
+
     try:
         catalog = load_catalog(catalog_path)
     except Exception as e:
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Optional
+from typing import Mapping, Optional
 
 from hadron_anki.domain.spec import ParticleSpec
 from hadron_anki.cards import templates
@@ -11,51 +11,81 @@ class CardSpec:
     back_html: str
     media: Optional[str] = None
 
+def applicable_card_types(
+    spec: ParticleSpec,
+    include_types: Optional[list[str]] = None,
+    decay_svg_filename: Optional[str] = None
+) -> list[str]:
+    """
+    Card types ``generate_cards`` produces for this spec, in output order.
+    Lets callers derive note identities without rendering any HTML.
+    """
+    def should_include(card_type):
+        return include_types is None or card_type in include_types
+
+    types = []
+    if spec.mass is not None and should_include("mass"):
+        types.append("mass")
+    if should_include("composition"):
+        types.append("composition")
+    if should_include("identity"):
+        types.append("identity")
+    if spec.decay_diagram and decay_svg_filename and should_include("decay"):
+        types.append("decay")
+    # Summary is opt-in only: never part of the default card set.
+    if include_types is not None and "summary" in include_types:
+        types.append("summary")
+    return types
+
 def generate_cards(
     spec: ParticleSpec, 
     svg_filename: str, 
     include_types: Optional[list[str]] = None,
-    decay_svg_filename: Optional[str] = None
+    decay_svg_filename: Optional[str] = None,
+    inline_svgs: Optional[Mapping[str, str]] = None,
 ) -> list[CardSpec]:
     """
     Transforms a ParticleSpec into a list of learning cards.
     Valid include_types: 'mass', 'composition', 'identity', 'decay'.
     If None, all applicable cards are generated.
+    ``inline_svgs`` maps media filenames to SVG markup embedded in the card
+    HTML instead of referenced; such cards carry no media file.
     """
+    def media_for(filename):
+        return None if inline_svgs and filename in inline_svgs else filename
+
     cards = []
     display_name = spec.symbol if spec.symbol else spec.name
-    
-    def should_include(card_type):
-        return include_types is None or card_type in include_types
 
-    # 1) MASS CARD
-    if spec.mass is not None and should_include("mass"):
-        mass_front = templates.render_mass_front(display_name, spec)
-        mass_back = templates.render_mass_back(spec, display_name)
-        cards.append(CardSpec("mass", mass_front, mass_back))
+    for card_type in applicable_card_types(spec, include_types, decay_svg_filename):
+        # 1) MASS CARD
+        if card_type == "mass":
+            mass_front = templates.render_mass_front(display_name, spec)
+            mass_back = templates.render_mass_back(spec, display_name)
+            cards.append(CardSpec("mass", mass_front, mass_back))
 
-    # 2) COMPOSITION CARD
-    if should_include("composition"):
-        comp_front = templates.render_composition_front(display_name, spec)
-        comp_back = templates.render_composition_back(spec, svg_filename)
-        cards.append(CardSpec("composition", comp_front, comp_back, media=svg_filename))
+        # 2) COMPOSITION CARD
+        elif card_type == "composition":
+            comp_front = templates.render_composition_front(display_name, spec)
+            comp_back = templates.render_composition_back(spec, svg_filename, inline_svgs)
+            cards.append(CardSpec("composition", comp_front, comp_back, media=media_for(svg_filename)))
 
-    # 3) IDENTITY CARD
-    if should_include("identity"):
-        id_front = templates.render_identity_front(spec)
-        id_back = templates.render_identity_back(spec, display_name)
-        cards.append(CardSpec("identity", id_front, id_back))
+        # 3) IDENTITY CARD
+        elif card_type == "identity":
+            id_front = templates.render_identity_front(spec)
+            id_back = templates.render_identity_back(spec, display_name)
+            cards.append(CardSpec("identity", id_front, id_back))
 
-    # 4) DECAY CARD
-    if spec.decay_diagram and decay_svg_filename and should_include("decay"):
-        decay_front = templates.render_decay_front(display_name, spec)
-        decay_back = templates.render_decay_back(spec, display_name, decay_svg_filename)
-        cards.append(CardSpec("decay", decay_front, decay_back, media=decay_svg_filename))
+        # 4) DECAY CARD
+        elif card_type == "decay":
+            decay_front = templates.render_decay_front(display_name, spec)
+            decay_back = templates.render_decay_back(spec, display_name, decay_svg_filename, inline_svgs)
+            cards.append(CardSpec("decay", decay_front, decay_back, media=media_for(decay_svg_filename)))
 
-    # 5) SUMMARY CARD (opt-in only: never part of the default card set)
-    if include_types is not None and "summary" in include_types:
-        summary_front = templates.render_summary_front(display_name, spec)
-        summary_back = templates.render_summary_back(spec, svg_filename, decay_svg_filename)
-        cards.append(CardSpec("summary", summary_front, summary_back, media=svg_filename))
+        # 5) SUMMARY CARD
+        elif card_type == "summary":
+            summary_front = templates.render_summary_front(display_name, spec)
+            summary_back = templates.render_summary_back(spec, svg_filename, decay_svg_filename, inline_svgs)
+            cards.append(CardSpec("summary", summary_front, summary_back, media=media_for(svg_filename)))
 
     return cards
@@ -7,7 +7,8 @@ composes them today, and each can become its own focused card later without
 changing this module. Fragments rely on the shared CSS in
 ``hadron_anki.cards.styles``.
 """
-from typing import Optional
+import re
+from typing import Mapping, Optional
 
 from hadron_anki.domain.composer import format_quark_display
 from hadron_anki.domain.particle_symbols import display_symbol
@@ -24,6 +25,26 @@ def _section(label: str, body: str, extra_class: str = "") -> str:
     )
 
 
+_SVG_PROLOG = re.compile(r"\A\s*(?:<\?xml[^>]*\?>\s*)?(?:<!DOCTYPE[^>]*>\s*)?")
+
+
+def inline_svg_markup(svg: str, alt: str) -> str:
+    """SVG document as an inline element: prolog dropped, sized like ``.media-wrap img``."""
+    body = _SVG_PROLOG.sub("", svg, count=1).rstrip()
+    return body.replace(
+        "<svg",
+        f'<svg role="img" aria-label="{alt}" style="display: block; max-width: 100%; height: auto;"',
+        1,
+    )
+
+
+def render_image(filename: str, alt: str, inline_svgs: Optional[Mapping[str, str]] = None) -> str:
+    """``<img>`` for a media file, or its markup inline when ``inline_svgs`` holds it."""
+    if inline_svgs and filename in inline_svgs:
+        return inline_svg_markup(inline_svgs[filename], alt)
+    return f'<img src="{filename}" alt="{alt}" />'
+
+
 def format_decay(decay: Optional[dict]) -> str:
     """Format a decay as 'NN% -> a + b'. Empty string if there is nothing to show."""
     if not decay:
@@ -36,6 +57,14 @@ def format_decay(decay: Optional[dict]) -> str:
     return f"→ {products}" if products else ""
 
 
+def format_decay_lines(spec: ParticleSpec) -> list[str]:
+    """One formatted line per listed decay mode, else the main decay alone."""
+    if spec.decay_modes:
+        return [line for line in (format_decay(mode) for mode in spec.decay_modes) if line]
+    line = format_decay(spec.decay)
+    return [line] if line else []
+
+
 def render_octet_section(spec: ParticleSpec) -> str:
     if not spec.multiplet:
         return ""
@@ -50,7 +79,11 @@ def render_mass_section(spec: ParticleSpec) -> str:
     return _section("Mass", f'<div class="mass-summary">{text}</div>', "mass-section")
 
 
-def render_composition_section(spec: ParticleSpec, svg_filename: Optional[str] = None) -> str:
+def render_composition_section(
+    spec: ParticleSpec,
+    svg_filename: Optional[str] = None,
+    inline_svgs: Optional[Mapping[str, str]] = None,
+) -> str:
     summary = spec.display_quark_summary or " ".join(
         format_quark_display(q) for q in spec.quarks
     )
@@ -58,7 +91,7 @@ def render_composition_section(spec: ParticleSpec, svg_filename: Optional[str] =
     if svg_filename:
         image = (
             f'<div class="media-wrap">\n'
-            f'<img src="{svg_filename}" alt="Composition diagram" />\n'
+            f'{render_image(svg_filename, "Composition diagram", inline_svgs)}\n'
             f'</div>\n'
         )
     body = f'{image}<div class="quark-text">{summary}</div>'
@@ -68,15 +101,23 @@ def render_composition_section(spec: ParticleSpec, svg_filename: Optional[str] =
 def render_decay_section(spec: ParticleSpec) -> str:
     if not spec.decay:
         return ""
+    lines = format_decay_lines(spec)
+    if len(lines) > 1:
+        body = "\n  ".join(f'<div class="decay-line">{line}</div>' for line in lines)
+        return _section("Decay modes", body, "decay-section")
     return _section("Main decay", f'<div class="decay-line">{format_decay(spec.decay)}</div>', "decay-section")
 
 
-def render_feynman_section(spec: ParticleSpec, decay_svg_filename: Optional[str] = None) -> str:
+def render_feynman_section(
+    spec: ParticleSpec,
+    decay_svg_filename: Optional[str] = None,
+    inline_svgs: Optional[Mapping[str, str]] = None,
+) -> str:
     if not decay_svg_filename:
         return ""
     body = (
         f'<div class="media-wrap">\n'
-        f'<img src="{decay_svg_filename}" alt="Feynman decay diagram" />\n'
+        f'{render_image(decay_svg_filename, "Feynman decay diagram", inline_svgs)}\n'
         f'</div>'
     )
     return _section("Feynman diagram", body, "feynman-section")
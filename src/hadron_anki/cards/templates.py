@@ -4,7 +4,7 @@ Anki card HTML templates for hadron particles.
 These functions produce HTML fragments that use shared CSS classes
 defined in hadron_anki.cards.styles.
 """
-from typing import Optional
+from typing import Mapping, Optional
 from hadron_anki.domain.spec import ParticleSpec
 from hadron_anki.domain.composer import format_quark_display
 from hadron_anki.cards import sections
@@ -50,13 +50,15 @@ def render_composition_front(display_name: str, spec: ParticleSpec) -> str:
     )
     return render_card_shell(content, "front", "composition")
 
-def render_composition_back(spec: ParticleSpec, svg_filename: str) -> str:
+def render_composition_back(
+    spec: ParticleSpec, svg_filename: str, inline_svgs: Optional[Mapping[str, str]] = None
+) -> str:
     quarks_display = spec.display_quark_summary or " ".join(
         format_quark_display(q) for q in spec.quarks
     )
     octet = render_octet_badge(spec)
     content = (
-        f'<div class="media-wrap">\n<img src="{svg_filename}" alt="Composition diagram" />\n</div>\n'
+        f'<div class="media-wrap">\n{sections.render_image(svg_filename, "Composition diagram", inline_svgs)}\n</div>\n'
         f'<div class="answer quark-text">{quarks_display}</div>\n'
         f'{octet}'
         f'<div class="meta">{spec.id}</div>'
@@ -87,14 +89,20 @@ def render_decay_front(display_name: str, spec: ParticleSpec) -> str:
     )
     return render_card_shell(content, "front", "decay")
 
-def render_decay_back(spec: ParticleSpec, display_name: str, decay_svg_filename: str) -> str:
-    decay_line = sections.format_decay(spec.decay)
-    decay_line_str = f'<div class="answer decay-line">{decay_line}</div>\n' if decay_line else ""
+def render_decay_back(
+    spec: ParticleSpec,
+    display_name: str,
+    decay_svg_filename: str,
+    inline_svgs: Optional[Mapping[str, str]] = None,
+) -> str:
+    decay_line_str = "".join(
+        f'<div class="answer decay-line">{line}</div>\n' for line in sections.format_decay_lines(spec)
+    )
     decay_label_str = f'<div class="meta">{spec.decay_label}</div>' if spec.decay_label else ""
     content = (
         f'{_render_title_row(display_name, spec)}\n'
         f'{decay_line_str}'
-        f'<div class="media-wrap" style="max-height: 250px;">\n<img src="{decay_svg_filename}" alt="Feynman Decay Diagram" />\n</div>\n'
+        f'<div class="media-wrap" style="max-height: 250px;">\n{sections.render_image(decay_svg_filename, "Feynman Decay Diagram", inline_svgs)}\n</div>\n'
         f'{decay_label_str}'
     )
     return render_card_shell(content, "back", "decay")
@@ -112,6 +120,7 @@ def render_summary_back(
     spec: ParticleSpec,
     svg_filename: Optional[str] = None,
     decay_svg_filename: Optional[str] = None,
+    inline_svgs: Optional[Mapping[str, str]] = None,
 ) -> str:
     """The big descriptive card: composes one fragment per concept.
 
@@ -124,9 +133,9 @@ def render_summary_back(
         f'<div class="badge {spec.type}">{spec.type}</div>',
         sections.render_octet_section(spec),
         sections.render_mass_section(spec),
-        sections.render_composition_section(spec, svg_filename),
+        sections.render_composition_section(spec, svg_filename, inline_svgs),
         sections.render_decay_section(spec),
-        sections.render_feynman_section(spec, decay_svg_filename),
+        sections.render_feynman_section(spec, decay_svg_filename, inline_svgs),
     ]
     content = "\n".join(block for block in blocks if block)
     return render_card_shell(content, "back", "summary")
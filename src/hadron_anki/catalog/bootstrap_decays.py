@@ -12,8 +12,15 @@ This module is NOT responsible for diagram generation or routing.
 """
 from __future__ import annotations
 
+import heapq
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Optional
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional
+
+from hadron_anki.catalog.decay_cache import DecayFetchCache
 
 
 # ── Name normalization table ────────────────────────────────────────────────
@@ -104,6 +111,30 @@ class DecayRecord:
     source_kind: str                  # "pdg_python_api" | "fixture" | "manual"
 
 
+def _valid_modes(particle_data: dict) -> list[dict]:
+    """Branching fractions with a real (non-limit) value, in PDG order."""
+    return [
+        bf for bf in particle_data.get("branching_fractions", [])
+        if not bf.get("is_limit", False)
+    ]
+
+
+def _bf_value(bf: dict) -> float:
+    # For modes with no value (e.g. neutron, Sigma0), treat as exclusive (value ≈ 1)
+    return bf["value"] if bf.get("value") is not None else 1.0
+
+
+def _mode_record(repo_id: str, bf: dict, source: str, source_kind: str) -> DecayRecord:
+    return DecayRecord(
+        parent=repo_id,
+        children=[normalize_pdg_name(p) for p in bf.get("decay_products", [])],
+        branching_ratio=_bf_value(bf),
+        description=bf["description"],
+        source=source,
+        source_kind=source_kind,
+    )
+
+
 def parse_dominant_decay(
     repo_id: str,
     particle_data: dict,
@@ -129,38 +160,86 @@ def parse_dominant_decay(
 
     Returns None if the particle is stable or has no decay data.
     """
-    if is_effectively_stable(particle_data):
-        return None
+    top = top_decays(repo_id, particle_data, 1, source=source, source_kind=source_kind)
+    return top[0] if top else None
 
-    bfs = particle_data.get("branching_fractions", [])
-    # Filter: must have a real (non-limit) numeric value
-    valid = [
-        bf for bf in bfs
-        if not bf.get("is_limit", False)
-    ]
-    if not valid:
-        return None
 
-    # For modes with no value (e.g. neutron, Sigma0), treat as exclusive (value ≈ 1)
-    def _bf_value(bf: dict) -> float:
-        return bf["value"] if bf.get("value") is not None else 1.0
+def top_decays(
+    repo_id: str,
+    particle_data: dict,
+    k: int,
+    source: str = "fixture",
+    source_kind: str = "fixture",
+) -> list[DecayRecord]:
+    """
+    The ``k`` highest-branching-ratio modes of particle_data, highest first.
 
-    # Dominant = highest branching ratio
-    dominant = max(valid, key=_bf_value)
-    dominant_value = _bf_value(dominant)
+    Selected with a heap (O(n log k)) without sorting every mode; ties keep
+    PDG listing order. Empty for stable particles or without decay data.
+    """
+    if k <= 0 or is_effectively_stable(particle_data):
+        return []
+    best = heapq.nlargest(k, _valid_modes(particle_data), key=_bf_value)
+    return [_mode_record(repo_id, bf, source, source_kind) for bf in best]
 
-    children_repo = [
-        normalize_pdg_name(p) for p in dominant.get("decay_products", [])
-    ]
 
-    return DecayRecord(
-        parent=repo_id,
-        children=children_repo,
-        branching_ratio=dominant_value,
-        description=dominant["description"],
-        source=source,
-        source_kind=source_kind,
-    )
+@dataclass
+class DecayTable:
+    """Every exclusive decay mode of one particle, highest branching ratio first."""
+    parent: str
+    modes: list[DecayRecord]
+
+    def __len__(self) -> int:
+        return len(self.modes)
+
+    @property
+    def dominant(self) -> Optional[DecayRecord]:
+        return self.modes[0] if self.modes else None
+
+    def top(self, k: int) -> list[DecayRecord]:
+        """The ``k`` most likely modes (the table is kept sorted; see ``top_decays``)."""
+        return self.modes[:max(k, 0)]
+
+    def covering(self, fraction: float) -> list[DecayRecord]:
+        """
+        Fewest leading modes whose branching ratios add up to ``fraction``.
+
+        E.g. ``covering(0.95)`` lists the modes covering 95% of decays; all
+        modes when the table does not reach ``fraction``.
+        """
+        selected: list[DecayRecord] = []
+        total = 0.0
+        for mode in self.modes:
+            if total >= fraction:
+                break
+            selected.append(mode)
+            total += mode.branching_ratio
+        return selected
+
+    def coverage(self, modes: Optional[list[DecayRecord]] = None) -> float:
+        """Summed branching ratio of ``modes`` (default: the whole table)."""
+        return sum(mode.branching_ratio for mode in (self.modes if modes is None else modes))
+
+
+def parse_decay_table(
+    repo_id: str,
+    particle_data: dict,
+    source: str = "fixture",
+    source_kind: str = "fixture",
+) -> Optional[DecayTable]:
+    """
+    Every exclusive (non-limit) mode of particle_data as a ``DecayTable``.
+
+    Returns None if the particle is stable or has no decay data.
+    """
+    if is_effectively_stable(particle_data):
+        return None
+    valid = _valid_modes(particle_data)
+    if not valid:
+        return None
+    # sorted() is stable, so equal ratios keep PDG order (as in top_decays).
+    ordered = sorted(valid, key=_bf_value, reverse=True)
+    return DecayTable(repo_id, [_mode_record(repo_id, bf, source, source_kind) for bf in ordered])
 
 
 # ── PDG Python API fetch layer ──────────────────────────────────────────────
@@ -192,50 +271,200 @@ _REPO_TO_MCID: dict[str, int] = {
 }
 
 
-def fetch_particle_data_pdg(repo_id: str) -> dict:
-    """
-    Fetch particle data from the PDG Python API.
-
-    Raises ImportError if pdg is not installed.
-    Raises ValueError if the particle cannot be found.
-    """
+def _connect_pdg() -> Any:
     try:
         import pdg as pdgapi
     except ImportError as exc:
         raise ImportError(
             "PDG Python API not installed. Run: pip install pdg"
         ) from exc
+    return pdgapi.connect()
 
-    api = pdgapi.connect()
 
-    pdg_names = _REPO_TO_PDG_NAMES.get(repo_id, [])
-    particle = None
-    for name in pdg_names:
-        try:
-            particle = api.get_particle_by_name(name)
-            break
-        except Exception:
-            continue
-
-    # Fallback to mcid lookup for particles with non-unique name
-    if particle is None and repo_id in _REPO_TO_MCID:
-        try:
-            particle = api.get_particle_by_mcid(_REPO_TO_MCID[repo_id])
-        except Exception:
-            pass
-
-    if particle is None:
-        raise ValueError(f"Could not find PDG particle for repo_id={repo_id!r}")
+def _skhep_ctau_table(names: Iterable[str]) -> dict[str, float]:
+    """
+    ctau (mm) for each scikit-hep particle name, from one pass over the table.
 
-    # ctau from the `particle` scikit-hep package for stability check
+    Equivalent to ``Particle.from_name(name).ctau`` per name, without one
+    table scan per lookup. Names that are missing, have no ctau or match
+    entries with different lifetimes map to 0.0 (the old fallback).
+    """
+    wanted = set(names)
+    table = dict.fromkeys(wanted, 0.0)
     try:
         from particle import Particle as SkhepParticle
-        sk = SkhepParticle.from_name(pdg_names[0])
-        ctau_mm = float(sk.ctau) if sk.ctau is not None else 0.0
+        candidates: dict[str, set[float]] = {}
+        for sk in SkhepParticle.all():
+            if sk.name in wanted:
+                candidates.setdefault(sk.name, set()).add(sk.ctau)
     except Exception:
-        ctau_mm = 0.0
+        return table
+    for name, values in candidates.items():
+        # "p" and "n" have two table entries (hadron and nucleus) with one lifetime.
+        if len(values) == 1:
+            (ctau,) = values
+            table[name] = float(ctau) if ctau is not None else 0.0
+    return table
+
+
+# Human-readable name per session ``source_kind``, for DecayRecord.source.
+_SOURCE_LABELS = {
+    "pdg_python_api": "PDG Python API",
+    "pdg_sqlite": "PDG SQLite",
+}
+
+
+def source_label(source_kind: str, edition: Any) -> str:
+    """``DecayRecord.source`` text for data of ``source_kind`` from a PDG edition."""
+    return f"{_SOURCE_LABELS.get(source_kind, source_kind)} {edition}"
+
+
+def _primary_pdg_name(repo_id: str) -> str:
+    names = _REPO_TO_PDG_NAMES.get(repo_id)
+    return names[0] if names else repo_id
+
+
+class PDGSession:
+    """
+    One PDG API connection shared by a batch of particle lookups.
+
+        session = PDGSession()
+        data_by_id = session.fetch_many(["pi_plus", "k_plus", "lambda_0"])
 
-    # Branching fractions
+    The connection is opened once, resolved PDG particles and ctau values are
+    memoized per repo ID, and ``fetch_many`` resolves every ID, builds the
+    ctau table with a single scikit-hep scan and then reads all branching
+    fractions in one pass.
+    """
+
+    source_kind = "pdg_python_api"
+
+    def __init__(self, api: Any = None, ctau_mm: Optional[dict[str, float]] = None):
+        """
+        ``api`` is an existing ``pdg.connect()`` handle; opened lazily if omitted.
+        ``ctau_mm`` is a ctau memo (repo ID -> mm) to share between sessions.
+        """
+        self._api = api
+        self._owns_api = api is None
+        self._particles: dict[str, Any] = {}
+        self._ctau_mm: dict[str, float] = ctau_mm if ctau_mm is not None else {}
+
+    @property
+    def api(self) -> Any:
+        if self._api is None:
+            self._api = _connect_pdg()
+        return self._api
+
+    def close(self) -> None:
+        """Release the connection if this session opened it (a passed-in ``api`` is left open)."""
+        if self._api is None or not self._owns_api:
+            return
+        api, self._api = self._api, None
+        close = getattr(api, "close", None)
+        if close is None:
+            # pdg.connect() handles hold an SQLAlchemy engine rather than a close().
+            close = getattr(getattr(api, "engine", None), "dispose", None)
+        if close is not None:
+            close()
+
+    def __enter__(self) -> "PDGSession":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    @property
+    def edition(self) -> str:
+        """PDG edition of the connected data (e.g. ``"2025"``), ``"unknown"`` if not exposed."""
+        edition = getattr(self.api, "edition", None) or getattr(self.api, "default_edition", None)
+        return str(edition) if edition else "unknown"
+
+    def resolve(self, repo_id: str) -> Any:
+        """
+        PDG API particle for ``repo_id``.
+
+        Raises ValueError if the particle cannot be found.
+        """
+        if repo_id in self._particles:
+            return self._particles[repo_id]
+
+        api = self.api
+        particle = None
+        for name in _REPO_TO_PDG_NAMES.get(repo_id, []):
+            try:
+                particle = api.get_particle_by_name(name)
+                break
+            except Exception:
+                continue
+
+        # Fallback to mcid lookup for particles with non-unique name
+        if particle is None and repo_id in _REPO_TO_MCID:
+            try:
+                particle = api.get_particle_by_mcid(_REPO_TO_MCID[repo_id])
+            except Exception:
+                pass
+
+        if particle is None:
+            raise ValueError(f"Could not find PDG particle for repo_id={repo_id!r}")
+        self._particles[repo_id] = particle
+        return particle
+
+    def resolve_many(self, repo_ids: Iterable[str]) -> dict[str, Any]:
+        """Resolve every ID; failures map to their exception instead of raising."""
+        resolved: dict[str, Any] = {}
+        for repo_id in repo_ids:
+            try:
+                resolved[repo_id] = self.resolve(repo_id)
+            except ValueError as exc:
+                resolved[repo_id] = exc
+        return resolved
+
+    def ctau_mm(self, repo_ids: Iterable[str]) -> dict[str, float]:
+        """ctau (mm) per repo ID, from the scikit-hep ``particle`` package."""
+        repo_ids = list(repo_ids)
+        missing = [repo_id for repo_id in repo_ids if repo_id not in self._ctau_mm]
+        if missing:
+            table = _skhep_ctau_table(_primary_pdg_name(repo_id) for repo_id in missing)
+            for repo_id in missing:
+                self._ctau_mm[repo_id] = table[_primary_pdg_name(repo_id)]
+        return {repo_id: self._ctau_mm[repo_id] for repo_id in repo_ids}
+
+    def fetch_many(self, repo_ids: Iterable[str]) -> dict[str, dict | Exception]:
+        """
+        ``particle_data`` dicts (see ``parse_dominant_decay``) for every ID.
+
+        IDs that cannot be resolved or read map to their exception instead of
+        raising; ImportError (pdg not installed) and connection errors propagate.
+        """
+        repo_ids = list(dict.fromkeys(repo_ids))
+        resolved = self.resolve_many(repo_ids)
+        ctau = self.ctau_mm(repo_id for repo_id in repo_ids if not isinstance(resolved[repo_id], Exception))
+
+        results: dict[str, dict | Exception] = {}
+        for repo_id in repo_ids:
+            particle = resolved[repo_id]
+            if isinstance(particle, Exception):
+                results[repo_id] = particle
+                continue
+            try:
+                results[repo_id] = {
+                    "pdg_name": _primary_pdg_name(repo_id),
+                    "ctau_mm": ctau[repo_id],
+                    "branching_fractions": _exclusive_branching_fractions(particle),
+                }
+            except Exception as exc:
+                results[repo_id] = exc
+        return results
+
+    def fetch(self, repo_id: str) -> dict:
+        """``particle_data`` for one ID; raises ValueError if it cannot be found."""
+        data = self.fetch_many([repo_id])[repo_id]
+        if isinstance(data, Exception):
+            raise data
+        return data
+
+
+def _exclusive_branching_fractions(particle: Any) -> list[dict]:
     bfs_raw = []
     try:
         for bf in particle.exclusive_branching_fractions():
@@ -251,48 +480,191 @@ def fetch_particle_data_pdg(repo_id: str) -> dict:
                 continue
     except Exception:
         pass
+    return bfs_raw
 
-    return {
-        "pdg_name": pdg_names[0] if pdg_names else repo_id,
-        "ctau_mm": ctau_mm,
-        "branching_fractions": bfs_raw,
-    }
 
+def fetch_particle_data_pdg(repo_id: str, session: Optional[PDGSession] = None) -> dict:
+    """
+    Fetch particle data from the PDG Python API.
+
+    Pass a shared ``session`` to reuse its connection; for many particles
+    prefer ``PDGSession.fetch_many``.
+
+    Raises ImportError if pdg is not installed.
+    Raises ValueError if the particle cannot be found.
+    """
+    return (session or PDGSession()).fetch(repo_id)
+
+
+@dataclass
+class FetchFailure:
+    """One particle whose PDG fetch failed."""
+    repo_id: str
+    error_type: str                   # exception class name, e.g. "ValueError"
+    message: str
+
+
+@dataclass
+class BootstrapReport:
+    """
+    Outcome of ``bootstrap_all_decays``: failures and timings, in input ID order.
 
-def bootstrap_all_decays(repo_ids: list[str]) -> dict[str, dict]:
+    ``timings`` holds seconds per particle for concurrent fetches; a bulk
+    (``workers=1``) fetch is only timed as a whole in ``elapsed``.
+    """
+    workers: int = 1
+    elapsed: float = 0.0
+    timings: dict[str, float] = field(default_factory=dict)
+    failures: list[FetchFailure] = field(default_factory=list)
+
+    @property
+    def failed_ids(self) -> list[str]:
+        return [failure.repo_id for failure in self.failures]
+
+    def slowest(self, n: int = 5) -> list[tuple[str, float]]:
+        return sorted(self.timings.items(), key=lambda item: item[1], reverse=True)[:n]
+
+
+def _fetch_concurrently(
+    repo_ids: list[str],
+    workers: int,
+    session_factory: Callable[[], Any],
+    report: BootstrapReport,
+) -> tuple[dict[str, dict | Exception], list[Any]]:
+    """Fetch each ID on a pool thread, through one session per thread."""
+    local = threading.local()
+    sessions: list[Any] = []
+    lock = threading.Lock()
+
+    def _fetch_one(repo_id: str) -> tuple[dict | Exception, float]:
+        start = time.perf_counter()
+        try:
+            if not hasattr(local, "session"):
+                local.session = session_factory()
+                with lock:
+                    sessions.append(local.session)
+            data = local.session.fetch_many([repo_id])[repo_id]
+        except Exception as exc:
+            data = exc
+        return data, time.perf_counter() - start
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        outcomes = list(pool.map(_fetch_one, repo_ids))
+    fetched = {}
+    for repo_id, (data, seconds) in zip(repo_ids, outcomes):
+        fetched[repo_id] = data
+        report.timings[repo_id] = seconds
+    return fetched, sessions
+
+
+def _provenance(session: Any, fetched: dict[str, dict | Exception]) -> tuple[str, str]:
+    """``(source_kind, edition)`` of ``session``; the edition is only read if something was fetched."""
+    source_kind = getattr(session, "source_kind", PDGSession.source_kind)
+    if session is None or all(isinstance(data, Exception) for data in fetched.values()):
+        return source_kind, "unknown"
+    return source_kind, session.edition
+
+
+def bootstrap_all_decays(
+    repo_ids: list[str],
+    session: Optional[PDGSession] = None,
+    cache_dir: Optional[str | Path] = None,
+    workers: int = 1,
+    session_factory: Optional[Callable[[], Any]] = None,
+    report: Optional[BootstrapReport] = None,
+) -> dict[str, dict]:
     """
     Fetch and parse dominant decays for all given repo particle IDs.
 
+    All IDs are fetched in bulk through one ``PDGSession`` (a single PDG
+    connection and ctau scan), created here unless ``session`` is given;
+    pass a ``decay_cache.ReplaySession`` to work from cached data only.
+    With ``cache_dir`` every fetched ``particle_data`` dict is also stored
+    there (see ``decay_cache.DecayFetchCache``) under the session's edition.
+
+    With ``workers > 1`` particles are fetched concurrently on a thread pool,
+    each thread using its own session from ``session_factory`` (default:
+    ``PDGSession`` instances sharing one ctau table, since PDG connections
+    are not shared across threads). Results keep the input order either way.
+    Pass a ``BootstrapReport`` to collect per-particle failures and timings.
+
     Returns a dict keyed by repo_id with the following structure:
       {
         "stable": bool,
         "main_decay": DecayRecord | None,
+        "decay_table": DecayTable | None,   # every mode, for top-k/coverage
         "raw_bf_count": int,
-        "source_kind": str,
+        "source_kind": str,                 # the session's, e.g. "pdg_sqlite"
       }
+
+    Decay records name their source as the session's kind and PDG edition
+    (``source_label``), e.g. ``"PDG Python API 2025"``.
     """
+    if workers > 1 and session is not None:
+        raise ValueError("workers > 1 needs a session_factory: a session is not shared across threads")
+    report = report if report is not None else BootstrapReport()
+    report.workers = max(workers, 1)
+    repo_ids = list(dict.fromkeys(repo_ids))
+
+    start = time.perf_counter()
+    if workers > 1:
+        if session_factory is None:
+            ctau = PDGSession().ctau_mm(repo_ids)   # one scikit-hep scan, no connection
+
+            def session_factory() -> PDGSession:
+                return PDGSession(ctau_mm=dict(ctau))
+        fetched, sessions = _fetch_concurrently(repo_ids, workers, session_factory, report)
+        try:
+            fetched_kind, edition = _provenance(sessions[0] if sessions else None, fetched)
+        finally:
+            # Thread-local sessions are ours: release their connections.
+            for pool_session in sessions:
+                close = getattr(pool_session, "close", None)
+                if close is not None:
+                    close()
+    else:
+        owned = session is None
+        session = session or PDGSession()
+        try:
+            try:
+                fetched = session.fetch_many(repo_ids)
+            except Exception as exc:   # pdg missing or connection failed: every ID fails
+                fetched = {repo_id: exc for repo_id in repo_ids}
+            fetched_kind, edition = _provenance(session, fetched)
+        finally:
+            if owned:
+                session.close()
+    report.elapsed = time.perf_counter() - start
+
+    if cache_dir is not None:
+        cache = None
+        for repo_id, data in fetched.items():
+            if not isinstance(data, Exception):
+                cache = cache or DecayFetchCache(cache_dir, edition)
+                cache.put(repo_id, data, source_kind=fetched_kind)
+
     results = {}
     for repo_id in repo_ids:
-        try:
-            data = fetch_particle_data_pdg(repo_id)
-            source = "PDG Python API 2025"
-            source_kind = "pdg_python_api"
-        except Exception as exc:
-            print(f"  [{repo_id}] fetch failed: {exc}")
+        data = fetched[repo_id]
+        if isinstance(data, Exception):
+            print(f"  [{repo_id}] fetch failed: {data}")
+            report.failures.append(FetchFailure(repo_id, type(data).__name__, str(data)))
             data = {"pdg_name": repo_id, "ctau_mm": 0.0, "branching_fractions": []}
             source = "unknown"
             source_kind = "unknown"
+        else:
+            source = source_label(fetched_kind, edition)
+            source_kind = fetched_kind
 
         stable = is_effectively_stable(data)
-        decay_record = None
+        table = None
         if not stable:
-            decay_record = parse_dominant_decay(
-                repo_id, data, source=source, source_kind=source_kind
-            )
+            table = parse_decay_table(repo_id, data, source=source, source_kind=source_kind)
 
         results[repo_id] = {
             "stable": stable,
-            "main_decay": decay_record,
+            "main_decay": table.dominant if table else None,
+            "decay_table": table,
             "raw_bf_count": len(data.get("branching_fractions", [])),
             "source_kind": source_kind,
         }
@@ -1,4 +1,27 @@
-from typing import Any
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Mapping, Optional
+
+
+def _require_particle():
+    try:
+        from particle import Particle
+    except ImportError:
+        raise ImportError(
+            "The 'particle' package is required for catalog bootstrapping. "
+            "Install it via `pip install particle`."
+        )
+    return Particle
+
+
+def _apply_match(res: dict[str, Any], p: Any) -> None:
+    if p.pdgid:
+        res["pdg_id"] = int(p.pdgid)
+    if p.mass is not None:
+        res["mass"] = float(p.mass)
+    # Maybe aliases from p.name
+    if p.name and "aliases" not in res:
+        res["aliases"] = [p.name]
+
 
 def enrich_particle_metadata(particle: dict[str, Any], pdg_name: str = None) -> dict[str, Any]:
     """
@@ -12,13 +35,7 @@ def enrich_particle_metadata(particle: dict[str, Any], pdg_name: str = None) ->
     Returns:
         A new combined dictionary. If particle is not found, returns the original metadata unchanged.
     """
-    try:
-        from particle import Particle, ParticleNotFound
-    except ImportError:
-        raise ImportError(
-            "The 'particle' package is required for catalog bootstrapping. "
-            "Install it via `pip install particle`."
-        )
+    Particle = _require_particle()
 
     res = dict(particle)
     name_to_search = pdg_name if pdg_name else res.get("name")
@@ -32,16 +49,103 @@ def enrich_particle_metadata(particle: dict[str, Any], pdg_name: str = None) ->
             
         if found:
             # Use the first match
-            p = found[0]
-            if p.pdgid:
-                res["pdg_id"] = int(p.pdgid)
-            if p.mass is not None:
-                res["mass"] = float(p.mass)
-            # Maybe aliases from p.name
-            if p.name and "aliases" not in res:
-                res["aliases"] = [p.name]
-                
+            _apply_match(res, found[0])
+
     except Exception:
         pass  # Fail gracefully on lookup
         
     return res
+
+
+# Particle.from_name resolves these names (hadron vs. nucleus entry) to the hadron.
+_PREFERRED_PDGIDS = frozenset({2212, -2212, 2112, -2112})
+
+
+class ParticleNameIndex:
+    """
+    Name/alias -> scikit-hep particles, built from one pass over the table.
+
+    Keys are each particle's ``name`` (e.g. ``"pi+"``) and, as aliases, its
+    ``programmatic_name`` (e.g. ``"pi_plus"``). Candidates keep table order,
+    so the first exact-name candidate is what ``Particle.findall`` returns first.
+    """
+
+    def __init__(self, particles: Iterable[Any]):
+        self._by_name: dict[str, list[Any]] = {}
+        self._by_alias: dict[str, list[Any]] = {}
+        for p in particles:
+            self._by_name.setdefault(p.name, []).append(p)
+            alias = p.programmatic_name
+            if alias != p.name:
+                self._by_alias.setdefault(alias, []).append(p)
+
+    @classmethod
+    def build(cls) -> "ParticleNameIndex":
+        return cls(_require_particle().all())
+
+    def candidates(self, name: str) -> list[Any]:
+        """Particles named ``name``, else those with ``name`` as an alias."""
+        return self._by_name.get(name) or self._by_alias.get(name) or []
+
+
+@dataclass
+class EnrichmentReport:
+    """Outcome of ``enrich_catalog_metadata``, keyed by particle ``id``."""
+    matched: dict[str, int] = field(default_factory=dict)               # id -> pdg_id
+    missing: list[str] = field(default_factory=list)
+    ambiguous: dict[str, list[tuple[int, str]]] = field(default_factory=dict)   # id -> (pdg_id, name)
+
+
+def _resolve(candidates: list[Any]) -> tuple[Any, bool]:
+    """The chosen candidate (first, or the preferred hadron) and whether the match was ambiguous."""
+    by_pdgid: dict[int, Any] = {}
+    for p in candidates:
+        by_pdgid.setdefault(int(p.pdgid), p)
+    distinct = list(by_pdgid.values())
+    if len(distinct) == 1:
+        return distinct[0], False
+    preferred = [p for p in distinct if int(p.pdgid) in _PREFERRED_PDGIDS]
+    if len(preferred) == 1:
+        return preferred[0], False
+    return distinct[0], True
+
+
+def enrich_catalog_metadata(
+    particles: Iterable[dict[str, Any]],
+    pdg_names: Optional[Mapping[str, str]] = None,
+    index: Optional[ParticleNameIndex] = None,
+) -> tuple[list[dict[str, Any]], EnrichmentReport]:
+    """
+    Enrich a whole catalog in one pass through a prebuilt ``ParticleNameIndex``.
+
+    Same fields as ``enrich_particle_metadata`` (pdg_id, mass, aliases),
+    without scanning the particle table per particle.
+
+    Args:
+        particles: Dicts with at least 'id' and 'name'.
+        pdg_names: Optional id -> name to look up (default: each 'name').
+        index: Reuse an index across calls; built from the table if omitted.
+
+    Returns:
+        New dicts in input order, and a report of matched, missing and
+        ambiguous lookups. Ambiguous names use the first table match, as
+        ``Particle.findall`` does, except that the hadron wins for "p"/"n".
+    """
+    index = index or ParticleNameIndex.build()
+    pdg_names = pdg_names or {}
+    report = EnrichmentReport()
+    enriched = []
+    for particle in particles:
+        res = dict(particle)
+        pid = res.get("id")
+        candidates = index.candidates(pdg_names.get(pid) or res.get("name"))
+        if not candidates:
+            report.missing.append(pid)
+        else:
+            p, ambiguous = _resolve(candidates)
+            if ambiguous:
+                report.ambiguous[pid] = [(int(c.pdgid), c.name) for c in candidates]
+            _apply_match(res, p)
+            report.matched[pid] = int(p.pdgid)
+        enriched.append(res)
+    return enriched, report
@@ -8,7 +8,7 @@ preferring a hand-authored ``decay_diagram`` over the generated fallback.
 """
 from __future__ import annotations
 
-from typing import Any, Optional
+from typing import Any, Iterable, Iterator, Optional
 
 from hadron_anki.domain.legacy_adapter import canonical_to_legacy_particlespec
 from hadron_anki.domain.spec import ParticleSpec
@@ -30,6 +30,16 @@ def build_particle_spec(
             "children": list(main_decay.get("children") or []),
             "description": main_decay.get("description"),
         }
+        modes = entry.get("modes")
+        if modes:
+            spec.decay_modes = [
+                {
+                    "branching_ratio": mode.get("branching_ratio"),
+                    "children": list(mode.get("children") or []),
+                    "description": mode.get("description"),
+                }
+                for mode in modes
+            ]
 
     override = record.get("decay_diagram")
     if override:
@@ -40,10 +50,19 @@ def build_particle_spec(
     return spec
 
 
+def iter_specs(
+    records: Iterable[dict[str, Any]],
+    decays_by_id: Optional[dict[str, Any]] = None,
+) -> Iterator[ParticleSpec]:
+    """Lazily build a ParticleSpec per record (e.g. from ``iter_canonical_records``)."""
+    for record in records:
+        yield build_particle_spec(record, decays_by_id)
+
+
 def build_specs(
     canonical_catalog: dict[str, Any],
     decays_by_id: Optional[dict[str, Any]] = None,
 ) -> list[ParticleSpec]:
     """Build ParticleSpecs for every particle in a canonical catalog."""
     particles = canonical_catalog.get("particles") or []
-    return [build_particle_spec(record, decays_by_id) for record in particles]
+    return list(iter_specs(particles, decays_by_id))
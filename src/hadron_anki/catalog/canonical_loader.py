@@ -1,32 +1,83 @@
 from __future__ import annotations
 
 import json
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator
 
 import yaml
 
-from hadron_anki.domain.canonical_validator import validate_particle_record
+from hadron_anki.catalog.compiled import load_compiled
+from hadron_anki.catalog.yaml_loader import Positions, load_yaml_with_positions, safe_load_yaml
+from hadron_anki.domain.batch_validator import ValidationIssue, validate_catalog
+from hadron_anki.domain.canonical_validator import ValidatedParticleRecord, validated_particle_record
 from hadron_anki.domain.pedagogical_schema import CanonicalParticle
 
 
-def _load_raw(path: str | Path) -> dict[str, Any]:
-    catalog_path = Path(path)
-    suffix = catalog_path.suffix.lower()
-    with catalog_path.open("r", encoding="utf-8") as f:
-        if suffix in {".yaml", ".yml"}:
-            data = yaml.safe_load(f)
-        elif suffix == ".json":
-            data = json.load(f)
-        else:
-            raise ValueError("Unsupported catalog format: must be .json/.yaml/.yml")
+_SHARD_SUFFIXES = (".yaml", ".yml", ".json", ".jsonl")
+
+
+def _check_suffix(path: str | Path) -> str:
+    suffix = Path(path).suffix.lower()
+    if suffix not in _SHARD_SUFFIXES:
+        raise ValueError("Unsupported catalog format: must be .json/.jsonl/.yaml/.yml")
+    return suffix
+
+
+def _iter_jsonl(lines: Iterable[str], source: str) -> Iterator[tuple[int, Any]]:
+    """Yield ``(line number, object)`` for every non-blank JSON Lines row."""
+    for lineno, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            yield lineno, json.loads(line)
+        except json.JSONDecodeError as exc:
+            raise ValueError(f"{source}:{lineno}: invalid JSON: {exc.msg}") from None
+
+
+def _jsonl_header(rows: Iterator[tuple[int, Any]], source: str) -> dict[str, Any]:
+    """Consume and check the header row (``{"schema_version": ...}``) of a .jsonl catalog."""
+    first = next(rows, None)
+    if first is None:
+        raise ValueError("canonical catalog 'particles' must be a non-empty list")
+    lineno, header = first
+    if not isinstance(header, dict) or "schema_version" not in header or "id" in header:
+        raise ValueError(f"{source}:{lineno}: first line must be a header object with schema_version")
+    return header
+
+
+def _parse_jsonl(text: str, source: str = "<jsonl>") -> dict[str, Any]:
+    rows = _iter_jsonl(text.splitlines(), source)
+    data = dict(_jsonl_header(rows, source))
+    data["particles"] = [record for _, record in rows]
+    return data
+
+
+def _parse_raw(text: str, suffix: str) -> dict[str, Any]:
+    if suffix in {".yaml", ".yml"}:
+        data = safe_load_yaml(text)
+    elif suffix == ".jsonl":
+        data = _parse_jsonl(text)
+    else:
+        data = json.loads(text)
 
     if not isinstance(data, dict):
         raise ValueError("canonical catalog root must be an object")
     return data
 
 
+def _load_raw(path: str | Path) -> dict[str, Any]:
+    suffix = _check_suffix(path)
+    with Path(path).open("r", encoding="utf-8") as f:
+        return _parse_raw(f.read(), suffix)
+
+
 def _validate_catalog_shape(data: dict[str, Any]) -> None:
+    """Validate the catalog and mark each record as validated, in place.
+
+    Records are replaced by ``ValidatedParticleRecord`` copies so downstream
+    consumers (legacy adapter, derivations) do not validate them again.
+    """
     if "schema_version" not in data:
         raise ValueError("canonical catalog missing schema_version")
 
@@ -34,14 +85,164 @@ def _validate_catalog_shape(data: dict[str, Any]) -> None:
     if not isinstance(particles, list) or len(particles) == 0:
         raise ValueError("canonical catalog 'particles' must be a non-empty list")
 
-    for record in particles:
-        validate_particle_record(record)
+    data["particles"] = [validated_particle_record(record) for record in particles]
 
 
-def load_canonical_catalog(path: str | Path) -> dict[str, Any]:
-    data = _load_raw(path)
-    _validate_catalog_shape(data)
-    return data
+def _load_catalog_file(path: str | Path, use_cache: bool) -> dict[str, Any]:
+    suffix = _check_suffix(path)
+    if not use_cache:
+        data = _load_raw(path)
+        _validate_catalog_shape(data)
+        return data
+
+    def _compile(source: bytes) -> dict[str, Any]:
+        data = _parse_raw(source.decode("utf-8"), suffix)
+        _validate_catalog_shape(data)
+        return data
+
+    return load_compiled(path, "canonical", _compile)
+
+
+def shard_paths(directory: str | Path) -> list[Path]:
+    """Catalog shards of a sharded catalog directory, sorted by file name."""
+    return sorted(
+        p for p in Path(directory).iterdir()
+        if p.is_file() and p.suffix.lower() in _SHARD_SUFFIXES and not p.name.startswith(".")
+    )
+
+
+def _load_shard(task: tuple[str, bool]) -> dict[str, Any]:
+    path, use_cache = task
+    try:
+        return _load_catalog_file(path, use_cache)
+    except ValueError as exc:
+        raise ValueError(f"{path}: {exc}") from exc
+
+
+def _merge_shards(shards: list[Path], catalogs: list[dict[str, Any]]) -> dict[str, Any]:
+    schema_versions = {catalog["schema_version"] for catalog in catalogs}
+    if len(schema_versions) != 1:
+        found = ", ".join(f"{p.name}={c['schema_version']!r}" for p, c in zip(shards, catalogs))
+        raise ValueError(f"catalog shards disagree on schema_version: {found}")
+
+    by_id: dict[str, Any] = {}
+    origin: dict[str, Path] = {}
+    for shard, catalog in zip(shards, catalogs):
+        for record in catalog["particles"]:
+            particle_id = record["id"]
+            if particle_id in by_id:
+                raise ValueError(
+                    f"duplicate particle id {particle_id!r} in catalog shards "
+                    f"{origin[particle_id].name} and {shard.name}"
+                )
+            by_id[particle_id] = record
+            origin[particle_id] = shard
+
+    return {
+        "schema_version": schema_versions.pop(),
+        "particles": [by_id[particle_id] for particle_id in sorted(by_id)],
+    }
+
+
+def load_canonical_catalog(path: str | Path, use_cache: bool = True, jobs: int = 1) -> dict[str, Any]:
+    """Load and validate a canonical catalog file or sharded catalog directory.
+
+    With ``use_cache`` the parsed, validated catalog is kept in the compiled
+    cache under ``.cache/compiled`` (see ``catalog.compiled``), so unchanged
+    catalogs skip YAML parsing and validation.
+
+    A directory is read as shards (e.g. ``catalogs/canonical/baryon_octet.yaml``),
+    each a canonical catalog of its own. Shards are loaded in ``jobs`` worker
+    processes when ``jobs > 1`` and merged with particles sorted by id, so the
+    result never depends on ``jobs`` or file order. Duplicate ids across shards
+    and mismatched ``schema_version`` values are errors.
+    """
+    if not Path(path).is_dir():
+        return _load_catalog_file(path, use_cache)
+
+    shards = shard_paths(path)
+    if not shards:
+        raise ValueError(f"canonical catalog directory {path} contains no .yaml/.yml/.json/.jsonl shards")
+
+    tasks = [(str(shard), use_cache) for shard in shards]
+    if jobs > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(tasks))) as pool:
+            catalogs = list(pool.map(_load_shard, tasks))
+    else:
+        catalogs = [_load_shard(task) for task in tasks]
+    return _merge_shards(shards, catalogs)
+
+
+def iter_canonical_records(path: str | Path) -> Iterator[ValidatedParticleRecord]:
+    """Yield validated records of a canonical catalog one at a time.
+
+    ``.jsonl`` catalogs (a ``{"schema_version": ...}`` header line, then one
+    particle record per line) are streamed: only the current line is held in
+    memory and errors carry its line number. Other formats are loaded whole
+    through ``load_canonical_catalog`` and then yielded.
+    """
+    if Path(path).is_dir() or _check_suffix(path) != ".jsonl":
+        yield from load_canonical_catalog(path)["particles"]
+        return
+
+    with Path(path).open("r", encoding="utf-8") as f:
+        rows = _iter_jsonl(f, str(path))
+        _jsonl_header(rows, str(path))
+        count = 0
+        for lineno, record in rows:
+            try:
+                yield validated_particle_record(record)
+            except ValueError as exc:
+                raise ValueError(f"{path}:{lineno}: {exc}") from exc
+            count += 1
+    if count == 0:
+        raise ValueError("canonical catalog 'particles' must be a non-empty list")
+
+
+def write_canonical_jsonl(catalog: dict[str, Any], path: str | Path) -> None:
+    """Write ``catalog`` as a .jsonl canonical catalog with records sorted by id."""
+    header = {key: value for key, value in catalog.items() if key != "particles"}
+    if "schema_version" not in header:
+        raise ValueError("canonical catalog missing schema_version")
+    particles = sorted(catalog.get("particles") or [], key=lambda record: record["id"])
+    with Path(path).open("w", encoding="utf-8") as f:
+        f.write(json.dumps(header, ensure_ascii=False, sort_keys=True) + "\n")
+        for record in particles:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+def validate_catalog_file(path: str | Path) -> list[ValidationIssue]:
+    """Every violation in a canonical catalog file, with source line/column.
+
+    YAML positions come from node marks and .jsonl positions are record line
+    numbers; .json catalogs are reported by path only. A syntax error is
+    returned as a single issue at its position instead of being raised.
+    """
+    suffix = _check_suffix(path)
+    text = Path(path).read_text(encoding="utf-8")
+    positions: Positions | None = None
+    try:
+        if suffix in {".yaml", ".yml"}:
+            data, positions = load_yaml_with_positions(text)
+        elif suffix == ".jsonl":
+            rows = list(_iter_jsonl(text.splitlines(), str(path)))
+            header: dict[str, Any] = {}
+            if rows and isinstance(rows[0][1], dict) and "id" not in rows[0][1]:
+                header = rows.pop(0)[1]
+            data = {**header, "particles": [record for _, record in rows]}
+            line_numbers = {idx: (lineno, 1) for idx, (lineno, _) in enumerate(rows)}
+            positions = {id(data["particles"]): ((1, 1), line_numbers)}
+        else:
+            data = json.loads(text)
+    except yaml.MarkedYAMLError as exc:
+        mark = exc.problem_mark or exc.context_mark
+        line, column = (mark.line + 1, mark.column + 1) if mark else (None, None)
+        return [ValidationIssue("<document>", f"invalid YAML: {exc.problem}", line, column)]
+    except json.JSONDecodeError as exc:
+        return [ValidationIssue("<document>", f"invalid JSON: {exc.msg}", exc.lineno, exc.colno)]
+    except ValueError as exc:
+        return [ValidationIssue("<document>", str(exc))]
+    return validate_catalog(data, positions)
 
 
 def load_canonical_particles(path: str | Path) -> list[CanonicalParticle]:
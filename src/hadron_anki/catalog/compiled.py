@@ -0,0 +1,132 @@
+"""
+Compiled-catalog cache: parsed (and validated) catalogs pickled under ``.cache/``.
+
+``load_canonical_catalog`` and ``load_catalog`` spend most of a cold start in
+pure-Python YAML parsing and validation. ``load_compiled`` stores their result
+in ``CACHE_DIR`` (one file per source path; relative to the working directory
+unless overridden, ``None`` disables caching) and serves it from there while
+the source is unchanged:
+
+    catalogs/core_particles.canonical.yaml
+    .cache/compiled/core_particles.canonical.yaml.<path hash>.compiled
+
+The cache is keyed by the SHA-256 of the source bytes plus a schema key: the
+cache format version, the catalog kind and a fingerprint of the parser,
+loader, validator and derivation sources (so a change to any of them
+recompiles). The source's own ``schema_version`` is covered by the source
+hash and recorded in the header.
+
+A stale, corrupt or unreadable cache is ignored and rewritten; an unwritable
+directory just means no cache. The cache is a local build artifact (pickle),
+never something to commit or share.
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+from pathlib import Path
+from typing import Any, Callable
+
+
+COMPILED_SUFFIX = ".compiled"
+COMPILED_FORMAT_VERSION = 1
+CACHE_DIR: str | Path | None = ".cache/compiled"
+
+_PACKAGE_DIR = Path(__file__).resolve().parent.parent
+_SCHEMA_SOURCES = (
+    _PACKAGE_DIR / "catalog" / "yaml_loader.py",
+    _PACKAGE_DIR / "catalog" / "canonical_loader.py",
+    _PACKAGE_DIR / "catalog" / "loader.py",
+    _PACKAGE_DIR / "domain" / "canonical_validator.py",
+    _PACKAGE_DIR / "domain" / "pedagogical_derivations.py",
+    _PACKAGE_DIR / "domain" / "pedagogical_schema.py",
+)
+_schema_digest: str | None = None
+
+
+def compiled_path(path: str | Path) -> Path:
+    """Cache file for the catalog at ``path`` (keyed by its resolved path)."""
+    if CACHE_DIR is None:
+        raise ValueError("compiled-catalog caching is disabled (CACHE_DIR is None)")
+    source = Path(path)
+    path_key = hashlib.sha256(str(source.resolve()).encode("utf-8")).hexdigest()[:16]
+    return Path(CACHE_DIR) / f"{source.name}.{path_key}{COMPILED_SUFFIX}"
+
+
+def schema_fingerprint() -> str:
+    """Hash of the parser, loader, validator and derivation sources that shape compiled catalogs."""
+    global _schema_digest
+    if _schema_digest is None:
+        h = hashlib.sha256(f"format={COMPILED_FORMAT_VERSION}".encode("ascii"))
+        for source in _SCHEMA_SOURCES:
+            h.update(source.read_bytes())
+        _schema_digest = h.hexdigest()
+    return _schema_digest
+
+
+def _read_compiled(cache_path: Path, kind: str, source_sha256: str) -> tuple[bool, Any]:
+    try:
+        with cache_path.open("rb") as f:
+            payload = pickle.load(f)
+    except FileNotFoundError:
+        return False, None
+    except (OSError, EOFError, ValueError, TypeError, AttributeError, ImportError, pickle.UnpicklingError):
+        return False, None
+    if (
+        not isinstance(payload, dict)
+        or payload.get("kind") != kind
+        or payload.get("schema") != schema_fingerprint()
+        or payload.get("source_sha256") != source_sha256
+    ):
+        return False, None
+    return True, payload.get("data")
+
+
+def _write_compiled(cache_path: Path, kind: str, source_sha256: str, data: Any) -> None:
+    schema_version = data.get("schema_version") if isinstance(data, dict) else None
+    payload = {
+        "kind": kind,
+        "schema": schema_fingerprint(),
+        "source_sha256": source_sha256,
+        "schema_version": schema_version,
+        "data": data,
+    }
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with tmp_path.open("wb") as f:
+            pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+
+
+def load_compiled(path: str | Path, kind: str, compile_source: Callable[[bytes], Any]) -> Any:
+    """
+    Return the compiled form of the catalog at ``path``.
+
+    Args:
+        path: Source catalog file.
+        kind: Name of the compiled structure (e.g. ``"canonical"``); caches of
+            another kind are never returned.
+        compile_source: Parses (and validates) the raw source bytes. Called
+            only when the cache is missing or stale; its errors propagate and
+            nothing is cached.
+    """
+    source_path = Path(path)
+    source = source_path.read_bytes()
+    if CACHE_DIR is None:
+        return compile_source(source)
+    source_sha256 = hashlib.sha256(source).hexdigest()
+    cache_path = compiled_path(source_path)
+
+    hit, data = _read_compiled(cache_path, kind, source_sha256)
+    if hit:
+        return data
+    data = compile_source(source)
+    _write_compiled(cache_path, kind, source_sha256, data)
+    return data
@@ -0,0 +1,155 @@
+"""
+Offline cache of raw PDG ``particle_data`` dicts, and a session that replays it.
+
+``bootstrap_all_decays(..., cache_dir=...)`` stores every dict it fetches as
+one JSON file per particle, keyed by cache format version and PDG edition
+(the default directory is relative to the working directory):
+
+    .cache/pdg_decays/v1/2025/pi_plus.json
+
+``ReplaySession`` serves ``fetch_many`` from those files only, so
+``core_decays.yaml`` can be regenerated without the ``pdg`` or ``particle``
+packages (``generate_core_decays --replay``). Point ``cache_dir`` at a
+committed directory to use it as a CI fixture.
+"""
+from __future__ import annotations
+
+import json
+import os
+import re
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+
+DECAY_CACHE_VERSION = 1
+DEFAULT_CACHE_DIR = ".cache/pdg_decays"
+DEFAULT_SOURCE_KIND = "pdg_python_api"
+
+_SAFE_KEY = re.compile(r"[^A-Za-z0-9_.-]")
+_NUMERIC_EDITION = re.compile(r"\d+(?:\.\d+)*")
+
+
+def _key(value: Any) -> str:
+    return _SAFE_KEY.sub("_", str(value))
+
+
+def _edition_order(edition: str) -> tuple:
+    # Numbered editions ("2024", "2025.1") compare by value and always sort
+    # after unnumbered ones such as "unknown", so those never count as latest.
+    if _NUMERIC_EDITION.fullmatch(edition):
+        return (1, tuple(int(part) for part in edition.split(".")), edition)
+    return (0, (), edition)
+
+
+class DecayFetchCache:
+    """Raw ``particle_data`` dicts of one PDG edition, one JSON file per repo ID."""
+
+    def __init__(self, cache_dir: str | Path, edition: Any):
+        self.edition = str(edition)
+        self.root = Path(cache_dir) / f"v{DECAY_CACHE_VERSION}" / _key(self.edition)
+
+    @classmethod
+    def editions(cls, cache_dir: str | Path) -> list[str]:
+        """Cached PDG editions, oldest first; unnumbered editions sort before numbered ones."""
+        root = Path(cache_dir) / f"v{DECAY_CACHE_VERSION}"
+        if not root.is_dir():
+            return []
+        return sorted((p.name for p in root.iterdir() if p.is_dir()), key=_edition_order)
+
+    @classmethod
+    def latest(cls, cache_dir: str | Path) -> "DecayFetchCache":
+        """Newest numbered edition; an unnumbered one only if nothing else is cached."""
+        editions = cls.editions(cache_dir)
+        if not editions:
+            raise ValueError(f"no cached PDG decay data under {cache_dir}")
+        return cls(cache_dir, editions[-1])
+
+    def path(self, repo_id: str) -> Path:
+        return self.root / f"{_key(repo_id)}.json"
+
+    def ids(self) -> list[str]:
+        if not self.root.is_dir():
+            return []
+        return sorted(p.stem for p in self.root.glob("*.json"))
+
+    def _entry(self, repo_id: str) -> Optional[dict]:
+        try:
+            with self.path(repo_id).open("r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if (
+            not isinstance(entry, dict)
+            or entry.get("format_version") != DECAY_CACHE_VERSION
+            or entry.get("edition") != self.edition
+            or entry.get("repo_id") != repo_id
+        ):
+            return None
+        return entry
+
+    def get(self, repo_id: str) -> Optional[dict]:
+        """Cached ``particle_data`` for ``repo_id``; None if missing or unreadable."""
+        entry = self._entry(repo_id)
+        return entry.get("particle_data") if entry else None
+
+    def source_kind(self, repo_id: str) -> str:
+        """Session ``source_kind`` the entry was fetched with (API for entries that predate it)."""
+        entry = self._entry(repo_id)
+        return (entry or {}).get("source_kind") or DEFAULT_SOURCE_KIND
+
+    def put(self, repo_id: str, particle_data: dict, source_kind: str = DEFAULT_SOURCE_KIND) -> None:
+        """Store ``particle_data`` atomically (ctau infinity is kept as JSON ``Infinity``)."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        entry = {
+            "format_version": DECAY_CACHE_VERSION,
+            "edition": self.edition,
+            "repo_id": repo_id,
+            "source_kind": source_kind,
+            "particle_data": particle_data,
+        }
+        target = self.path(repo_id)
+        tmp_path = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+        with tmp_path.open("w", encoding="utf-8") as f:
+            json.dump(entry, f, ensure_ascii=False, indent=1, sort_keys=True)
+            f.write("\n")
+        os.replace(tmp_path, target)
+
+
+class ReplaySession:
+    """
+    Session (see ``PDGSession``) answering ``fetch_many`` from a ``DecayFetchCache``.
+
+    ``edition`` and ``source_kind`` are those the data was fetched with, so a
+    replayed ``core_decays.yaml`` names the same source as the live run.
+    """
+
+    def __init__(self, cache: DecayFetchCache):
+        self.cache = cache
+        self._kinds: dict[str, str] = {}
+
+    @property
+    def edition(self) -> str:
+        return self.cache.edition
+
+    @property
+    def source_kind(self) -> str:
+        """Source kind of the entries served so far (the default if none or mixed)."""
+        kinds = set(self._kinds.values())
+        return kinds.pop() if len(kinds) == 1 else DEFAULT_SOURCE_KIND
+
+    def fetch_many(self, repo_ids: Iterable[str]) -> dict[str, dict | Exception]:
+        results: dict[str, dict | Exception] = {}
+        for repo_id in dict.fromkeys(repo_ids):
+            data = self.cache.get(repo_id)
+            if data is not None:
+                self._kinds[repo_id] = self.cache.source_kind(repo_id)
+            results[repo_id] = data if data is not None else ValueError(
+                f"{repo_id!r} is not in the decay cache {self.cache.root}"
+            )
+        return results
+
+    def fetch(self, repo_id: str) -> dict:
+        data = self.fetch_many([repo_id])[repo_id]
+        if isinstance(data, Exception):
+            raise data
+        return data
@@ -6,9 +6,24 @@ Run with:
 
 Or directly:
     python src/hadron_anki/catalog/generate_core_decays.py
+
+``--engine sql`` reads the PDG SQLite file directly (see ``catalog.pdg_sql``)
+instead of going through the pdg object API.
+
+Every fetched particle is stored in the decay cache (``--cache``, see
+``catalog.decay_cache``); ``--replay`` regenerates the YAML from that cache
+alone, without the pdg or particle packages.
+
+``--incremental`` fetches only IDs missing from the output plus any
+``--stale`` ones and merges them in, keeping other entries verbatim. The file
+is only rewritten (atomically) when its content changes, and every run prints
+the per-particle branching-ratio changes.
 """
 from __future__ import annotations
 
+import argparse
+import os
+import re
 import sys
 from pathlib import Path
 
@@ -17,7 +32,9 @@ SRC = Path(__file__).parent.parent.parent.parent
 if str(SRC) not in sys.path:
     sys.path.insert(0, str(SRC / "src"))
 
-from hadron_anki.catalog.bootstrap_decays import bootstrap_all_decays
+from hadron_anki.catalog.bootstrap_decays import BootstrapReport, bootstrap_all_decays
+from hadron_anki.catalog.decay_cache import DEFAULT_CACHE_DIR, DecayFetchCache, ReplaySession
+from hadron_anki.catalog.yaml_loader import safe_load_yaml
 
 CORE_PARTICLE_IDS = [
     "proton", "neutron",
@@ -32,38 +49,172 @@ CORE_PARTICLE_IDS = [
 OUTPUT_PATH = Path(__file__).parent.parent.parent.parent / "catalogs" / "core_decays.yaml"
 
 
-def _render_yaml(results: dict) -> str:
-    lines = [
+DEFAULT_COVERAGE = 0.95
+DEFAULT_MAX_MODES = 5
+
+
+def _listed_modes(entry: dict, coverage: float, max_modes: int) -> list:
+    """Modes to list under ``modes:``: those covering ``coverage``, at most ``max_modes``."""
+    table = entry.get("decay_table")
+    if table is None:
+        return []
+    modes = table.covering(coverage)[:max_modes]
+    return modes if len(modes) > 1 else []
+
+
+_ENTRY_KEY = re.compile(r"^([A-Za-z0-9_]+):$")
+_SOURCE_LINE = re.compile(r'^    source: "(.*)"$')
+
+
+def _header_lines(blocks: dict[str, list[str]]) -> list[str]:
+    """File header naming the sources of the entries below it (e.g. ``PDG Python API 2025``)."""
+    sources = sorted({
+        match.group(1) for lines in blocks.values() for line in lines if (match := _SOURCE_LINE.match(line))
+    })
+    return [
         "# core_decays.yaml",
         "# Auto-generated by src/hadron_anki/catalog/generate_core_decays.py",
-        "# Source: PDG Python API 2025  (https://pdg.lbl.gov/api)",
+        f"# Source: {', '.join(sources) or 'unknown'}  (https://pdg.lbl.gov/api)",
         "# DO NOT EDIT BY HAND — re-run the generator to update.",
         "",
     ]
-    for repo_id in sorted(results.keys()):
-        entry = results[repo_id]
-        lines.append(f"{repo_id}:")
-        if entry["stable"]:
-            lines.append("  stable: true")
+
+
+def _render_entry(
+    repo_id: str,
+    entry: dict,
+    coverage: float = DEFAULT_COVERAGE,
+    max_modes: int = DEFAULT_MAX_MODES,
+) -> list[str]:
+    lines = [f"{repo_id}:"]
+    if entry["stable"]:
+        lines.append("  stable: true")
+    else:
+        lines.append("  stable: false")
+        dr = entry.get("main_decay")
+        if dr:
+            children_str = ", ".join(f'"{c}"' for c in dr.children)
+            lines.append("  main_decay:")
+            lines.append(f'    parent: "{dr.parent}"')
+            lines.append(f"    children: [{children_str}]")
+            lines.append(f"    branching_ratio: {dr.branching_ratio:.6g}")
+            lines.append(f'    description: "{dr.description}"')
+            lines.append(f'    source: "{dr.source}"')
+            lines.append(f'    source_kind: "{dr.source_kind}"')
+            modes = _listed_modes(entry, coverage, max_modes)
+            if modes:
+                lines.append("  modes:")
+                for mode in modes:
+                    mode_children = ", ".join(f'"{c}"' for c in mode.children)
+                    lines.append(f"    - children: [{mode_children}]")
+                    lines.append(f"      branching_ratio: {mode.branching_ratio:.6g}")
+                    lines.append(f'      description: "{mode.description}"')
         else:
-            lines.append("  stable: false")
-            dr = entry.get("main_decay")
-            if dr:
-                children_str = ", ".join(f'"{c}"' for c in dr.children)
-                lines.append("  main_decay:")
-                lines.append(f'    parent: "{dr.parent}"')
-                lines.append(f"    children: [{children_str}]")
-                lines.append(f"    branching_ratio: {dr.branching_ratio:.6g}")
-                lines.append(f'    description: "{dr.description}"')
-                lines.append(f'    source: "{dr.source}"')
-                lines.append(f'    source_kind: "{dr.source_kind}"')
-            else:
-                lines.append("  main_decay: null")
-                lines.append(f"  note: \"No exclusive BF data available (raw_bf={entry['raw_bf_count']})\"")
+            lines.append("  main_decay: null")
+            lines.append(f"  note: \"No exclusive BF data available (raw_bf={entry['raw_bf_count']})\"")
+    return lines
+
+
+def _join_blocks(blocks: dict[str, list[str]]) -> str:
+    lines = _header_lines(blocks)
+    for repo_id in sorted(blocks):
+        lines.extend(blocks[repo_id])
         lines.append("")
     return "\n".join(lines)
 
 
+def _render_yaml(
+    results: dict,
+    coverage: float = DEFAULT_COVERAGE,
+    max_modes: int = DEFAULT_MAX_MODES,
+) -> str:
+    return _join_blocks({
+        repo_id: _render_entry(repo_id, entry, coverage, max_modes) for repo_id, entry in results.items()
+    })
+
+
+def _split_blocks(text: str) -> dict[str, list[str]]:
+    """Rendered entry lines per particle ID of a generated core_decays.yaml."""
+    blocks: dict[str, list[str]] = {}
+    current: list[str] | None = None
+    for line in text.splitlines():
+        match = _ENTRY_KEY.match(line)
+        if match:
+            current = blocks.setdefault(match.group(1), [])
+        if current is not None:
+            current.append(line)
+    for lines in blocks.values():
+        while lines and not lines[-1].strip():
+            lines.pop()
+    return blocks
+
+
+def merge_yaml(
+    existing: str,
+    results: dict,
+    coverage: float = DEFAULT_COVERAGE,
+    max_modes: int = DEFAULT_MAX_MODES,
+) -> str:
+    """``existing`` core_decays.yaml text with the entries of ``results`` replaced or added.
+
+    Untouched entries are kept verbatim, so merging every entry of a full
+    run reproduces ``_render_yaml`` exactly.
+    """
+    blocks = _split_blocks(existing)
+    for repo_id, entry in results.items():
+        blocks[repo_id] = _render_entry(repo_id, entry, coverage, max_modes)
+    return _join_blocks(blocks)
+
+
+def _mode_ratios(entry: dict | None) -> dict[str, float]:
+    """Branching ratio per mode description of a parsed core_decays.yaml entry."""
+    if not entry or entry.get("stable") or not entry.get("main_decay"):
+        return {}
+    modes = entry.get("modes") or [entry["main_decay"]]
+    return {mode["description"]: mode.get("branching_ratio") for mode in modes}
+
+
+def diff_decays(old: dict, new: dict, repo_ids: list[str]) -> list[str]:
+    """Readable per-particle changes between two parsed core_decays.yaml mappings."""
+    lines = []
+    for repo_id in repo_ids:
+        before, after = old.get(repo_id), new.get(repo_id)
+        if before == after:
+            continue
+        if before is None:
+            lines.append(f"  + {repo_id}: new")
+        elif after is None:
+            lines.append(f"  - {repo_id}: removed")
+        elif bool(before.get("stable")) != bool(after.get("stable")):
+            lines.append(f"  ~ {repo_id}: stable {bool(before.get('stable'))} -> {bool(after.get('stable'))}")
+        old_modes, new_modes = _mode_ratios(before), _mode_ratios(after)
+        for description in list(old_modes) + [d for d in new_modes if d not in old_modes]:
+            if description not in new_modes:
+                lines.append(f"  - {repo_id}: {description}  BR {old_modes[description]:.6g}")
+            elif description not in old_modes:
+                lines.append(f"  + {repo_id}: {description}  BR {new_modes[description]:.6g}")
+            elif old_modes[description] != new_modes[description]:
+                lines.append(
+                    f"  ~ {repo_id}: {description}  BR {old_modes[description]:.6g} -> {new_modes[description]:.6g}"
+                )
+    return lines
+
+
+def write_if_changed(path: Path, text: str) -> bool:
+    """Atomically replace ``path`` with ``text`` unless it already holds exactly that."""
+    if path.exists() and path.read_text(encoding="utf-8") == text:
+        return False
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_text(text, encoding="utf-8")
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return True
+
+
 def _print_report(results: dict) -> None:
     stable = [k for k, v in results.items() if v["stable"]]
     unstable = [k for k, v in results.items() if not v["stable"]]
@@ -92,17 +243,136 @@ def _print_report(results: dict) -> None:
     print("=" * 60)
 
 
-def main() -> None:
-    print(f"Bootstrapping decay data for {len(CORE_PARTICLE_IDS)} particles...")
-    results = bootstrap_all_decays(CORE_PARTICLE_IDS)
+def _print_fetch_report(report: BootstrapReport) -> None:
+    print(f"\nFetched in {report.elapsed:.2f} s (workers={report.workers})")
+    for pid, seconds in report.slowest():
+        print(f"  {pid:20s}  {seconds * 1000:8.1f} ms")
+    for failure in report.failures:
+        print(f"  FAILED {failure.repo_id}: {failure.error_type}: {failure.message}")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Generate catalogs/core_decays.yaml from PDG data.")
+    parser.add_argument(
+        "--engine",
+        choices=("api", "sql"),
+        default="api",
+        help="pdg object API (default) or set-based SQL against the PDG SQLite file",
+    )
+    parser.add_argument("--pdg-db", help="PDG SQLite file for --engine sql (default: the pdg package's)")
+    parser.add_argument(
+        "--cache",
+        default=DEFAULT_CACHE_DIR,
+        help=f"decay cache directory (default: {DEFAULT_CACHE_DIR})",
+    )
+    parser.add_argument("--no-cache", action="store_true", help="do not store fetched data in the cache")
+    parser.add_argument("--replay", action="store_true", help="regenerate from the decay cache only, no fetching")
+    parser.add_argument("--edition", help="PDG edition to replay (default: the latest cached)")
+    parser.add_argument(
+        "--workers", type=int, default=1, help="fetch particles concurrently on N threads (default: 1, bulk)"
+    )
+    parser.add_argument(
+        "--coverage",
+        type=float,
+        default=DEFAULT_COVERAGE,
+        help=f"list the modes covering this branching fraction (default: {DEFAULT_COVERAGE})",
+    )
+    parser.add_argument(
+        "--max-modes",
+        type=int,
+        default=DEFAULT_MAX_MODES,
+        help=f"list at most this many modes per particle (default: {DEFAULT_MAX_MODES})",
+    )
+    parser.add_argument("--output", default=str(OUTPUT_PATH), help=f"output YAML (default: {OUTPUT_PATH})")
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="fetch only IDs missing from the output (plus --stale) and merge them into it",
+    )
+    parser.add_argument(
+        "--stale",
+        action="append",
+        default=[],
+        metavar="ID[,ID...]",
+        help="refetch these IDs in --incremental mode (implies --incremental)",
+    )
+    args = parser.parse_args(argv)
+
+    output = Path(args.output)
+    existing = output.read_text(encoding="utf-8") if output.exists() else ""
+    stale = list(dict.fromkeys(pid.strip() for value in args.stale for pid in value.split(",") if pid.strip()))
+    incremental = args.incremental or bool(stale)
+    present = set(_split_blocks(existing))
+    if incremental:
+        repo_ids = [pid for pid in CORE_PARTICLE_IDS if pid not in present]
+        repo_ids += [pid for pid in stale if pid not in repo_ids]
+        if not repo_ids:
+            print(f"{output} is up to date; nothing to fetch.")
+            return 0
+    else:
+        repo_ids = list(CORE_PARTICLE_IDS)
+
+    cache_dir = None if args.no_cache else args.cache
+    if args.replay:
+        try:
+            cache = DecayFetchCache(args.cache, args.edition) if args.edition else DecayFetchCache.latest(args.cache)
+        except ValueError as exc:
+            print(f"error: {exc}", file=sys.stderr)
+            return 1
+        missing = [repo_id for repo_id in repo_ids if cache.get(repo_id) is None]
+        if missing:
+            print(f"error: decay cache {cache.root} lacks: {', '.join(missing)}", file=sys.stderr)
+            return 1
+        session = ReplaySession(cache)
+        session_factory = None
+        cache_dir = None
+        print(f"Replaying PDG {cache.edition} decay data for {len(repo_ids)} particles...")
+    else:
+        session = session_factory = None
+        if args.engine == "sql":
+            from hadron_anki.catalog.pdg_sql import PDGSQLSession
+            if args.workers > 1:
+                def session_factory() -> PDGSQLSession:
+                    return PDGSQLSession(args.pdg_db)
+            else:
+                session = PDGSQLSession(args.pdg_db)
+        print(f"Bootstrapping decay data for {len(repo_ids)} particles...")
+
+    report = BootstrapReport()
+    results = bootstrap_all_decays(
+        repo_ids,
+        session=session,
+        cache_dir=cache_dir,
+        workers=1 if args.replay else args.workers,
+        session_factory=session_factory,
+        report=report,
+    )
 
     _print_report(results)
+    _print_fetch_report(report)
+
+    if incremental:
+        # A failed refetch keeps the entry already on disk.
+        kept = [pid for pid in report.failed_ids if pid in present]
+        for pid in kept:
+            del results[pid]
+        yaml_str = merge_yaml(existing, results, coverage=args.coverage, max_modes=args.max_modes)
+    else:
+        yaml_str = _render_yaml(results, coverage=args.coverage, max_modes=args.max_modes)
+
+    old = safe_load_yaml(existing) if existing else {}
+    new = safe_load_yaml(yaml_str) or {}
+    changes = diff_decays(old or {}, new, sorted(set(old or {}) | set(new)))
+    print("\nChanges:" if changes else "\nNo decay changes.")
+    for line in changes:
+        print(line)
 
-    yaml_str = _render_yaml(results)
-    OUTPUT_PATH.parent.mkdir(parents=True, exist_ok=True)
-    OUTPUT_PATH.write_text(yaml_str, encoding="utf-8")
-    print(f"\nWritten to: {OUTPUT_PATH}")
+    if write_if_changed(output, yaml_str):
+        print(f"\nWritten to: {output}")
+    else:
+        print(f"\nUnchanged: {output}")
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
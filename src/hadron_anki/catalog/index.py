@@ -0,0 +1,312 @@
+"""
+Optional SQLite index of a canonical catalog for subset queries.
+
+The index holds one row per particle with the columns that deck filters need
+(id, family, multiplet, hadron_type, mass and the additive quantum numbers)
+plus the validated record as a JSON blob:
+
+    index = open_catalog_index("catalogs/core_particles.canonical.yaml")
+    wanted = ParticleFilter.parse("hadron_type=baryon,strange=true,max_mass=1500")
+    for record in index.records(wanted):   # parsed one row at a time
+        ...
+
+It lives next to the source as ``<source>.index.sqlite`` and is rebuilt when
+the source bytes (SHA-256) or the loader/validator code (the fingerprint of
+``catalog.compiled``) change, so queries never parse or validate the YAML;
+records are only materialized when iterated. Records were validated
+when the index was built and come back as ``ValidatedParticleRecord``.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+from dataclasses import dataclass, fields
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+from hadron_anki.catalog.canonical_loader import (
+    iter_canonical_records,
+    load_canonical_catalog,
+    shard_paths,
+)
+from hadron_anki.catalog.compiled import schema_fingerprint
+from hadron_anki.domain.canonical_validator import ValidatedParticleRecord
+
+
+INDEX_SUFFIX = ".index.sqlite"
+INDEX_VERSION = 1
+
+_QNUM_COLUMNS = ("charge", "strangeness", "charm", "bottomness")
+
+_SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE particles (
+    id TEXT PRIMARY KEY,
+    family TEXT NOT NULL,
+    multiplet TEXT NOT NULL,
+    hadron_type TEXT NOT NULL,
+    mass_mev REAL NOT NULL,
+    charge INTEGER,
+    strangeness INTEGER,
+    charm INTEGER,
+    bottomness INTEGER,
+    record TEXT NOT NULL
+);
+CREATE INDEX particles_family ON particles (family);
+CREATE INDEX particles_type_mass ON particles (hadron_type, mass_mev);
+"""
+
+
+def _parse_bool(raw: str) -> bool:
+    value = raw.lower()
+    if value not in {"1", "0", "true", "false", "yes", "no"}:
+        raise ValueError(raw)
+    return value in {"1", "true", "yes"}
+
+
+# ParticleFilter field -> parser of its ``key=value`` text form.
+_FILTER_PARSERS: dict[str, Callable[[str], Any]] = {
+    "hadron_type": str,
+    "family": str,
+    "multiplet": str,
+    "min_mass": float,
+    "max_mass": float,
+    "charge": int,
+    "strangeness": int,
+    "charm": int,
+    "bottomness": int,
+    "strange": _parse_bool,
+}
+
+
+@dataclass(frozen=True)
+class ParticleFilter:
+    """Conjunction of particle constraints; ``None`` fields are unconstrained."""
+    hadron_type: Optional[str] = None
+    family: Optional[str] = None
+    multiplet: Optional[str] = None
+    min_mass: Optional[float] = None
+    max_mass: Optional[float] = None
+    charge: Optional[int] = None
+    strangeness: Optional[int] = None
+    charm: Optional[int] = None
+    bottomness: Optional[int] = None
+    # True: strangeness != 0, False: strangeness == 0; records without an
+    # integer strangeness match neither.
+    strange: Optional[bool] = None
+
+    @classmethod
+    def parse(cls, text: str) -> "ParticleFilter":
+        """Parse ``"key=value,key=value"``, e.g. ``"hadron_type=baryon,max_mass=1500"``."""
+        values: dict[str, Any] = {}
+        for part in filter(None, (chunk.strip() for chunk in text.split(","))):
+            key, sep, raw = part.partition("=")
+            key, raw = key.strip(), raw.strip()
+            if not sep or key not in _FILTER_PARSERS:
+                raise ValueError(f"invalid particle filter term {part!r}; keys: {', '.join(_FILTER_PARSERS)}")
+            try:
+                values[key] = _FILTER_PARSERS[key](raw)
+            except ValueError:
+                raise ValueError(f"invalid value for particle filter {key!r}: {raw!r}") from None
+        return cls(**values)
+
+    def is_empty(self) -> bool:
+        return all(getattr(self, f.name) is None for f in fields(self))
+
+    def to_sql(self) -> tuple[str, list[Any]]:
+        """WHERE clause (without the keyword, ``1`` if empty) and its parameters."""
+        clauses: list[str] = []
+        params: list[Any] = []
+        for column in ("hadron_type", "family", "multiplet", *_QNUM_COLUMNS):
+            value = getattr(self, column)
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if self.min_mass is not None:
+            clauses.append("mass_mev >= ?")
+            params.append(self.min_mass)
+        if self.max_mass is not None:
+            clauses.append("mass_mev < ?")
+            params.append(self.max_mass)
+        if self.strange is not None:
+            clauses.append("strangeness != 0" if self.strange else "strangeness = 0")
+        return (" AND ".join(clauses) or "1"), params
+
+    def matches(self, record: dict[str, Any]) -> bool:
+        """Same predicate as ``to_sql``, for records already in memory."""
+        exact = record["exact"]
+        qnums = exact.get("quantum_numbers") or {}
+        for column in ("hadron_type", "family", "multiplet"):
+            value = getattr(self, column)
+            if value is not None and exact.get(column) != value:
+                return False
+        # _qnum mirrors the indexed columns: non-integer values are NULL there.
+        for column in _QNUM_COLUMNS:
+            value = getattr(self, column)
+            if value is not None and _qnum(qnums, column) != value:
+                return False
+        mass = float(exact["mass_mev_exact"])
+        if self.min_mass is not None and mass < self.min_mass:
+            return False
+        if self.max_mass is not None and mass >= self.max_mass:
+            return False
+        if self.strange is not None:
+            strangeness = _qnum(qnums, "strangeness")
+            if strangeness is None or (strangeness != 0) != self.strange:
+                return False
+        return True
+
+
+def index_path_for(catalog_path: str | Path) -> Path:
+    source = Path(catalog_path)
+    return source.with_name(source.name + INDEX_SUFFIX)
+
+
+def _source_sha256(path: str | Path) -> str:
+    """Hash of the catalog file, or of every shard (name and bytes) of a directory."""
+    h = hashlib.sha256()
+    files = shard_paths(path) if Path(path).is_dir() else [Path(path)]
+    for file in files:
+        h.update(file.name.encode("utf-8") + b"\0")
+        with open(file, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                h.update(chunk)
+    return h.hexdigest()
+
+
+def _schema_and_records(catalog_path: str | Path) -> tuple[Any, Iterable[dict[str, Any]]]:
+    """schema_version and validated records, streaming .jsonl catalogs row by row."""
+    path = Path(catalog_path)
+    if path.is_file() and path.suffix.lower() == ".jsonl":
+        with path.open("r", encoding="utf-8") as f:
+            header = json.loads(next((line for line in f if line.strip()), "{}"))
+        return header.get("schema_version"), iter_canonical_records(path)
+    catalog = load_canonical_catalog(path)
+    return catalog["schema_version"], catalog["particles"]
+
+
+def _qnum(qnums: dict[str, Any], key: str) -> Optional[int]:
+    value = qnums.get(key)
+    return value if isinstance(value, int) and not isinstance(value, bool) else None
+
+
+def build_catalog_index(catalog_path: str | Path, index_path: Optional[str | Path] = None) -> Path:
+    """Validate ``catalog_path`` once and (re)write its SQLite index atomically."""
+    target = Path(index_path) if index_path is not None else index_path_for(catalog_path)
+    tmp_path = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+    if tmp_path.exists():
+        tmp_path.unlink()
+
+    schema_version, records = _schema_and_records(catalog_path)
+    conn = sqlite3.connect(tmp_path)
+    try:
+        conn.executescript(_SCHEMA)
+        rows = (
+            (
+                record["id"],
+                record["exact"]["family"],
+                record["exact"]["multiplet"],
+                record["exact"]["hadron_type"],
+                float(record["exact"]["mass_mev_exact"]),
+                *(_qnum(record["exact"]["quantum_numbers"], key) for key in _QNUM_COLUMNS),
+                json.dumps(record, ensure_ascii=False, sort_keys=True),
+            )
+            for record in records
+        )
+        conn.executemany("INSERT INTO particles VALUES (?,?,?,?,?,?,?,?,?,?)", rows)
+        conn.executemany(
+            "INSERT INTO meta VALUES (?, ?)",
+            [
+                ("index_version", str(INDEX_VERSION)),
+                ("schema_version", json.dumps(schema_version)),
+                ("source_sha256", _source_sha256(catalog_path)),
+                ("code", schema_fingerprint()),
+            ],
+        )
+        conn.commit()
+    except BaseException:
+        conn.close()
+        tmp_path.unlink(missing_ok=True)
+        raise
+    conn.close()
+    os.replace(tmp_path, target)
+    return target
+
+
+class CatalogIndex:
+    """Read-only queries over a catalog index built by ``build_catalog_index``."""
+
+    def __init__(self, index_path: str | Path):
+        self.path = Path(index_path)
+        self._conn = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> "CatalogIndex":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def meta(self, key: str) -> Optional[str]:
+        row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def ids(self, particle_filter: Optional[ParticleFilter] = None) -> list[str]:
+        where, params = (particle_filter or ParticleFilter()).to_sql()
+        return [row[0] for row in self._conn.execute(f"SELECT id FROM particles WHERE {where} ORDER BY id", params)]
+
+    def count(self, particle_filter: Optional[ParticleFilter] = None) -> int:
+        where, params = (particle_filter or ParticleFilter()).to_sql()
+        return self._conn.execute(f"SELECT COUNT(*) FROM particles WHERE {where}", params).fetchone()[0]
+
+    def records(self, particle_filter: Optional[ParticleFilter] = None) -> Iterator[ValidatedParticleRecord]:
+        """Matching records in id order, each parsed only when it is reached."""
+        where, params = (particle_filter or ParticleFilter()).to_sql()
+        cursor = self._conn.execute(f"SELECT record FROM particles WHERE {where} ORDER BY id", params)
+        for (blob,) in cursor:
+            yield ValidatedParticleRecord(json.loads(blob))
+
+    def record(self, particle_id: str) -> ValidatedParticleRecord:
+        row = self._conn.execute("SELECT record FROM particles WHERE id = ?", (particle_id,)).fetchone()
+        if row is None:
+            raise KeyError(particle_id)
+        return ValidatedParticleRecord(json.loads(row[0]))
+
+
+def open_catalog_index(catalog_path: str | Path, index_path: Optional[str | Path] = None) -> CatalogIndex:
+    """Open the index of ``catalog_path``, rebuilding it first if missing or stale."""
+    target = Path(index_path) if index_path is not None else index_path_for(catalog_path)
+    if target.exists():
+        index = None
+        try:
+            index = CatalogIndex(target)
+            if (
+                index.meta("index_version") == str(INDEX_VERSION)
+                and index.meta("code") == schema_fingerprint()
+                and index.meta("source_sha256") == _source_sha256(catalog_path)
+            ):
+                current, index = index, None
+                return current
+        except sqlite3.DatabaseError:
+            pass
+        finally:
+            if index is not None:
+                index.close()
+    build_catalog_index(catalog_path, target)
+    return CatalogIndex(target)
+
+
+def load_canonical_subset(
+    catalog_path: str | Path,
+    particle_filter: ParticleFilter,
+    index_path: Optional[str | Path] = None,
+) -> dict[str, Any]:
+    """Canonical catalog dict holding only the matching particles, sorted by id."""
+    with open_catalog_index(catalog_path, index_path) as index:
+        particles = list(index.records(particle_filter))
+        schema_version = index.meta("schema_version")
+    return {"schema_version": json.loads(schema_version), "particles": particles}
@@ -1,19 +1,28 @@
 import json
-import yaml
 from typing import Any
 
-def load_catalog(path: str) -> dict[str, Any]:
+from hadron_anki.catalog.compiled import load_compiled
+from hadron_anki.catalog.yaml_loader import safe_load_yaml
+
+
+def _parse_catalog(text: str, path: str) -> Any:
+    if path.endswith(".json") or path.endswith(".jsonc"):
+        return json.loads(text)
+    return safe_load_yaml(text)
+
+
+def load_catalog(path: str, use_cache: bool = True) -> dict[str, Any]:
     """
     Load a particle catalog from a JSON or YAML file.
     
     Returns the schema expected by `build_apkg` (a dictionary with a 'particles' list).
+    With ``use_cache`` the parsed catalog is kept in the compiled cache under
+    ``.cache/compiled`` (see ``catalog.compiled``).
     """
-    with open(path, "r", encoding="utf-8") as f:
-        if path.endswith(".json") or path.endswith(".jsonc"):
-            data = json.load(f)
-        elif path.endswith(".yaml") or path.endswith(".yml"):
-            data = yaml.safe_load(f)
-        else:
-            raise ValueError("Unsupported catalog format: must be .json or .yaml")
-            
-    return data
+    if not path.endswith((".json", ".jsonc", ".yaml", ".yml")):
+        raise ValueError("Unsupported catalog format: must be .json or .yaml")
+
+    if not use_cache:
+        with open(path, "r", encoding="utf-8") as f:
+            return _parse_catalog(f.read(), path)
+    return load_compiled(path, "catalog", lambda source: _parse_catalog(source.decode("utf-8"), path))
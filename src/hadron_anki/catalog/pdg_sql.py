@@ -0,0 +1,201 @@
+"""
+Set-based extraction of decay data straight from the PDG SQLite database.
+
+The ``pdg`` package ships its data as one SQLite file. ``PDGSession`` reads it
+through the object API, one branching fraction at a time; ``PDGSQLSession``
+runs three queries for the whole request instead (particles, exclusive
+branching fractions with their best value, decay products) and returns the
+same ``particle_data`` dicts, so it can be passed anywhere a session is:
+
+    session = PDGSQLSession()              # the pdg package's bundled file
+    results = bootstrap_all_decays(ids, session=session)
+
+Tables and columns used (as in the pdg package schema):
+
+    pdgparticle(name, mcid, pdgid)
+    pdgid(id, pdgid, parent_pdgid, description, data_type, sort)
+    pdgdata(pdgid_id, value, limit_type, in_summary_table, sort)
+    pdgdecay(pdgid_id, pdgitem_id, is_outgoing, sort)
+    pdgitem(id, name)
+
+Exclusive branching fractions are the ``pdgid`` rows with ``data_type``
+``BFX*`` under the particle; a mode's value is its summary-table entry when
+there is one. Products are listed once per ``pdgdecay`` row, like the object
+API's ``decay_products``.
+"""
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+from hadron_anki.catalog.bootstrap_decays import (
+    _REPO_TO_MCID,
+    _REPO_TO_PDG_NAMES,
+    _primary_pdg_name,
+    _skhep_ctau_table,
+)
+
+
+_REQUIRED_TABLES = ("pdgparticle", "pdgid", "pdgdata", "pdgdecay", "pdgitem")
+
+_PARTICLES_SQL = """
+SELECT name, mcid, pdgid FROM pdgparticle
+WHERE name IN (SELECT key FROM temp.wanted_name)
+   OR mcid IN (SELECT key FROM temp.wanted_mcid)
+"""
+
+_MODES_SQL = """
+SELECT m.parent_pdgid, m.pdgid, m.id, m.description, d.value, d.limit_type
+FROM pdgid AS m
+LEFT JOIN pdgdata AS d ON d.pdgid_id = m.id
+WHERE m.parent_pdgid IN (SELECT key FROM temp.wanted_pdgid)
+  AND m.data_type LIKE 'BFX%'
+ORDER BY m.parent_pdgid, m.sort, m.id, d.in_summary_table DESC, d.sort
+"""
+
+_PRODUCTS_SQL = """
+SELECT dc.pdgid_id, i.name
+FROM pdgdecay AS dc
+JOIN pdgitem AS i ON i.id = dc.pdgitem_id
+JOIN pdgid AS m ON m.id = dc.pdgid_id
+WHERE m.parent_pdgid IN (SELECT key FROM temp.wanted_pdgid)
+  AND m.data_type LIKE 'BFX%'
+  AND dc.is_outgoing
+ORDER BY dc.pdgid_id, dc.sort
+"""
+
+
+def default_pdg_database_path() -> Path:
+    """Path of the SQLite file bundled with the ``pdg`` package."""
+    try:
+        import pdg as pdgapi
+    except ImportError as exc:
+        raise ImportError(
+            "PDG Python API not installed. Run: pip install pdg "
+            "(or pass the path of a PDG SQLite file)"
+        ) from exc
+    return Path(pdgapi.__file__).resolve().parent / "pdg.sqlite"
+
+
+class PDGSQLSession:
+    """
+    Batch ``particle_data`` extraction from a PDG SQLite file.
+
+    Drop-in for ``PDGSession`` in ``bootstrap_all_decays``: ``fetch_many``
+    maps every repo ID to its ``particle_data`` dict, or to a ValueError when
+    the particle is not in the database.
+    """
+
+    source_kind = "pdg_sqlite"
+
+    def __init__(self, database_path: Optional[str | Path] = None):
+        path = Path(database_path) if database_path is not None else default_pdg_database_path()
+        if not path.is_file():
+            raise ValueError(f"PDG database not found: {path}")
+        self.path = path
+        # One thread uses a session at a time, but bootstrap_all_decays reads
+        # the edition of (and closes) pool-thread sessions from the caller.
+        self._conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True, check_same_thread=False)
+        present = {
+            row[0] for row in self._conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+        }
+        missing = [table for table in _REQUIRED_TABLES if table not in present]
+        if missing:
+            self._conn.close()
+            raise ValueError(f"{path} is not a PDG database (missing tables: {', '.join(missing)})")
+
+    def close(self) -> None:
+        self._conn.close()
+
+    @property
+    def edition(self) -> str:
+        """PDG edition recorded in the file's ``pdginfo`` table, ``"unknown"`` if absent."""
+        try:
+            row = self._conn.execute("SELECT value FROM pdginfo WHERE name = 'edition'").fetchone()
+        except sqlite3.OperationalError:
+            return "unknown"
+        return str(row[0]) if row and row[0] else "unknown"
+
+    def __enter__(self) -> "PDGSQLSession":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def _fill(self, table: str, keys: Iterable[Any]) -> None:
+        self._conn.execute(f"CREATE TEMP TABLE IF NOT EXISTS {table} (key PRIMARY KEY)")
+        self._conn.execute(f"DELETE FROM temp.{table}")
+        self._conn.executemany(f"INSERT OR IGNORE INTO temp.{table} VALUES (?)", ((key,) for key in keys))
+
+    def resolve_many(self, repo_ids: Iterable[str]) -> dict[str, str | Exception]:
+        """PDG identifier (e.g. ``"S008"``) per repo ID, or a ValueError."""
+        repo_ids = list(repo_ids)
+        self._fill("wanted_name", (name for rid in repo_ids for name in _REPO_TO_PDG_NAMES.get(rid, [])))
+        self._fill("wanted_mcid", (_REPO_TO_MCID[rid] for rid in repo_ids if rid in _REPO_TO_MCID))
+        by_name: dict[str, str] = {}
+        by_mcid: dict[int, str] = {}
+        for name, mcid, pdgid in self._conn.execute(_PARTICLES_SQL):
+            by_name.setdefault(name, pdgid)
+            if mcid is not None:
+                by_mcid.setdefault(mcid, pdgid)
+
+        resolved: dict[str, str | Exception] = {}
+        for repo_id in repo_ids:
+            # Same order as PDGSession.resolve: names first, then the MC ID fallback.
+            candidates = [by_name.get(name) for name in _REPO_TO_PDG_NAMES.get(repo_id, [])]
+            candidates.append(by_mcid.get(_REPO_TO_MCID.get(repo_id)))
+            pdgid = next((c for c in candidates if c is not None), None)
+            resolved[repo_id] = (
+                pdgid if pdgid is not None
+                else ValueError(f"Could not find PDG particle for repo_id={repo_id!r}")
+            )
+        return resolved
+
+    def branching_fractions(self, pdgids: Iterable[str]) -> dict[str, list[dict]]:
+        """Exclusive branching fractions per PDG identifier, in PDG listing order."""
+        self._fill("wanted_pdgid", pdgids)
+        products: dict[int, list[str]] = {}
+        for mode_id, name in self._conn.execute(_PRODUCTS_SQL):
+            products.setdefault(mode_id, []).append(name)
+
+        modes: dict[str, list[dict]] = {}
+        seen: set[int] = set()
+        for parent, _, mode_id, description, value, limit_type in self._conn.execute(_MODES_SQL):
+            if mode_id in seen:   # later rows are non-summary values of the same mode
+                continue
+            seen.add(mode_id)
+            modes.setdefault(parent, []).append({
+                "description": description,
+                "value": value,
+                "is_limit": bool(limit_type),
+                "decay_products": products.get(mode_id, []),
+            })
+        return modes
+
+    def fetch_many(self, repo_ids: Iterable[str]) -> dict[str, dict | Exception]:
+        """``particle_data`` dicts (see ``parse_dominant_decay``) for every ID."""
+        repo_ids = list(dict.fromkeys(repo_ids))
+        resolved = self.resolve_many(repo_ids)
+        found = [repo_id for repo_id in repo_ids if not isinstance(resolved[repo_id], Exception)]
+        modes = self.branching_fractions(resolved[repo_id] for repo_id in found)
+        ctau = _skhep_ctau_table(_primary_pdg_name(repo_id) for repo_id in found)
+
+        results: dict[str, dict | Exception] = {}
+        for repo_id in repo_ids:
+            pdgid = resolved[repo_id]
+            if isinstance(pdgid, Exception):
+                results[repo_id] = pdgid
+                continue
+            results[repo_id] = {
+                "pdg_name": _primary_pdg_name(repo_id),
+                "ctau_mm": ctau[_primary_pdg_name(repo_id)],
+                "branching_fractions": modes.get(pdgid, []),
+            }
+        return results
+
+    def fetch(self, repo_id: str) -> dict:
+        data = self.fetch_many([repo_id])[repo_id]
+        if isinstance(data, Exception):
+            raise data
+        return data
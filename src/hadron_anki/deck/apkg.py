@@ -1,37 +1,102 @@
 import hashlib
+import itertools
+import json
 import os
+import shutil
+import sqlite3
 import tempfile
-from typing import Any, Optional
+from typing import Any, Iterable, Optional
 import zipfile
 
 import genanki
 
 from hadron_anki.cards.styles import CARD_CSS
-from hadron_anki.cards.mapping import generate_cards
+from hadron_anki.cards.mapping import applicable_card_types, generate_cards
 from hadron_anki.deck.ids import stable_note_guid
+from hadron_anki.deck.manifest import (
+    BuildReport,
+    PreviousBuild,
+    diff_notes,
+    file_sha256,
+    note_input_hash,
+    write_manifest,
+)
+from hadron_anki.deck.media import MediaSet, render_media_set
 from hadron_anki.domain.composer import normalize_quark_token, validate_quark_count
 from hadron_anki.domain.spec import ParticleSpec
+from hadron_anki.render.cache import RenderCache
+from hadron_anki.render.config import get_style_config
+from hadron_anki.render.feynman import render_feynman_svg
 from hadron_anki.render.svg import render_svg
 from hadron_anki.cards.tags import build_tags
 
 
 _DETERMINISTIC_ZIP_DT = (1980, 1, 1, 0, 0, 0)
+_COPY_CHUNK = 1 << 20
 
 
-def _rewrite_apkg_deterministic(in_path: str, out_path: str) -> None:
-    def _writestr(z: zipfile.ZipFile, name: str, data: bytes) -> None:
-        info = zipfile.ZipInfo(filename=name, date_time=_DETERMINISTIC_ZIP_DT)
-        info.compress_type = zipfile.ZIP_DEFLATED
-        z.writestr(info, data)
+def _zip_info(name: str) -> zipfile.ZipInfo:
+    info = zipfile.ZipInfo(filename=name, date_time=_DETERMINISTIC_ZIP_DT)
+    info.compress_type = zipfile.ZIP_DEFLATED
+    return info
 
-    with zipfile.ZipFile(in_path, "r") as zin:
-        with zipfile.ZipFile(out_path, "w") as zout:
-            _writestr(zout, "collection.anki2", zin.read("collection.anki2"))
-            _writestr(zout, "media", zin.read("media"))
 
-            numeric_names = [n for n in zin.namelist() if n.isdigit()]
-            for name in sorted(numeric_names, key=lambda s: int(s)):
-                _writestr(zout, name, zin.read(name))
+def _write_apkg_deterministic(db_path: str, media_files: list[str], out_path: str) -> None:
+    """
+    Write the .apkg zip in a single pass with fixed timestamps.
+
+    Members are ``collection.anki2``, ``media`` and the numeric media entries in
+    index order. Each file is streamed into the archive and compressed once.
+    """
+    media_json = {idx: os.path.basename(path) for idx, path in enumerate(media_files)}
+
+    with zipfile.ZipFile(out_path, "w") as zout:
+        with open(db_path, "rb") as src, zout.open(_zip_info("collection.anki2"), "w") as dst:
+            shutil.copyfileobj(src, dst, _COPY_CHUNK)
+        zout.writestr(_zip_info("media"), json.dumps(media_json))
+
+        for idx, path in enumerate(media_files):
+            with open(path, "rb") as src, zout.open(_zip_info(str(idx)), "w") as dst:
+                shutil.copyfileobj(src, dst, _COPY_CHUNK)
+
+
+def _write_collection(deck: genanki.Deck, db_path: str) -> None:
+    """Create the Anki SQLite collection for ``deck`` with hermetic timestamps."""
+    conn = sqlite3.connect(db_path)
+    try:
+        cursor = conn.cursor()
+        genanki.Package(deck).write_to_db(cursor, 0.0, itertools.count(0))
+        conn.commit()
+    finally:
+        conn.close()
+
+
+# Deterministic integer IDs (genanki expects int; Anki uses signed 64-bit).
+def _stable_int_id(tag: str) -> int:
+    digest = hashlib.sha256(tag.encode("utf-8")).digest()
+    # Cap at 52 bits to stay within Number.MAX_SAFE_INTEGER in Anki's JS bridge.
+    # 2^53-1 is the limit; 2^52-1 is extremely safe.
+    return int.from_bytes(digest[:8], "big") & ((1 << 52) - 1)
+
+
+def _deck_and_model(deck_name: str, template_version: str, model_version: str) -> tuple[genanki.Deck, genanki.Model]:
+    deck_id = _stable_int_id(f"deck|{deck_name}|{template_version}")
+    model_id = _stable_int_id(f"model|hadron_anki|{template_version}|{model_version}")
+
+    model = genanki.Model(
+        model_id=model_id,
+        name=f"hadron_anki::{model_version}",
+        fields=[{"name": "Front"}, {"name": "Back"}],
+        templates=[
+            {
+                "name": "Card 1",
+                "qfmt": "{{Front}}",
+                "afmt": "{{FrontSide}}<hr id=answer>{{Back}}",
+            }
+        ],
+        css=CARD_CSS,
+    )
+    return genanki.Deck(deck_id=deck_id, name=deck_name), model
 
 
 def _particle_spec_from_mapping(p: dict[str, Any]) -> ParticleSpec:
@@ -74,7 +139,13 @@ def build_apkg(
     model_version: str = "",
     card_types: Optional[list[str]] = None,
     specs: Optional[list[ParticleSpec]] = None,
-) -> None:
+    media: Optional[MediaSet] = None,
+    style: Optional[dict[str, Any]] = None,
+    cache: Optional[RenderCache] = None,
+    jobs: int = 1,
+    incremental: bool = False,
+    inline_svg_max_bytes: Optional[int] = None,
+) -> BuildReport:
     """
     Build an Anki .apkg file from a particle catalog or ready-made specs.
 
@@ -87,7 +158,30 @@ def build_apkg(
         card_types: List of card types to include. If None, all are generated.
         specs: Pre-built ParticleSpec list (canonical path). Takes precedence
             over ``catalog`` when provided.
+        media: Pre-rendered media from ``deck.media.render_media_set``. When
+            given, SVGs are not rendered again, so several deck variants can
+            share one render pass.
+        style: Resolved style config used when rendering media here. Defaults
+            to the cached ``render.config.get_style_config()``.
+        cache: Persistent render cache used when rendering media here.
+        jobs: Worker processes for rendering media here. The .apkg bytes are
+            identical for any value.
+        incremental: Read and write the ``<out_path>.manifest.json`` sidecar
+            (see ``deck.manifest``). Notes and media whose inputs are unchanged
+            since the last build are reused from the existing package; the
+            output is byte-identical to a full build.
+        inline_svg_max_bytes: Embed SVGs of at most this many bytes directly
+            in the card HTML instead of shipping them as media files. Fewer
+            media files make imports and syncs faster; inlined markup is
+            stored once per note that shows it. None (default) inlines nothing.
+
+    Returns:
+        A ``BuildReport`` of added/changed/removed notes relative to the
+        previous manifest (every note counts as added without one), with the
+        package's media count and byte sizes.
     """
+    if inline_svg_max_bytes is not None and inline_svg_max_bytes < 0:
+        raise ValueError("inline_svg_max_bytes must be >= 0")
     if specs is None:
         if not isinstance(catalog, dict):
             raise ValueError("build_apkg requires either 'catalog' or 'specs'")
@@ -102,74 +196,193 @@ def build_apkg(
         specs = [_particle_spec_from_mapping(p) for p in particles]
 
     specs = sorted(specs, key=lambda s: s.id)
+    deck, model = _deck_and_model(deck_name, template_version, model_version)
 
-    # Deterministic integer IDs (genanki expects int; Anki uses signed 64-bit).
-    def _stable_int_id(tag: str) -> int:
-        digest = hashlib.sha256(tag.encode("utf-8")).digest()
-        # Cap at 52 bits to stay within Number.MAX_SAFE_INTEGER in Anki's JS bridge.
-        # 2^53-1 is the limit; 2^52-1 is extremely safe.
-        return int.from_bytes(digest[:8], "big") & ((1 << 52) - 1)
+    report = BuildReport(inline_svg_max_bytes=inline_svg_max_bytes)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        previous = PreviousBuild.load(out_path, tmpdir) if incremental else None
+        if media is None:
+            media = render_media_set(
+                specs, os.path.join(tmpdir, "media"),
+                style=style, cache=cache, jobs=jobs, previous=previous,
+            )
 
-    deck_id = _stable_int_id(f"deck|{deck_name}|{template_version}")
-    model_id = _stable_int_id(f"model|hadron_anki|{template_version}|{model_version}")
+        media_files: list[str] = []
+        notes_manifest: dict[str, dict[str, str]] = {}
+        for spec in specs:
+            svg_filename = media.require(spec)
+            decay_svg_filename = media.decay_svg_filenames.get(spec.id)
 
-    model = genanki.Model(
-        model_id=model_id,
-        name=f"hadron_anki::{model_version}",
-        fields=[{"name": "Front"}, {"name": "Back"}],
-        templates=[
-            {
-                "name": "Card 1",
-                "qfmt": "{{Front}}",
-                "afmt": "{{FrontSide}}<hr id=answer>{{Back}}",
+            inline_svgs: dict[str, str] = {}
+            for filename in (svg_filename, decay_svg_filename):
+                if not filename:
+                    continue
+                path = os.path.join(media.media_dir, filename)
+                size = os.path.getsize(path)
+                if inline_svg_max_bytes is not None and size <= inline_svg_max_bytes:
+                    with open(path, "r", encoding="utf-8") as f:
+                        inline_svgs[filename] = f.read()
+                    report.inlined_svgs += 1
+                    report.inlined_bytes += size
+                else:
+                    media_files.append(path)
+            inline_digests = {
+                filename: hashlib.sha256(svg.encode("utf-8")).hexdigest()
+                for filename, svg in inline_svgs.items()
             }
-        ],
-        css=CARD_CSS,
-    )
-
-    deck = genanki.Deck(deck_id=deck_id, name=deck_name)
 
-    media_files: list[str] = []
-    with tempfile.TemporaryDirectory() as tmpdir:
-        for spec in specs:
-            svg_filename = f"{spec.id}.svg"
-            svg_path = os.path.join(tmpdir, svg_filename)
-            with open(svg_path, "w", encoding="utf-8") as f:
-                f.write(render_svg(spec))
-            media_files.append(svg_path)
-
-            decay_svg_filename = None
-            if spec.decay_diagram:
-                from hadron_anki.render.feynman import render_feynman_svg
-                math_cache = os.path.join(tmpdir, "math_labels")
-                os.makedirs(math_cache, exist_ok=True)
-                decay_svg_filename = f"{spec.id}_decay.svg"
-                decay_svg_path = os.path.join(tmpdir, decay_svg_filename)
-                
-                with open(decay_svg_path, "w", encoding="utf-8") as df:
-                    df.write(render_feynman_svg(spec.decay_diagram, math_cache_dir=math_cache))
-                media_files.append(decay_svg_path)
-
-            cards = generate_cards(
-                spec, 
-                svg_filename, 
-                include_types=card_types, 
-                decay_svg_filename=decay_svg_filename
-            )
-            for card in cards:
-                note = genanki.Note(
-                    model=model,
-                    fields=[card.front_html, card.back_html],
-                    guid=stable_note_guid(f"{spec.id}:{card.card_type}", template_version, model_version),
-                    tags=build_tags(spec, card.card_type)
+            for card_type in applicable_card_types(spec, card_types, decay_svg_filename):
+                guid = stable_note_guid(f"{spec.id}:{card_type}", template_version, model_version)
+                input_hash = note_input_hash(
+                    spec, card_type, template_version, model_version, svg_filename, decay_svg_filename,
+                    inline_digests,
                 )
+                notes_manifest[guid] = {"note": f"{spec.id}:{card_type}", "hash": input_hash}
+
+                row = previous.note(guid, input_hash) if previous else None
+                if row is not None:
+                    fields, tags = row
+                else:
+                    card = generate_cards(
+                        spec,
+                        svg_filename,
+                        include_types=[card_type],
+                        decay_svg_filename=decay_svg_filename,
+                        inline_svgs=inline_svgs,
+                    )[0]
+                    fields, tags = [card.front_html, card.back_html], build_tags(spec, card_type)
+
+                note = genanki.Note(model=model, fields=fields, guid=guid, tags=tags)
                 deck.add_note(note)
 
         media_files.sort(key=lambda p: os.path.basename(p))
 
-        package = genanki.Package(deck)
-        package.media_files = media_files
+        db_path = os.path.join(tmpdir, "collection.anki2")
+        _write_collection(deck, db_path)
+        _write_apkg_deterministic(db_path, media_files, out_path)
+
+        names = [os.path.basename(p) for p in media_files]
+        report.media_files = len(media_files)
+        report.media_bytes = sum(os.path.getsize(path) for path in media_files)
+        report.package_bytes = os.path.getsize(out_path)
+        report.reused_media = len([n for n in names if n in media.reused])
+        report.rendered_media = len(names) - report.reused_media
+        diff_notes(previous.manifest if previous else None, notes_manifest, report)
+        if incremental:
+            media_manifest = {
+                os.path.basename(path): {
+                    "input": media.input_keys.get(os.path.basename(path), ""),
+                    "sha256": file_sha256(path),
+                }
+                for path in media_files
+            }
+            write_manifest(out_path, notes_manifest, media_manifest)
+
+    return report
+
+
+def build_apkg_streaming(
+    specs: Iterable[ParticleSpec],
+    out_path: str,
+    deck_name: str,
+    template_version: str,
+    model_version: str,
+    card_types: Optional[list[str]] = None,
+    style: Optional[dict[str, Any]] = None,
+    cache: Optional[RenderCache] = None,
+) -> int:
+    """
+    Build an .apkg from a stream of specs, holding one particle at a time.
+
+    Each spec is rendered, turned into cards and inserted into the SQLite
+    collection before the next one is pulled, so peak memory does not grow
+    with the catalog (only media file names are kept until the zip is
+    written). Feed it ``iter_specs(iter_canonical_records(path))`` for a
+    ``.jsonl`` catalog.
+
+    Specs must arrive in strictly increasing id order (``write_canonical_jsonl``
+    writes catalogs that way); the package is then byte-identical to
+    ``build_apkg`` for the same specs. Render work runs in this process.
+
+    Returns:
+        The number of notes written.
+    """
+    if style is None:
+        style = get_style_config()
+    deck, model = _deck_and_model(deck_name, template_version, model_version)
+    deck.add_model(model)
+    id_gen = itertools.count(0)
+    note_count = 0
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        media_dir = os.path.join(tmpdir, "media")
+        os.makedirs(media_dir)
+        math_cache_dir = os.path.join(media_dir, "math_labels")
+        media_names: list[str] = []
+
+        db_path = os.path.join(tmpdir, "collection.anki2")
+        conn = sqlite3.connect(db_path)
+        try:
+            cursor = conn.cursor()
+            genanki.Package(deck).write_to_db(cursor, 0.0, id_gen)
+
+            previous_id: Optional[str] = None
+            for spec in specs:
+                if previous_id is not None and spec.id <= previous_id:
+                    raise ValueError(
+                        f"streaming build needs specs sorted by unique id; {spec.id!r} follows {previous_id!r}"
+                    )
+                previous_id = spec.id
+
+                svg_filename = f"{spec.id}.svg"
+                with open(os.path.join(media_dir, svg_filename), "w", encoding="utf-8") as f:
+                    f.write(render_svg(spec, style, cache=cache))
+                media_names.append(svg_filename)
 
-        tmp_apkg = os.path.join(tmpdir, "out.apkg")
-        package.write_to_file(tmp_apkg, timestamp=0.0)
-        _rewrite_apkg_deterministic(tmp_apkg, out_path)
+                decay_svg_filename = None
+                if spec.decay_diagram:
+                    decay_svg_filename = f"{spec.id}_decay.svg"
+                    decay_svg = render_feynman_svg(spec.decay_diagram, math_cache_dir=math_cache_dir, cache=cache)
+                    with open(os.path.join(media_dir, decay_svg_filename), "w", encoding="utf-8") as f:
+                        f.write(decay_svg)
+                    media_names.append(decay_svg_filename)
+
+                for card_type in applicable_card_types(spec, card_types, decay_svg_filename):
+                    card = generate_cards(
+                        spec,
+                        svg_filename,
+                        include_types=[card_type],
+                        decay_svg_filename=decay_svg_filename,
+                    )[0]
+                    note = genanki.Note(
+                        model=model,
+                        fields=[card.front_html, card.back_html],
+                        guid=stable_note_guid(f"{spec.id}:{card_type}", template_version, model_version),
+                        tags=build_tags(spec, card_type),
+                    )
+                    note.write_to_db(cursor, 0.0, deck.deck_id, id_gen)
+                    note_count += 1
+            conn.commit()
+        finally:
+            conn.close()
+
+        media_names.sort()
+        _write_apkg_deterministic(db_path, [os.path.join(media_dir, name) for name in media_names], out_path)
+
+    return note_count
+
+
+def verify_build_determinism(specs: list[ParticleSpec], jobs: int, **build_kwargs: Any) -> bool:
+    """
+    Build the same deck with ``jobs=1`` and ``jobs=N`` and compare the bytes.
+
+    No render cache is used, so both builds really render every SVG.
+    ``build_kwargs`` are forwarded to ``build_apkg`` (deck_name, versions, ...).
+    """
+    with tempfile.TemporaryDirectory() as tmpdir:
+        serial_path = os.path.join(tmpdir, "serial.apkg")
+        parallel_path = os.path.join(tmpdir, "parallel.apkg")
+        build_apkg(specs=specs, out_path=serial_path, jobs=1, **build_kwargs)
+        build_apkg(specs=specs, out_path=parallel_path, jobs=jobs, **build_kwargs)
+        with open(serial_path, "rb") as a, open(parallel_path, "rb") as b:
+            return a.read() == b.read()
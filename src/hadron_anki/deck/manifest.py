@@ -0,0 +1,232 @@
+"""
+Per-note content manifest for incremental deck builds.
+
+``build_apkg(..., incremental=True)`` writes ``<out_path>.manifest.json`` next
+to the package. It maps every note GUID and media file to a hash of its
+inputs (spec, card type, template/model versions, card template code, and for
+media the renderer cache key, which covers style and renderer version).
+
+On the next build, notes and media whose hashes match are taken from the
+previous package (note rows from its ``collection.anki2``, media members from
+its zip) instead of being regenerated. The SQLite collection and zip are still
+written fresh, so an incremental build is byte-identical to a full one.
+"""
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+import os
+import sqlite3
+import zipfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Optional
+
+from hadron_anki.domain.spec import ParticleSpec
+
+
+MANIFEST_VERSION = 1
+MANIFEST_SUFFIX = ".manifest.json"
+
+# Sources (relative to the package) that shape note fields and tags.
+_CARD_CODE_MODULES = (
+    "cards/mapping.py",
+    "cards/sections.py",
+    "cards/styles.py",
+    "cards/tags.py",
+    "cards/templates.py",
+    "domain/composer.py",            # format_quark_display
+    "domain/particle_symbols.py",    # display_symbol
+)
+_card_code_digest: Optional[str] = None
+
+
+def manifest_path(out_path: str) -> str:
+    return f"{out_path}{MANIFEST_SUFFIX}"
+
+
+def _card_code_fingerprint() -> str:
+    """Hash of the card template sources and the formatters they call, so edits invalidate notes."""
+    global _card_code_digest
+    if _card_code_digest is None:
+        package_dir = Path(__file__).resolve().parent.parent
+        h = hashlib.sha256()
+        for name in _CARD_CODE_MODULES:
+            h.update((package_dir / name).read_bytes())
+        _card_code_digest = h.hexdigest()
+    return _card_code_digest
+
+
+def note_input_hash(
+    spec: ParticleSpec,
+    card_type: str,
+    template_version: str,
+    model_version: str,
+    svg_filename: str,
+    decay_svg_filename: Optional[str],
+    inline_digests: Optional[dict[str, str]] = None,
+) -> str:
+    """
+    Hash of everything that determines a note's fields and tags.
+
+    ``inline_digests`` (filename -> sha256 of the SVG markup inlined into the
+    note) is only part of the payload when SVGs are inlined, so hashes of
+    ordinary builds do not change.
+    """
+    payload = {
+        "spec": dataclasses.asdict(spec),
+        "card_type": card_type,
+        "template_version": template_version,
+        "model_version": model_version,
+        "svg": svg_filename,
+        "decay_svg": decay_svg_filename,
+        "code": _card_code_fingerprint(),
+    }
+    if inline_digests:
+        payload["inline_svgs"] = inline_digests
+    blob = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+def file_sha256(path: str | Path) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+@dataclass
+class BuildReport:
+    """Outcome of an (incremental) build, with notes labelled ``<id>:<card_type>``."""
+    added: list[str] = field(default_factory=list)
+    changed: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    unchanged: int = 0
+    reused_media: int = 0
+    rendered_media: int = 0
+    # Size/media-count tradeoff of the package; inline fields are set when
+    # ``build_apkg(inline_svg_max_bytes=...)`` embeds small SVGs in the notes.
+    media_files: int = 0
+    media_bytes: int = 0
+    inline_svg_max_bytes: Optional[int] = None
+    inlined_svgs: int = 0
+    inlined_bytes: int = 0
+    package_bytes: int = 0
+
+    def summary(self) -> str:
+        text = (
+            f"{len(self.added)} added, {len(self.changed)} changed, "
+            f"{len(self.removed)} removed, {self.unchanged} unchanged notes; "
+            f"media: {self.reused_media} reused, {self.rendered_media} rendered"
+        )
+        if self.inline_svg_max_bytes is not None:
+            text += (
+                f"; inline SVG <= {self.inline_svg_max_bytes} B: {self.inlined_svgs} inlined "
+                f"({self.inlined_bytes} B), {self.media_files} media files ({self.media_bytes} B), "
+                f"package {self.package_bytes} B"
+            )
+        return text
+
+
+class PreviousBuild:
+    """Read access to the package and manifest left by the last build."""
+
+    def __init__(self, manifest: dict[str, Any], rows: dict[str, tuple[list[str], list[str]]], apkg_path: str):
+        self.manifest = manifest
+        self.rows = rows
+        self.apkg_path = apkg_path
+
+    @classmethod
+    def load(cls, out_path: str, workdir: str) -> Optional["PreviousBuild"]:
+        """Return the previous build, or None if it is missing or unusable."""
+        try:
+            with open(manifest_path(out_path), "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(manifest, dict) or manifest.get("version") != MANIFEST_VERSION:
+            return None
+
+        db_path = os.path.join(workdir, "previous.anki2")
+        try:
+            with zipfile.ZipFile(out_path, "r") as z, open(db_path, "wb") as dst:
+                dst.write(z.read("collection.anki2"))
+            conn = sqlite3.connect(db_path)
+            try:
+                rows = {
+                    guid: (flds.split("\x1f"), tags.split())
+                    for guid, flds, tags in conn.execute("SELECT guid, flds, tags FROM notes")
+                }
+            finally:
+                conn.close()
+        except (OSError, KeyError, zipfile.BadZipFile, sqlite3.DatabaseError):
+            return None
+        return cls(manifest, rows, out_path)
+
+    def note(self, guid: str, input_hash: str) -> Optional[tuple[list[str], list[str]]]:
+        """Fields and tags of an unchanged note, or None if it must be regenerated."""
+        entry = self.manifest.get("notes", {}).get(guid)
+        if not entry or entry.get("hash") != input_hash:
+            return None
+        return self.rows.get(guid)
+
+    def extract_media(self, filenames: dict[str, str], dest_dir: str | Path) -> set[str]:
+        """
+        Copy media whose input key matches the manifest from the previous package.
+
+        Args:
+            filenames: media filename -> current input key.
+            dest_dir: directory to write reused files into.
+
+        Returns:
+            The filenames that were reused (content hash verified).
+        """
+        media_manifest = self.manifest.get("media", {})
+        wanted = {
+            name for name, key in filenames.items()
+            if media_manifest.get(name, {}).get("input") == key
+        }
+        if not wanted:
+            return set()
+
+        reused: set[str] = set()
+        try:
+            with zipfile.ZipFile(self.apkg_path, "r") as z:
+                index = json.loads(z.read("media"))
+                for member, name in index.items():
+                    if name not in wanted:
+                        continue
+                    data = z.read(member)
+                    if hashlib.sha256(data).hexdigest() != media_manifest[name].get("sha256"):
+                        continue
+                    (Path(dest_dir) / name).write_bytes(data)
+                    reused.add(name)
+        except (OSError, KeyError, ValueError, zipfile.BadZipFile):
+            return set()
+        return reused
+
+
+def diff_notes(previous: Optional[dict[str, Any]], notes: dict[str, dict[str, str]], report: BuildReport) -> None:
+    """Fill the added/changed/removed/unchanged fields of ``report``."""
+    old = (previous or {}).get("notes", {})
+    for guid, entry in sorted(notes.items(), key=lambda item: item[1]["note"]):
+        prev = old.get(guid)
+        if prev is None:
+            report.added.append(entry["note"])
+        elif prev.get("hash") != entry["hash"]:
+            report.changed.append(entry["note"])
+        else:
+            report.unchanged += 1
+    report.removed = sorted(entry.get("note", guid) for guid, entry in old.items() if guid not in notes)
+
+
+def write_manifest(out_path: str, notes: dict[str, dict[str, str]], media: dict[str, dict[str, str]]) -> None:
+    """Atomically write the sidecar manifest for ``out_path``."""
+    manifest = {"version": MANIFEST_VERSION, "notes": notes, "media": media}
+    path = manifest_path(out_path)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    os.replace(tmp_path, path)
@@ -0,0 +1,105 @@
+"""
+Shared render stage for deck packaging.
+
+Renders each particle's composition SVG and Feynman decay SVG once into a
+media directory. The resulting ``MediaSet`` can then be handed to any number
+of ``build_apkg`` calls, so extra deck variants only cost packaging time.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Optional
+
+from hadron_anki.deck.manifest import PreviousBuild
+from hadron_anki.domain.spec import ParticleSpec
+from hadron_anki.render.batch import render_specs
+from hadron_anki.render.cache import RenderCache
+from hadron_anki.render.config import get_style_config
+from hadron_anki.render.feynman import feynman_cache_key
+from hadron_anki.render.svg import composition_cache_key
+
+
+@dataclass
+class MediaSet:
+    """Rendered media for a list of specs, keyed by particle id."""
+    media_dir: Path
+    svg_filenames: dict[str, str] = field(default_factory=dict)
+    decay_svg_filenames: dict[str, str] = field(default_factory=dict)
+    # Media filename -> render input key (see ``media_input_keys``).
+    input_keys: dict[str, str] = field(default_factory=dict)
+    # Filenames copied from a previous build or served from the render cache
+    # instead of rendered.
+    reused: set[str] = field(default_factory=set)
+
+    def require(self, spec: ParticleSpec) -> str:
+        """Return the composition SVG filename for ``spec`` or fail loudly."""
+        if spec.id not in self.svg_filenames:
+            raise ValueError(f"media set has no rendered SVG for particle {spec.id!r}")
+        return self.svg_filenames[spec.id]
+
+
+def media_input_keys(spec: ParticleSpec, style: dict[str, Any]) -> dict[str, str]:
+    """Media filenames for ``spec`` mapped to the render cache key of their inputs."""
+    keys = {f"{spec.id}.svg": composition_cache_key(spec, style)}
+    if spec.decay_diagram:
+        keys[f"{spec.id}_decay.svg"] = feynman_cache_key(spec.decay_diagram, math_labels=True)
+    return keys
+
+
+def render_media_set(
+    specs: list[ParticleSpec],
+    media_dir: str | Path,
+    style: Optional[dict[str, Any]] = None,
+    cache: Optional[RenderCache] = None,
+    jobs: int = 1,
+    previous: Optional[PreviousBuild] = None,
+) -> MediaSet:
+    """Render composition and decay SVGs for every spec into ``media_dir``.
+
+    ``style`` is resolved once (via the cached ``get_style_config``) and shared
+    by every render call. With a ``cache``, unchanged particles are served from
+    the persistent render cache instead of being re-rendered. ``jobs > 1``
+    renders in a process pool; files are identical for any ``jobs``. With a
+    ``previous`` build, media whose input keys are unchanged is copied from
+    that package and only the rest is rendered. ``MediaSet.reused`` lists
+    the files that were not rendered: copied from ``previous`` or found in
+    ``cache``.
+    """
+    if style is None:
+        style = get_style_config()
+    media_path = Path(media_dir)
+    media_path.mkdir(parents=True, exist_ok=True)
+
+    unique = {spec.id: spec for spec in specs}
+    keys_by_id = {pid: media_input_keys(spec, style) for pid, spec in unique.items()}
+    media = MediaSet(media_dir=media_path)
+    for keys in keys_by_id.values():
+        media.input_keys.update(keys)
+    if previous is not None:
+        media.reused = previous.extract_media(media.input_keys, media_path)
+
+    pending = [spec for pid, spec in unique.items() if not set(keys_by_id[pid]) <= media.reused]
+    cached: set[str] = set()
+    if cache is not None:
+        pending_names = {name for spec in pending for name in keys_by_id[spec.id]}
+        cached = {name for name in pending_names if media.input_keys[name] in cache}
+    rendered = render_specs(
+        pending, math_cache_dir=media_path / "math_labels", style=style, cache=cache, jobs=jobs
+    )
+
+    for particle_id in sorted(unique):
+        svg_filename = f"{particle_id}.svg"
+        decay_svg_filename = f"{particle_id}_decay.svg"
+        if particle_id in rendered.composition:
+            media.reused -= set(keys_by_id[particle_id])
+            (media_path / svg_filename).write_text(rendered.composition[particle_id], encoding="utf-8")
+            if particle_id in rendered.decay:
+                (media_path / decay_svg_filename).write_text(rendered.decay[particle_id], encoding="utf-8")
+
+        media.svg_filenames[particle_id] = svg_filename
+        if decay_svg_filename in keys_by_id[particle_id]:
+            media.decay_svg_filenames[particle_id] = decay_svg_filename
+
+    media.reused |= cached
+    return media
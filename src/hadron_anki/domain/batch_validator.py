@@ -0,0 +1,242 @@
+"""
+Single-pass catalog validation that collects every violation.
+
+``validate_particle_record`` stops at the first problem. ``validate_catalog``
+walks a parsed canonical catalog once and returns a ``ValidationIssue`` for
+every rule the scalar validator enforces (same messages, in the same order per
+record), plus duplicate ids across the catalog. Each issue carries the
+record path and, when the catalog was parsed with positions (see
+``catalog.yaml_loader.load_yaml_with_positions``), its 1-based line and column.
+
+Field rules are compiled into module-level tables; the hot path is plain
+dict/set operations, and position lookups only happen for actual issues.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Mapping, Optional
+
+from hadron_anki.domain.canonical_validator import (
+    _ALLOWED_CONSTITUENT_ROLES,
+    _ALLOWED_DIAGRAM_MODES,
+    _ALLOWED_HADRON_TYPES,
+    _ALLOWED_QMODEL_MODES,
+    _REQUIRED_EXACT_FIELDS,
+    _REQUIRED_QNUM_FIELDS,
+)
+
+Position = tuple[int, int]
+Positions = dict[int, tuple[Position, dict[Any, Position]]]
+
+_REQUIRED_EXACT_SET = frozenset(_REQUIRED_EXACT_FIELDS)
+_REQUIRED_QNUM_SET = frozenset(_REQUIRED_QNUM_FIELDS)
+_STRING_FIELDS = tuple(
+    (field, f"exact.{field} must be a non-empty string")
+    for field in ("name", "symbol", "family", "multiplet")
+)
+_MISSING_EXACT = {field: f"canonical particle missing exact.{field}" for field in _REQUIRED_EXACT_FIELDS}
+_MISSING_QNUM = {
+    field: f"canonical particle missing exact.quantum_numbers.{field}" for field in _REQUIRED_QNUM_FIELDS
+}
+_HADRON_TYPE_MESSAGE = f"exact.hadron_type must be one of: {_ALLOWED_HADRON_TYPES}"
+_ROLE_MESSAGE = f"simple_valence constituent.role must be one of: {_ALLOWED_CONSTITUENT_ROLES}"
+_DIAGRAM_MODE_MESSAGE = f"pedagogical.diagram_mode must be one of: {_ALLOWED_DIAGRAM_MODES}"
+
+
+@dataclass(frozen=True)
+class ValidationIssue:
+    path: str
+    message: str
+    line: Optional[int] = None
+    column: Optional[int] = None
+
+    def __str__(self) -> str:
+        location = f"{self.line}:{self.column}: " if self.line is not None else ""
+        return f"{location}{self.path}: {self.message}"
+
+
+class _Collector:
+    def __init__(self, positions: Optional[Positions]):
+        self.positions = positions
+        self.particles: Any = None
+        self.issues: list[ValidationIssue] = []
+
+    def add(
+        self, path: str, message: str, container: Any = None, key: Any = None, idx: Optional[int] = None
+    ) -> None:
+        """Record an issue; ``path`` is relative to ``particles[idx]`` when ``idx`` is given."""
+        if idx is not None:
+            path = f"particles[{idx}].{path}" if path else f"particles[{idx}]"
+        line = column = None
+        if self.positions is not None:
+            entry = self.positions.get(id(container)) if container is not None else None
+            if entry is not None:
+                own, children = entry
+                line, column = children.get(key, own) if key is not None else own
+            elif idx is not None:
+                # No marks for this container (e.g. .jsonl rows): fall back to the record.
+                entry = self.positions.get(id(self.particles))
+                if entry is not None and idx in entry[1]:
+                    line, column = entry[1][idx]
+        self.issues.append(ValidationIssue(path, message, line, column))
+
+
+def _is_mapping(value: Any) -> bool:
+    return type(value) is dict or isinstance(value, Mapping)
+
+
+def _type_error(value: Any) -> Optional[str]:
+    """Message for a list/mapping/number where an enum string is expected (None is left to the enum check)."""
+    if value is None or isinstance(value, str):
+        return None
+    return f"must be a string, got {type(value).__name__}"
+
+
+def _check_quark_model(model: Any, exact: Mapping[str, Any], idx: int, out: _Collector) -> None:
+    if not _is_mapping(model):
+        out.add("exact.quark_model", "exact.quark_model must be an object", exact, "quark_model", idx)
+        return
+    mode = model.get("mode")
+    type_error = _type_error(mode)
+    if type_error:
+        out.add("exact.quark_model.mode", f"exact.quark_model.mode {type_error}", model, "mode", idx)
+        return
+    if mode not in _ALLOWED_QMODEL_MODES:
+        out.add("exact.quark_model.mode", f"unknown quark_model.mode: {mode}", model, "mode", idx)
+        return
+
+    if mode == "simple_valence":
+        constituents = model.get("constituents")
+        if type(constituents) is not list or not constituents:
+            out.add(
+                "exact.quark_model.constituents", "simple_valence requires constituents", model, "constituents", idx
+            )
+            return
+        for pos, part in enumerate(constituents):
+            part_path = f"exact.quark_model.constituents[{pos}]"
+            if not _is_mapping(part):
+                out.add(part_path, f"{part_path} must be an object", constituents, pos, idx)
+            elif "quark" not in part or "role" not in part:
+                out.add(part_path, "simple_valence constituent requires quark and role", constituents, pos, idx)
+            elif _type_error(part["role"]):
+                out.add(f"{part_path}.role", f"{part_path}.role {_type_error(part['role'])}", part, "role", idx)
+            elif part["role"] not in _ALLOWED_CONSTITUENT_ROLES:
+                out.add(f"{part_path}.role", _ROLE_MESSAGE, part, "role", idx)
+        return
+
+    terms = model.get("terms")
+    if type(terms) is not list or not terms:
+        out.add("exact.quark_model.terms", "flavor_superposition requires non-empty terms", model, "terms", idx)
+        return
+    for pos, term in enumerate(terms):
+        term_path = f"exact.quark_model.terms[{pos}]"
+        if not _is_mapping(term):
+            out.add(term_path, f"{term_path} must be an object", terms, pos, idx)
+        elif "coefficient" not in term or "pair" not in term:
+            out.add(term_path, "flavor_superposition term requires coefficient and pair", terms, pos, idx)
+        elif not _is_mapping(term["pair"]):
+            out.add(f"{term_path}.pair", f"{term_path}.pair must be an object", term, "pair", idx)
+        elif "quark" not in term["pair"] or "antiquark" not in term["pair"]:
+            out.add(f"{term_path}.pair", "flavor_superposition pair requires quark and antiquark", term, "pair", idx)
+
+
+def _check_record(record: Any, idx: int, particles: list[Any], out: _Collector) -> None:
+    if not _is_mapping(record):
+        out.add("", "particle must be an object", particles, idx, idx)
+        return
+
+    particle_id = record.get("id")
+    if not isinstance(particle_id, str) or not particle_id.strip():
+        out.add("id", "canonical particle missing id", record, "id", idx)
+
+    exact = record.get("exact")
+    if not _is_mapping(exact):
+        out.add("exact", "exact must be an object", record, "exact", idx)
+        return
+
+    missing = () if _REQUIRED_EXACT_SET <= exact.keys() else _REQUIRED_EXACT_SET - exact.keys()
+    if missing:
+        for field in _REQUIRED_EXACT_FIELDS:
+            if field in missing:
+                out.add("exact", _MISSING_EXACT[field], record, "exact", idx)
+
+    for field, message in _STRING_FIELDS:
+        if field in missing:
+            continue
+        value = exact[field]
+        if not isinstance(value, str) or not value.strip():
+            out.add(f"exact.{field}", message, exact, field, idx)
+
+    if "hadron_type" not in missing:
+        type_error = _type_error(exact["hadron_type"])
+        if type_error:
+            out.add("exact.hadron_type", f"exact.hadron_type {type_error}", exact, "hadron_type", idx)
+        elif exact["hadron_type"] not in _ALLOWED_HADRON_TYPES:
+            out.add("exact.hadron_type", _HADRON_TYPE_MESSAGE, exact, "hadron_type", idx)
+
+    if "mass_mev_exact" not in missing:
+        mass = exact["mass_mev_exact"]
+        if not isinstance(mass, (int, float)) or mass <= 0:
+            out.add(
+                "exact.mass_mev_exact", "exact.mass_mev_exact must be a positive number", exact, "mass_mev_exact", idx
+            )
+
+    if "quark_model" not in missing:
+        _check_quark_model(exact["quark_model"], exact, idx, out)
+
+    if "quantum_numbers" not in missing:
+        qnums = exact["quantum_numbers"]
+        if not _is_mapping(qnums):
+            out.add(
+                "exact.quantum_numbers", "exact.quantum_numbers must be an object", exact, "quantum_numbers", idx
+            )
+        elif not _REQUIRED_QNUM_SET <= qnums.keys():
+            for field in _REQUIRED_QNUM_FIELDS:
+                if field not in qnums:
+                    out.add("exact.quantum_numbers", _MISSING_QNUM[field], exact, "quantum_numbers", idx)
+
+    pedagogical = record.get("pedagogical")
+    if pedagogical is None:
+        return
+    if not _is_mapping(pedagogical):
+        out.add("pedagogical", "pedagogical must be an object", record, "pedagogical", idx)
+        return
+    diagram_mode = pedagogical.get("diagram_mode")
+    type_error = _type_error(diagram_mode)
+    if type_error:
+        out.add("pedagogical.diagram_mode", f"pedagogical.diagram_mode {type_error}", pedagogical, "diagram_mode", idx)
+    elif diagram_mode is not None and diagram_mode not in _ALLOWED_DIAGRAM_MODES:
+        out.add("pedagogical.diagram_mode", _DIAGRAM_MODE_MESSAGE, pedagogical, "diagram_mode", idx)
+
+
+def validate_catalog(data: Any, positions: Optional[Positions] = None) -> list[ValidationIssue]:
+    """Every violation in a parsed canonical catalog, in document order per record."""
+    out = _Collector(positions)
+    if not isinstance(data, Mapping):
+        out.add("<root>", "canonical catalog root must be an object")
+        return out.issues
+    if "schema_version" not in data:
+        out.add("<root>", "canonical catalog missing schema_version", data)
+
+    particles = data.get("particles")
+    if not isinstance(particles, list) or not particles:
+        out.add("particles", "canonical catalog 'particles' must be a non-empty list", data, "particles")
+        return out.issues
+
+    out.particles = particles
+    first_index: dict[str, int] = {}
+    for idx, record in enumerate(particles):
+        _check_record(record, idx, particles, out)
+        particle_id = record.get("id") if _is_mapping(record) else None
+        if isinstance(particle_id, str):
+            if particle_id in first_index:
+                out.add(
+                    "id",
+                    f"duplicate particle id {particle_id!r} (first defined at particles[{first_index[particle_id]}])",
+                    record,
+                    "id",
+                    idx,
+                )
+            else:
+                first_index[particle_id] = idx
+    return out.issues
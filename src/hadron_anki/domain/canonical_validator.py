@@ -111,3 +111,20 @@ def validate_particle_record(record: Any) -> None:
     diagram_mode = pedagogical_map.get("diagram_mode")
     if diagram_mode is not None and diagram_mode not in _ALLOWED_DIAGRAM_MODES:
         raise ValueError(f"pedagogical.diagram_mode must be one of: {_ALLOWED_DIAGRAM_MODES}")
+
+
+class ValidatedParticleRecord(dict):
+    """A canonical particle record that already passed ``validate_particle_record``.
+
+    Behaves exactly like the plain record dict; its type is the token that
+    lets the legacy adapter and the derivations skip validating it again.
+    Build one with ``validated_particle_record`` rather than directly.
+    """
+
+
+def validated_particle_record(record: Any) -> ValidatedParticleRecord:
+    """Validate ``record`` once and return it marked as validated."""
+    if isinstance(record, ValidatedParticleRecord):
+        return record
+    validate_particle_record(record)
+    return ValidatedParticleRecord(record)
@@ -0,0 +1,144 @@
+"""
+Columnar view of a canonical catalog with vectorized pedagogical derivations.
+
+``ColumnarCatalog.from_records`` packs the numeric ``exact`` fields (mass and
+the additive quantum numbers) into NumPy arrays once; the ``batch_*``
+functions then derive mass displays, buckets and summaries for the whole
+catalog in one pass. Results are element-for-element identical to the scalar
+functions in ``pedagogical_derivations``.
+
+NumPy is an optional dependency (``pip install hadron-anki[columnar]``).
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Mapping
+
+from hadron_anki.domain.pedagogical_derivations import _as_mapping
+
+_QNUM_COLUMNS = ("charge", "strangeness", "charm", "bottomness")
+
+# Upper bounds (exclusive) of each bucket, as in derive_mass_bucket.
+_BUCKET_EDGES = (200.0, 600.0, 1200.0)
+_BUCKET_LABELS = ("ultralight", "light", "intermediate", "heavy")
+
+
+def _require_numpy():
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError(
+            "The 'numpy' package is required for columnar catalog derivations. "
+            "Install it via `pip install numpy` (or `pip install hadron-anki[columnar]`)."
+        )
+    return np
+
+
+@dataclass(frozen=True)
+class ColumnarCatalog:
+    """Struct-of-arrays view of canonical records, in input order."""
+    ids: list[str]
+    families: list[str]
+    mass: Any
+    charge: Any
+    strangeness: Any
+    charm: Any
+    bottomness: Any
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @classmethod
+    def from_records(cls, records: list[Mapping[str, Any]]) -> "ColumnarCatalog":
+        """Pack ``records`` (validated canonical records) into columns.
+
+        Each column is read with a single comprehension; only when that
+        fails are the records walked again to report the offending index.
+        """
+        np = _require_numpy()
+        try:
+            exacts = [record["exact"] for record in records]
+            quantum_numbers = [exact["quantum_numbers"] for exact in exacts]
+            columns = {
+                key: np.fromiter((qn[key] for qn in quantum_numbers), dtype=np.int64, count=len(records))
+                for key in _QNUM_COLUMNS
+            }
+            mass = np.fromiter(
+                (exact["mass_mev_exact"] for exact in exacts), dtype=np.float64, count=len(records)
+            )
+            ids = [str(record["id"]) for record in records]
+            families = [str(exact["family"]) for exact in exacts]
+        except (KeyError, TypeError, ValueError):
+            _raise_first_invalid(records)
+            raise
+
+        bad = np.flatnonzero(~(mass > 0))
+        if bad.size:
+            raise ValueError(f"records[{int(bad[0])}].exact.mass_mev_exact must be positive number")
+        return cls(ids=ids, families=families, mass=mass, **columns)
+
+
+def _raise_first_invalid(records: list[Mapping[str, Any]]) -> None:
+    for idx, record in enumerate(records):
+        record_map = _as_mapping(record, f"records[{idx}]")
+        if "id" not in record_map:
+            raise ValueError(f"records[{idx}].id is required")
+        exact = _as_mapping(record_map.get("exact"), f"records[{idx}].exact")
+        if "family" not in exact:
+            raise ValueError(f"records[{idx}].exact.family is required")
+        mass = exact.get("mass_mev_exact")
+        if isinstance(mass, bool) or not isinstance(mass, (int, float)):
+            raise ValueError(f"records[{idx}].exact.mass_mev_exact must be positive number")
+        qnums = _as_mapping(exact.get("quantum_numbers"), f"records[{idx}].exact.quantum_numbers")
+        for key in _QNUM_COLUMNS:
+            if not isinstance(qnums.get(key), int):
+                raise ValueError(f"records[{idx}].exact.quantum_numbers.{key} must be an integer")
+
+
+def _check_masses(np, mass) -> None:
+    if mass.size and not bool(np.all(mass > 0)):
+        raise ValueError("mass_mev_exact must be a positive number")
+
+
+def batch_mass_display(mass) -> list[str]:
+    """Vectorized ``derive_mass_display``: nearest MeV below 1 GeV, else nearest 10 MeV."""
+    np = _require_numpy()
+    mass = np.asarray(mass, dtype=np.float64)
+    _check_masses(np, mass)
+    # np.rint rounds half to even, like Python's round().
+    rounded = np.where(mass < 1000, np.rint(mass), np.rint(mass / 10.0) * 10).astype(np.int64)
+    return [f"{value} MeV" for value in rounded.tolist()]
+
+
+def batch_mass_bucket(mass) -> list[str]:
+    """Vectorized ``derive_mass_bucket``."""
+    np = _require_numpy()
+    mass = np.asarray(mass, dtype=np.float64)
+    _check_masses(np, mass)
+    index = np.searchsorted(np.asarray(_BUCKET_EDGES), mass, side="right")
+    return np.asarray(_BUCKET_LABELS)[index].tolist()
+
+
+def batch_mass_summary(mass_buckets: list[str], mass_displays: list[str], mass) -> list[str]:
+    """Batch ``derive_mass_summary`` over parallel bucket/display/mass columns."""
+    np = _require_numpy()
+    mass = np.asarray(mass, dtype=np.float64)
+    _check_masses(np, mass)
+    if not len(mass_buckets) == len(mass_displays) == mass.size:
+        raise ValueError("mass_buckets, mass_displays and mass must have the same length")
+    # "%.2f" is correctly rounded, so it matches f"{round(m, 2):.2f}" exactly.
+    return [
+        f"{bucket} · ≈{display} ({('%.2f' % value).rstrip('0').rstrip('.')} MeV)"
+        for bucket, display, value in zip(mass_buckets, mass_displays, mass.tolist())
+    ]
+
+
+def batch_mass_fields(catalog: ColumnarCatalog) -> dict[str, list[str]]:
+    """Mass display, bucket and summary columns for every record of ``catalog``."""
+    displays = batch_mass_display(catalog.mass)
+    buckets = batch_mass_bucket(catalog.mass)
+    return {
+        "mass_display": displays,
+        "mass_bucket": buckets,
+        "mass_summary": batch_mass_summary(buckets, displays, catalog.mass),
+    }
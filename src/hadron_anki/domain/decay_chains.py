@@ -0,0 +1,151 @@
+"""
+Decay-chain closure: expand decays recursively down to stable final states.
+
+Given the decay modes of each particle (``core_decays.yaml`` shape, see
+``DecayChainEngine.from_decay_catalog``), every chain of a particle is
+enumerated down to particles in ``final_states`` or without decay data:
+
+    engine = DecayChainEngine.from_decay_catalog(load_catalog("catalogs/core_decays.yaml"))
+    chain = engine.chains("xi_minus")[0]
+    format_cascade(chain)   # "Ξ⁻ → Λ⁰ + π⁻ → p + π⁻ + π⁻"
+
+A chain's probability is the product of its branching ratios; chains below
+``threshold`` are pruned. Each particle's chains are computed once and
+memoized, so shared sub-chains (Λ, π, K⁰ decays) are reused and closing a
+whole catalog costs one expansion per particle.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from itertools import product
+from typing import Any, Callable, Iterable, Mapping, Optional, Sequence
+
+from hadron_anki.domain.particle_symbols import display_symbol
+
+# Particles that reach a detector before decaying: chains stop here.
+DEFAULT_FINAL_STATES = frozenset({
+    "proton", "neutron",
+    "pi_plus", "pi_minus",
+    "k_plus", "k_minus",
+})
+
+DecayModes = Mapping[str, Sequence[tuple[Sequence[str], Optional[float]]]]
+
+
+@dataclass(frozen=True)
+class DecayChain:
+    """One decay path: the decays applied depth-first and its probability."""
+    root: str
+    probability: float
+    steps: tuple[tuple[str, tuple[str, ...]], ...]    # (parent, children) per decay
+    final_state: tuple[str, ...]                      # sorted repo IDs
+
+    def stages(self) -> list[list[str]]:
+        """Particle lists from the root to the final state, one decay per stage."""
+        current = [self.root]
+        stages = [list(current)]
+        for parent, children in self.steps:
+            idx = current.index(parent)
+            current = current[:idx] + list(children) + current[idx + 1:]
+            stages.append(list(current))
+        return stages
+
+
+def format_cascade(chain: DecayChain, symbol: Callable[[str], str] = display_symbol) -> str:
+    """A chain as ``"Ξ⁻ → Λ⁰ + π⁻ → p + π⁻ + π⁻"``."""
+    return " → ".join(" + ".join(symbol(pid) for pid in stage) for stage in chain.stages())
+
+
+class DecayChainEngine:
+    """Memoized closure of decay modes down to final states."""
+
+    def __init__(
+        self,
+        modes: DecayModes,
+        final_states: Iterable[str] = DEFAULT_FINAL_STATES,
+        threshold: float = 1e-3,
+    ):
+        """
+        Args:
+            modes: Decay modes per repo ID as ``(children, branching_ratio)``;
+                a ``None`` ratio counts as 1 (exclusive mode).
+            final_states: IDs never expanded. IDs without modes are final too.
+            threshold: Chains (and sub-chains) less likely than this are dropped.
+        """
+        if not 0 <= threshold < 1:
+            raise ValueError("threshold must be in [0, 1)")
+        self.modes = {
+            pid: [(tuple(children), 1.0 if ratio is None else float(ratio)) for children, ratio in pid_modes]
+            for pid, pid_modes in modes.items()
+        }
+        self.final_states = frozenset(final_states)
+        self.threshold = threshold
+        self.expansions = 0
+        self._memo: dict[str, tuple[DecayChain, ...]] = {}
+        self._active: list[str] = []
+
+    @classmethod
+    def from_decay_catalog(cls, decays_by_id: Mapping[str, Any], **kwargs: Any) -> "DecayChainEngine":
+        """Engine over a ``core_decays.yaml`` mapping (``modes`` if listed, else ``main_decay``)."""
+        modes: dict[str, list[tuple[list[str], Optional[float]]]] = {}
+        for pid, entry in decays_by_id.items():
+            if not isinstance(entry, Mapping) or entry.get("stable"):
+                continue
+            listed = entry.get("modes") or ([entry["main_decay"]] if entry.get("main_decay") else [])
+            if listed:
+                modes[pid] = [(list(mode.get("children") or []), mode.get("branching_ratio")) for mode in listed]
+        return cls(modes, **kwargs)
+
+    def is_final(self, pid: str) -> bool:
+        return pid in self.final_states or not self.modes.get(pid)
+
+    def chains(self, pid: str) -> list[DecayChain]:
+        """Every chain of ``pid`` at or above the threshold, most likely first."""
+        return list(self._closure(pid))
+
+    def closure(self, ids: Optional[Iterable[str]] = None) -> dict[str, list[DecayChain]]:
+        """Chains of every ID (default: every particle with decay modes)."""
+        return {pid: self.chains(pid) for pid in (self.modes if ids is None else ids)}
+
+    def final_states_of(self, pid: str) -> dict[tuple[str, ...], float]:
+        """Probability per final state of ``pid``, summed over the chains reaching it."""
+        totals: dict[tuple[str, ...], float] = {}
+        for chain in self._closure(pid):
+            totals[chain.final_state] = totals.get(chain.final_state, 0.0) + chain.probability
+        return dict(sorted(totals.items(), key=lambda item: item[1], reverse=True))
+
+    def _closure(self, pid: str) -> tuple[DecayChain, ...]:
+        cached = self._memo.get(pid)
+        if cached is not None:
+            return cached
+        if self.is_final(pid):
+            result = (DecayChain(pid, 1.0, (), (pid,)),)
+            self._memo[pid] = result
+            return result
+        if pid in self._active:
+            cycle = " -> ".join(self._active[self._active.index(pid):] + [pid])
+            raise ValueError(f"decay cycle: {cycle}")
+
+        self._active.append(pid)
+        try:
+            self.expansions += 1
+            chains: list[DecayChain] = []
+            for children, ratio in self.modes[pid]:
+                if ratio < self.threshold:
+                    continue
+                for parts in product(*(self._closure(child) for child in children)):
+                    probability = ratio
+                    for part in parts:
+                        probability *= part.probability
+                    if probability < self.threshold:
+                        continue
+                    steps = ((pid, children),) + tuple(step for part in parts for step in part.steps)
+                    final_state = tuple(sorted(pid for part in parts for pid in part.final_state))
+                    chains.append(DecayChain(pid, probability, steps, final_state))
+        finally:
+            self._active.pop()
+
+        # sorted() is stable: equally likely chains keep mode order.
+        result = tuple(sorted(chains, key=lambda chain: chain.probability, reverse=True))
+        self._memo[pid] = result
+        return result
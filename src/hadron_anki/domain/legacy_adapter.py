@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Any, Mapping
 
-from hadron_anki.domain.canonical_validator import validate_particle_record
+from hadron_anki.domain.canonical_validator import ValidatedParticleRecord, validate_particle_record
 from hadron_anki.domain.pedagogical_derivations import derive_pedagogical_fields
 from hadron_anki.domain.spec import ParticleSpec
 
@@ -30,8 +30,11 @@ def canonical_to_legacy_particlespec(record: Any) -> ParticleSpec:
 
     Flavor-superposition states (e.g. pi0) carry an empty ``quarks`` list and
     rely on ``display_quark_summary`` / ``diagram_mode`` for rendering.
+    Records already marked ``ValidatedParticleRecord`` (e.g. from the canonical
+    loader) are not validated again.
     """
-    validate_particle_record(record)
+    if not isinstance(record, ValidatedParticleRecord):
+        validate_particle_record(record)
     record_map = _as_mapping(record, "particle")
 
     exact = _as_mapping(record_map["exact"], "exact")
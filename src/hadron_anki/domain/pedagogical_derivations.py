@@ -3,6 +3,8 @@ from __future__ import annotations
 from math import gcd, isqrt
 from typing import Any, Mapping
 
+from hadron_anki.domain.canonical_validator import ValidatedParticleRecord
+
 
 def _as_mapping(value: Any, field_name: str) -> Mapping[str, Any]:
     if not isinstance(value, Mapping):
@@ -226,6 +228,10 @@ def derive_display_quark_summary(record: dict) -> str:
 def derive_mass_rank_in_family(records: list[dict]) -> dict[str, int]:
     family_to_records: dict[str, list[dict]] = {}
     for idx, record in enumerate(records):
+        # Validated records already have a non-empty id/family and a positive mass.
+        if isinstance(record, ValidatedParticleRecord):
+            family_to_records.setdefault(record["exact"]["family"], []).append(record)
+            continue
         record_map = _as_mapping(record, f"records[{idx}]")
         particle_id = record_map.get("id")
         exact = _as_mapping(record_map.get("exact"), f"records[{idx}].exact")
@@ -254,7 +260,41 @@ def derive_mass_rank_in_family(records: list[dict]) -> dict[str, int]:
     return ranks
 
 
-def derive_pedagogical_fields(record: dict, family_records: list[dict] | None = None) -> dict:
+def derive_family_mass_ranks(records: list[dict]) -> dict[str, dict[str, int]]:
+    """Mass ranks for every family at once: family -> {particle id -> rank}.
+
+    Each family is grouped and sorted exactly once, so the whole catalog costs
+    O(n log n) instead of re-sorting a family for each of its members.
+    """
+    family_to_records: dict[str, list[dict]] = {}
+    for idx, record in enumerate(records):
+        if isinstance(record, ValidatedParticleRecord):
+            family_to_records.setdefault(record["exact"]["family"], []).append(record)
+            continue
+        record_map = _as_mapping(record, f"records[{idx}]")
+        exact = _as_mapping(record_map.get("exact"), f"records[{idx}].exact")
+        family = exact.get("family")
+        if not isinstance(family, str) or not family.strip():
+            raise ValueError(f"records[{idx}].exact.family must be non-empty string")
+        family_to_records.setdefault(family, []).append(record_map)
+
+    return {
+        family: derive_mass_rank_in_family(family_records)
+        for family, family_records in family_to_records.items()
+    }
+
+
+def derive_pedagogical_fields(
+    record: dict,
+    family_records: list[dict] | None = None,
+    family_ranks: dict[str, int] | None = None,
+) -> dict:
+    """Derive the pedagogical block for one record.
+
+    The optional mass rank comes from ``family_ranks`` (a precomputed
+    ``derive_family_mass_ranks`` entry) or, failing that, from ranking
+    ``family_records`` on the spot.
+    """
     record_map = _as_mapping(record, "record")
     exact = _as_mapping(record_map.get("exact"), "exact")
 
@@ -272,8 +312,10 @@ def derive_pedagogical_fields(record: dict, family_records: list[dict] | None =
         "display_quark_summary": derive_display_quark_summary(record_map),
     }
 
-    if family_records is not None:
+    rank_map = family_ranks
+    if rank_map is None and family_records is not None:
         rank_map = derive_mass_rank_in_family(family_records)
+    if rank_map is not None:
         particle_id = record_map.get("id")
         if particle_id in rank_map:
             derived["mass_rank_in_family"] = rank_map[particle_id]
@@ -282,22 +324,13 @@ def derive_pedagogical_fields(record: dict, family_records: list[dict] | None =
 
 
 def derive_catalog_pedagogical_fields(records: list[dict]) -> list[dict]:
-    family_to_records: dict[str, list[dict]] = {}
-    for idx, record in enumerate(records):
-        record_map = _as_mapping(record, f"records[{idx}]")
-        exact = _as_mapping(record_map.get("exact"), f"records[{idx}].exact")
-        family = exact.get("family")
-        if not isinstance(family, str) or not family.strip():
-            raise ValueError(f"records[{idx}].exact.family must be non-empty string")
-        family_to_records.setdefault(family, []).append(record_map)
+    ranks_by_family = derive_family_mass_ranks(records)
 
     enriched: list[dict] = []
     for idx, record in enumerate(records):
         record_map = _as_mapping(record, f"records[{idx}]")
-        exact = _as_mapping(record_map.get("exact"), f"records[{idx}].exact")
-        family = str(exact["family"])
-        family_records = family_to_records[family]
+        family = str(record_map["exact"]["family"])
         out = dict(record_map)
-        out["pedagogical"] = derive_pedagogical_fields(record_map, family_records=family_records)
+        out["pedagogical"] = derive_pedagogical_fields(record_map, family_ranks=ranks_by_family[family])
         enriched.append(out)
     return enriched
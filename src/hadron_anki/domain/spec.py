@@ -20,4 +20,6 @@ class ParticleSpec:
     display_quark_summary: Optional[str] = None
     diagram_mode: Optional[str] = None
     decay: Optional[dict] = None
+    # Several decay modes (highest branching ratio first) when the decay data lists them.
+    decay_modes: Optional[list[dict]] = None
 
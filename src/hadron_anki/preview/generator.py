@@ -8,7 +8,9 @@ from pathlib import Path
 from hadron_anki.cards.styles import CARD_CSS
 from hadron_anki.cards.mapping import generate_cards
 from hadron_anki.domain.spec import ParticleSpec
-from hadron_anki.render.svg import render_svg
+from hadron_anki.render.batch import render_specs
+from hadron_anki.render.cache import RenderCache
+from hadron_anki.render.config import get_style_config
 from hadron_anki.render.feynman import render_feynman_svg
 from typing import Any, Optional
 
@@ -74,15 +76,35 @@ def generate_preview(
     specs: list[ParticleSpec], 
     output_dir: str | Path, 
     card_types: Optional[list[str]] = None,
-    feynman_html: Optional[list[str]] = None
+    feynman_html: Optional[list[str]] = None,
+    style: Optional[dict[str, Any]] = None,
+    cache: Optional[RenderCache] = None,
+    jobs: int = 1,
 ) -> None:
-    """Generates SVG files and a styled preview gallery grouped by semantic card subsets."""
+    """Generates SVG files and a styled preview gallery grouped by semantic card subsets.
+
+    ``style`` is resolved once (cached ``get_style_config``) and reused for
+    every rendered SVG; ``cache`` optionally serves unchanged SVGs from disk.
+    Each SVG is rendered once (in ``jobs`` worker processes when ``jobs > 1``)
+    and then written to every section that shows it.
+    """
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
 
     sorted_specs = sorted(specs, key=lambda s: s.id)
     sections = ["mass", "composition", "identity"]
 
+    with_summary = card_types is not None and "summary" in card_types
+    summary_dir = output_path / "summary"
+    rendered = render_specs(
+        sorted_specs,
+        math_cache_dir=summary_dir if with_summary else None,
+        style=style,
+        cache=cache,
+        jobs=jobs,
+        decays=with_summary,
+    )
+
     # Write SVG files into semantic subdirectories
     for section in sections:
         if card_types is not None and section not in card_types:
@@ -90,7 +112,7 @@ def generate_preview(
         section_dir = output_path / section
         section_dir.mkdir(exist_ok=True)
         for spec in sorted_specs:
-            svg_content = render_svg(spec)
+            svg_content = rendered.composition[spec.id]
             (section_dir / f"{spec.id}.svg").write_text(svg_content, encoding="utf-8")
 
     # Build card pairs HTML grouped by section
@@ -119,18 +141,17 @@ def generate_preview(
         grouped_html.append("</div>")
 
     # Summary cards (the big descriptive card) — opt-in via card_types.
-    if card_types is not None and "summary" in card_types:
-        summary_dir = output_path / "summary"
+    if with_summary:
         summary_dir.mkdir(exist_ok=True)
         grouped_html.append("<h2>Summary Cards</h2>")
         grouped_html.append('<div class="gallery">')
         for spec in sorted_specs:
-            (summary_dir / f"{spec.id}.svg").write_text(render_svg(spec), encoding="utf-8")
+            (summary_dir / f"{spec.id}.svg").write_text(rendered.composition[spec.id], encoding="utf-8")
             decay_svg_filename = None
-            if spec.decay_diagram:
+            if spec.id in rendered.decay:
                 decay_svg_filename = f"summary/{spec.id}_decay.svg"
                 (summary_dir / f"{spec.id}_decay.svg").write_text(
-                    render_feynman_svg(spec.decay_diagram, math_cache_dir=summary_dir),
+                    rendered.decay[spec.id],
                     encoding="utf-8",
                 )
             cards = generate_cards(
@@ -175,6 +196,7 @@ def generate_preview(
 def generate_feynman_preview(
     feynman_specs: list[dict[str, Any]],
     output_dir: str | Path,
+    cache: Optional[RenderCache] = None,
 ) -> list[str]:
     """
     Renders Feynman diagram SVGs into output_dir/feynman/{id}.svg.
@@ -184,6 +206,8 @@ def generate_feynman_preview(
         id: str
         label: str          (human-readable particle / process name)
         decay_diagram: dict  (nodes + edges schema)
+
+    ``cache`` is an optional persistent render cache.
     """
     output_path = Path(output_dir)
     feynman_dir = output_path / "feynman"
@@ -197,7 +221,7 @@ def generate_feynman_preview(
 
     for spec in feynman_sorted:
         diagram_spec = spec.get("decay_diagram", {})
-        svg_content = render_feynman_svg(diagram_spec, math_cache_dir=feynman_dir)
+        svg_content = render_feynman_svg(diagram_spec, math_cache_dir=feynman_dir, cache=cache)
         fname = f"{spec['id']}.svg"
         (feynman_dir / fname).write_text(svg_content, encoding="utf-8")
 
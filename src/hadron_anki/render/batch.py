@@ -0,0 +1,132 @@
+"""
+Batch rendering of composition and Feynman SVGs, optionally in a process pool.
+
+Workers receive the resolved style (and render-cache settings) once through
+the pool initializer and return SVG strings only. Callers write files from the
+returned dicts in sorted id order, so output bytes never depend on ``jobs``.
+"""
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Optional
+
+from hadron_anki.domain.spec import ParticleSpec
+from hadron_anki.render.cache import RenderCache
+from hadron_anki.render.config import get_style_config
+from hadron_anki.render.feynman import render_feynman_svg
+from hadron_anki.render.svg import render_svg
+
+
+@dataclass
+class RenderedSVGs:
+    """SVG strings keyed by particle id."""
+    composition: dict[str, str] = field(default_factory=dict)
+    decay: dict[str, str] = field(default_factory=dict)
+
+
+# Per-worker state, set once by _init_worker.
+_WORKER_STYLE: Optional[dict[str, Any]] = None
+_WORKER_CACHE: Optional[RenderCache] = None
+
+
+def _init_worker(style: dict[str, Any], cache_config: Optional[tuple[str, int]]) -> None:
+    global _WORKER_STYLE, _WORKER_CACHE
+    _WORKER_STYLE = style
+    _WORKER_CACHE = RenderCache(*cache_config) if cache_config else None
+
+
+def _render_one(
+    spec: ParticleSpec,
+    math_cache_dir: Optional[str],
+    decays: bool,
+    style: dict[str, Any],
+    cache: Optional[RenderCache],
+) -> tuple[str, Optional[str]]:
+    svg = render_svg(spec, style, cache=cache)
+    decay_svg = None
+    if decays and spec.decay_diagram:
+        decay_svg = render_feynman_svg(
+            spec.decay_diagram, math_cache_dir=math_cache_dir, cache=cache
+        )
+    return svg, decay_svg
+
+
+_MERGED_STATS = ("hits", "misses", "writes", "evictions")
+
+
+def _stat_counts(cache: Optional[RenderCache]) -> tuple[int, ...]:
+    if cache is None:
+        return (0,) * len(_MERGED_STATS)
+    return tuple(getattr(cache.stats, name) for name in _MERGED_STATS)
+
+
+def _render_task(
+    task: tuple[ParticleSpec, Optional[str], bool],
+) -> tuple[str, Optional[str], tuple[int, ...]]:
+    spec, math_cache_dir, decays = task
+    cache = _WORKER_CACHE
+    before = _stat_counts(cache)
+    svg, decay_svg = _render_one(spec, math_cache_dir, decays, _WORKER_STYLE, cache)
+    after = _stat_counts(cache)
+    return svg, decay_svg, tuple(a - b for a, b in zip(after, before))
+
+
+def render_specs(
+    specs: list[ParticleSpec],
+    math_cache_dir: Optional[str | Path] = None,
+    style: Optional[dict[str, Any]] = None,
+    cache: Optional[RenderCache] = None,
+    jobs: int = 1,
+    decays: bool = True,
+) -> RenderedSVGs:
+    """
+    Render the composition SVG and (if any) Feynman decay SVG of every spec.
+
+    Args:
+        specs: Particles to render; duplicates by id are rendered once.
+        math_cache_dir: Directory for math label assets of Feynman labels.
+        style: Resolved style config, defaults to ``get_style_config()``.
+        cache: Optional persistent render cache. Workers open their own
+            handle on the same directory; hit, miss, write and eviction
+            counts are merged back.
+        jobs: Number of worker processes; ``1`` renders in-process.
+        decays: Also render Feynman decay SVGs for specs with a diagram.
+    """
+    if jobs < 1:
+        raise ValueError("jobs must be >= 1")
+    if style is None:
+        style = get_style_config()
+
+    unique = {spec.id: spec for spec in specs}
+    ordered = [unique[pid] for pid in sorted(unique)]
+    math_dir = str(math_cache_dir) if math_cache_dir is not None else None
+
+    out = RenderedSVGs()
+    if jobs == 1 or len(ordered) < 2:
+        for spec in ordered:
+            svg, decay_svg = _render_one(spec, math_dir, decays, style, cache)
+            out.composition[spec.id] = svg
+            if decay_svg is not None:
+                out.decay[spec.id] = decay_svg
+        return out
+
+    cache_config = (str(cache.cache_dir), cache.max_bytes) if cache is not None else None
+    tasks = [(spec, math_dir, decays) for spec in ordered]
+    chunksize = max(1, len(tasks) // (jobs * 4))
+    with ProcessPoolExecutor(
+        max_workers=jobs, initializer=_init_worker, initargs=(style, cache_config)
+    ) as pool:
+        results = list(pool.map(_render_task, tasks, chunksize=chunksize))
+
+    for spec, (svg, decay_svg, deltas) in zip(ordered, results):
+        out.composition[spec.id] = svg
+        if decay_svg is not None:
+            out.decay[spec.id] = decay_svg
+        if cache is not None:
+            for name, delta in zip(_MERGED_STATS, deltas):
+                setattr(cache.stats, name, getattr(cache.stats, name) + delta)
+    if cache is not None:
+        cache.rescan()
+    return out
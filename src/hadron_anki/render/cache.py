@@ -0,0 +1,165 @@
+"""
+Persistent content-addressed cache for rendered SVGs.
+
+Entries are keyed by a SHA-256 over the renderer name, renderer version and a
+JSON payload of every render input (spec fields, resolved style, ...). Editing
+one particle therefore only invalidates that particle's entries.
+
+Layout:
+    cache_dir/<key[:2]>/<key>.svg
+
+The cache is bounded by ``max_bytes``; once exceeded, the least recently used
+entries (oldest mtime, refreshed on every hit) are evicted until the cache is
+back under ``EVICT_TO`` of the bound, so a full cache is not rescanned on
+every write.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+
+DEFAULT_CACHE_DIR = ".cache/render"
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+EVICT_TO = 0.9
+
+
+@dataclass
+class RenderCacheStats:
+    hits: int = 0
+    misses: int = 0
+    writes: int = 0
+    evictions: int = 0
+    entries: int = 0
+    bytes: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+def render_cache_key(renderer: str, version: str, payload: Any) -> str:
+    """Stable hex key for a render call; ``payload`` must be JSON-serializable."""
+    blob = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    raw = f"{renderer}|{version}|{blob}".encode("utf-8")
+    return hashlib.sha256(raw).hexdigest()
+
+
+class RenderCache:
+    """Size-bounded on-disk LRU of rendered SVG strings."""
+
+    def __init__(self, cache_dir: str | Path = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES):
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.low_water = int(max_bytes * EVICT_TO)
+        self.stats = RenderCacheStats()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.rescan()
+
+    def rescan(self) -> None:
+        """Recount entries and bytes from disk (e.g. after other processes wrote)."""
+        self.stats.entries = 0
+        self.stats.bytes = 0
+        for path in self._entry_paths():
+            try:
+                size = path.stat().st_size
+            except FileNotFoundError:
+                continue
+            self.stats.entries += 1
+            self.stats.bytes += size
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.svg"
+
+    def _entry_paths(self) -> list[Path]:
+        return list(self.cache_dir.glob("??/*.svg"))
+
+    def __contains__(self, key: str) -> bool:
+        """Whether ``key`` has an entry, without counting a hit or miss."""
+        return self._path(key).is_file()
+
+    def get(self, key: str) -> Optional[str]:
+        path = self._path(key)
+        try:
+            svg = path.read_text(encoding="utf-8")
+        except OSError:
+            self.stats.misses += 1
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        self.stats.hits += 1
+        return svg
+
+    def put(self, key: str, svg: str) -> None:
+        path = self._path(key)
+        data = svg.encode("utf-8")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        previous = path.stat().st_size if path.exists() else None
+
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+
+        self.stats.writes += 1
+        if previous is None:
+            self.stats.entries += 1
+            self.stats.bytes += len(data)
+        else:
+            self.stats.bytes += len(data) - previous
+        if self.stats.bytes > self.max_bytes:
+            self._evict(keep=path)
+
+    def get_or_render(self, key: str, render) -> str:
+        """Return the cached SVG for ``key``, calling ``render()`` on a miss."""
+        svg = self.get(key)
+        if svg is None:
+            svg = render()
+            self.put(key, svg)
+        return svg
+
+    def _evict(self, keep: Path) -> None:
+        entries = []
+        for path in self._entry_paths():
+            try:
+                st = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((st.st_mtime_ns, str(path), st.st_size))
+        entries.sort()
+
+        for _, path_str, size in entries:
+            if self.stats.bytes <= self.low_water:
+                break
+            if path_str == str(keep):
+                continue
+            try:
+                os.remove(path_str)
+            except FileNotFoundError:
+                continue
+            self.stats.entries -= 1
+            self.stats.bytes -= size
+            self.stats.evictions += 1
+
+    def clear(self) -> None:
+        for path in self._entry_paths():
+            path.unlink()
+        self.stats.entries = 0
+        self.stats.bytes = 0
+
+    def report(self) -> str:
+        s = self.stats
+        return (
+            f"render cache {self.cache_dir}: "
+            f"{s.hits} hits, {s.misses} misses ({s.hit_rate:.0%} hit rate), "
+            f"{s.writes} writes, {s.evictions} evictions, "
+            f"{s.entries} entries / {s.bytes} of {self.max_bytes} bytes"
+        )
@@ -1,3 +1,5 @@
+import copy
+import hashlib
 import json
 import re
 from pathlib import Path
@@ -54,7 +56,7 @@ def load_style_config(path: str | None = None) -> dict[str, Any]:
 
     p = Path(path)
     if not p.exists():
-        return DEFAULT_STYLE.copy()
+        return copy.deepcopy(DEFAULT_STYLE)
 
     try:
         text = p.read_text(encoding="utf-8")
@@ -62,11 +64,56 @@ def load_style_config(path: str | None = None) -> dict[str, Any]:
         data = json.loads(clean_text)
 
         if not isinstance(data, dict):
-            return DEFAULT_STYLE.copy()
+            return copy.deepcopy(DEFAULT_STYLE)
 
-        return _deep_merge(DEFAULT_STYLE, data)
+        return _deep_merge(copy.deepcopy(DEFAULT_STYLE), data)
     except Exception:
-        return DEFAULT_STYLE.copy()
+        return copy.deepcopy(DEFAULT_STYLE)
+
+
+# Resolved path -> ((mtime_ns, size), content sha256, merged style).
+_STYLE_CACHE: dict[str, tuple[tuple[int, int], str, dict[str, Any]]] = {}
+
+
+def get_style_config(path: str | None = None) -> dict[str, Any]:
+    """
+    Cached variant of ``load_style_config`` for per-build use.
+
+    The file is re-read only when its mtime or size changes, and re-parsed only
+    when its content hash changes. Every call returns its own deep copy, so a
+    caller mutating its style cannot affect the cache or other callers.
+    """
+    if path is None:
+        path = "hadron.json"
+
+    p = Path(path).resolve()
+    key = str(p)
+    try:
+        st = p.stat()
+    except OSError:
+        _STYLE_CACHE.pop(key, None)
+        return copy.deepcopy(DEFAULT_STYLE)
+
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _STYLE_CACHE.get(key)
+    if cached is not None and cached[0] == stamp:
+        return copy.deepcopy(cached[2])
+
+    try:
+        digest = hashlib.sha256(p.read_bytes()).hexdigest()
+    except OSError:
+        return copy.deepcopy(DEFAULT_STYLE)
+    if cached is not None and cached[1] == digest:
+        style = cached[2]
+    else:
+        style = load_style_config(key)
+    _STYLE_CACHE[key] = (stamp, digest, style)
+    return copy.deepcopy(style)
+
+
+def clear_style_cache() -> None:
+    """Drop every cached style so the next ``get_style_config`` reloads from disk."""
+    _STYLE_CACHE.clear()
 
 
 def get_flavor_color(style: dict[str, Any], token: str, color_key: str = "base") -> str:
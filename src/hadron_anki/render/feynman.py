@@ -18,10 +18,17 @@ Schema:
 
 import math
 import re
+from collections import OrderedDict
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Optional
 
-from hadron_anki.render.math_labels import generate_math_label_asset
+from hadron_anki.render.cache import RenderCache, render_cache_key
+from hadron_anki.render.math_labels import DEFAULT_BACKEND, MathLabelSpec, generate_math_label_asset
+
+
+# Bump whenever the SVG output changes for identical inputs (invalidates RenderCache).
+RENDERER_VERSION = "1"
 
 
 # ── SVG canvas constants ─────────────────────────────────────────────
@@ -38,6 +45,86 @@ _COL_VERT  = "#ffffff"
 _COL_VBRD  = "#2d2a26"
 
 
+# ── Parsed math-label fragments (process-wide LRU) ──────────────────
+
+@dataclass(frozen=True)
+class _LabelFragment:
+    vb_w: float
+    vb_h: float
+    inner: str
+
+
+_FRAGMENT_CACHE_SIZE = 512
+# MathLabelSpec.cache_key -> parsed fragment, most recently used last.
+_FRAGMENT_CACHE: "OrderedDict[str, _LabelFragment]" = OrderedDict()
+# (cache dir, asset filename) pairs written or verified on disk in this
+# process; trusted without touching the filesystem again.
+_MATERIALIZED: set[tuple[str, str]] = set()
+
+
+def clear_label_fragment_cache() -> None:
+    """
+    Forget parsed label fragments and which cache dirs hold their assets.
+
+    Call this after deleting or emptying a math cache dir that is rendered into
+    again, so its assets are re-created.
+    """
+    _FRAGMENT_CACHE.clear()
+    _MATERIALIZED.clear()
+
+
+def _ensure_label_asset(spec: MathLabelSpec, math_cache_dir: str | Path) -> Optional[Path]:
+    """Write the label asset into ``math_cache_dir`` unless it is known to be there; None if it was."""
+    marker = (str(math_cache_dir), spec.filename)
+    if marker in _MATERIALIZED:
+        return None
+    asset_path = generate_math_label_asset(
+        spec.expr_tex, cache_dir=math_cache_dir, backend=spec.backend, font_size=spec.font_size
+    )
+    _MATERIALIZED.add(marker)
+    return asset_path
+
+
+def _parse_label_asset(asset_svg: str) -> _LabelFragment:
+    vb_match = re.search(r'viewBox="([^"]+)"', asset_svg)
+    vb = vb_match.group(1) if vb_match else "0 0 120 40"
+    _vb_parts = vb.split()
+    vb_w = float(_vb_parts[2]) if len(_vb_parts) == 4 else 120.0
+    vb_h = float(_vb_parts[3]) if len(_vb_parts) == 4 else 40.0
+
+    svg_start = asset_svg.find("<svg")
+    content_start = asset_svg.find(">", svg_start) + 1
+    content_end = asset_svg.rfind("</svg>")
+    inner_content = asset_svg[content_start:content_end] if (content_start > 0 and content_end > 0) else ""
+    return _LabelFragment(vb_w=vb_w, vb_h=vb_h, inner=inner_content)
+
+
+def _label_fragment(label_tex: str, math_cache_dir: str | Path) -> _LabelFragment:
+    """
+    Parsed viewBox + inner markup for a math label.
+
+    Repeated labels are served from the in-memory LRU without filesystem I/O;
+    the asset file is only touched the first time a label is seen for a given
+    cache directory.
+    """
+    spec = MathLabelSpec(expr_tex=label_tex)
+    key = spec.cache_key
+    fragment = _FRAGMENT_CACHE.get(key)
+    if fragment is not None:
+        _FRAGMENT_CACHE.move_to_end(key)
+        _ensure_label_asset(spec, math_cache_dir)
+        return fragment
+
+    asset_path = _ensure_label_asset(spec, math_cache_dir)
+    if asset_path is None:
+        asset_path = Path(math_cache_dir) / spec.filename
+    fragment = _parse_label_asset(asset_path.read_text(encoding="utf-8"))
+    _FRAGMENT_CACHE[key] = fragment
+    if len(_FRAGMENT_CACHE) > _FRAGMENT_CACHE_SIZE:
+        _FRAGMENT_CACHE.popitem(last=False)
+    return fragment
+
+
 # ── Helpers ─────────────────────────────────────────────────────────
 
 def _esc(text: str) -> str:
@@ -130,7 +217,20 @@ def _scalar_line(x1: float, y1: float, x2: float, y2: float) -> str:
 
 # ── Public renderer ──────────────────────────────────────────────────
 
-def render_feynman_svg(diagram_spec: dict[str, Any], math_cache_dir: Optional[str | Path] = None) -> str:
+def feynman_cache_key(diagram_spec: dict[str, Any], math_labels: bool) -> str:
+    """Content key of a render: diagram, label backend, renderer version."""
+    payload = {
+        "diagram": diagram_spec,
+        "math_labels": DEFAULT_BACKEND if math_labels else None,
+    }
+    return render_cache_key("feynman", RENDERER_VERSION, payload)
+
+
+def render_feynman_svg(
+    diagram_spec: dict[str, Any],
+    math_cache_dir: Optional[str | Path] = None,
+    cache: Optional[RenderCache] = None,
+) -> str:
     """
     Render a Feynman diagram to an SVG string.
 
@@ -138,10 +238,25 @@ def render_feynman_svg(diagram_spec: dict[str, Any], math_cache_dir: Optional[st
         diagram_spec: dict with 'nodes' and 'edges' keys.
         math_cache_dir: (Optional) If provided, edges with 'label_tex' will be
                         rendered as formal SVG assets in this directory and referenced.
+        cache: (Optional) Persistent render cache keyed by diagram and
+               renderer version. Math label assets are still materialized in
+               ``math_cache_dir`` on a hit.
 
     Returns:
         UTF-8 SVG string.
     """
+    if cache is not None:
+        key = feynman_cache_key(diagram_spec, math_labels=bool(math_cache_dir))
+        svg = cache.get_or_render(key, lambda: _render(diagram_spec, math_cache_dir))
+        if math_cache_dir:
+            for edge in diagram_spec.get("edges", []):
+                if edge.get("label_tex"):
+                    _ensure_label_asset(MathLabelSpec(expr_tex=edge["label_tex"]), math_cache_dir)
+        return svg
+    return _render(diagram_spec, math_cache_dir)
+
+
+def _render(diagram_spec: dict[str, Any], math_cache_dir: Optional[str | Path]) -> str:
     nodes_raw: list[dict] = diagram_spec.get("nodes", [])
     edges_raw: list[dict] = diagram_spec.get("edges", [])
 
@@ -177,20 +292,8 @@ def render_feynman_svg(diagram_spec: dict[str, Any], math_cache_dir: Optional[st
         lx, ly = _label_offset(x1, y1, x2, y2)
         if label_tex and math_cache_dir:
             # Render and cache the formal math label asset (preserves Anki asset reuse)
-            asset_path = generate_math_label_asset(label_tex, cache_dir=math_cache_dir)
-            
-            asset_svg = asset_path.read_text(encoding="utf-8")
-
-            vb_match = re.search(r'viewBox="([^"]+)"', asset_svg)
-            vb = vb_match.group(1) if vb_match else "0 0 120 40"
-            _vb_parts = vb.split()
-            vb_w = float(_vb_parts[2]) if len(_vb_parts) == 4 else 120.0
-            vb_h = float(_vb_parts[3]) if len(_vb_parts) == 4 else 40.0
-
-            svg_start = asset_svg.find("<svg")
-            content_start = asset_svg.find(">", svg_start) + 1
-            content_end = asset_svg.rfind("</svg>")
-            inner_content = asset_svg[content_start:content_end] if (content_start > 0 and content_end > 0) else ""
+            fragment = _label_fragment(label_tex, math_cache_dir)
+            vb_w, vb_h, inner_content = fragment.vb_w, fragment.vb_h, fragment.inner
 
             # Math labels scale neatly into a centered bounding box.
             # Flattened via <g transform> instead of a nested <svg> viewport
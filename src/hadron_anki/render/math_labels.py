@@ -16,6 +16,7 @@ Backends (selectable via `backend` parameter):
 from __future__ import annotations
 
 import hashlib
+import os
 import re
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -104,7 +105,9 @@ def generate_math_label_asset(
     """
     Render a TeX expression and cache the resulting SVG to the filesystem.
 
-    If the file already exists (cache hit), the file is NOT overwritten.
+    If the file already exists (cache hit), the file is NOT overwritten. New
+    assets are written atomically so concurrent renderers never read a
+    partially written file.
 
     Args:
         expr_tex  : TeX expression string
@@ -122,7 +125,9 @@ def generate_math_label_asset(
     asset_path = cache_path / spec.filename
     if not asset_path.exists():
         svg = render_math_label_svg(expr_tex, backend=backend, font_size=font_size)
-        asset_path.write_text(svg, encoding="utf-8")
+        tmp_path = asset_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(svg, encoding="utf-8")
+        os.replace(tmp_path, asset_path)
 
     return asset_path
 
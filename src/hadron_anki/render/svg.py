@@ -1,7 +1,11 @@
 from typing import Any
 from hadron_anki.domain.spec import ParticleSpec
 from hadron_anki.domain.composer import format_quark_display
-from hadron_anki.render.config import load_style_config, node_svg_attrs, DEFAULT_STYLE
+from hadron_anki.render.cache import RenderCache, render_cache_key
+from hadron_anki.render.config import get_style_config, node_svg_attrs, DEFAULT_STYLE
+
+# Bump whenever the SVG output changes for identical inputs (invalidates RenderCache).
+RENDERER_VERSION = "1"
 
 def _escape_text(text: str) -> str:
     return (
@@ -59,11 +63,35 @@ def _render_baryon(quarks: list[str], style: dict[str, Any]) -> str:
     return "".join(lines) + "".join(nodes)
 
 
-def render_svg(spec: ParticleSpec, style: dict[str, Any] | None = None) -> str:
-    """Renders a ParticleSpec to an SVG string."""
+def render_inputs(spec: ParticleSpec) -> dict[str, Any]:
+    """The ParticleSpec fields that affect ``render_svg`` output."""
+    return {"id": spec.id, "name": spec.name, "type": spec.type, "quarks": list(spec.quarks)}
+
+
+def composition_cache_key(spec: ParticleSpec, style: dict[str, Any]) -> str:
+    """Content key of ``render_svg(spec, style)``: render inputs, style, renderer version."""
+    payload = {"spec": render_inputs(spec), "style": style}
+    return render_cache_key("composition", RENDERER_VERSION, payload)
+
+
+def render_svg(
+    spec: ParticleSpec,
+    style: dict[str, Any] | None = None,
+    cache: RenderCache | None = None,
+) -> str:
+    """Renders a ParticleSpec to an SVG string.
+
+    With a ``cache``, output is looked up by (render inputs, style, renderer
+    version) and only rendered on a miss.
+    """
     if style is None:
-        style = load_style_config()
+        style = get_style_config()
+    if cache is not None:
+        return cache.get_or_render(composition_cache_key(spec, style), lambda: _render(spec, style))
+    return _render(spec, style)
+
 
+def _render(spec: ParticleSpec, style: dict[str, Any]) -> str:
     if spec.type == "meson" and len(spec.quarks) == 2:
         body = _render_meson(spec.quarks, style)
     elif spec.type == "baryon" and len(spec.quarks) == 3:
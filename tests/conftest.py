@@ -6,3 +6,10 @@ import pathlib
 def catalog_min():
     path = pathlib.Path(__file__).parent / "fixtures" / "catalog_min.yaml"
     return yaml.safe_load(path.read_text())
+
+
+@pytest.fixture(autouse=True)
+def _compiled_cache_dir(tmp_path_factory, monkeypatch):
+    """Keep compiled-catalog pickles out of the repository during tests."""
+    from hadron_anki.catalog import compiled
+    monkeypatch.setattr(compiled, "CACHE_DIR", tmp_path_factory.getbasetemp() / "compiled")
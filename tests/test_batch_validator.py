@@ -0,0 +1,180 @@
+from copy import deepcopy
+
+import pytest
+import yaml
+
+from hadron_anki.catalog.canonical_loader import validate_catalog_file, write_canonical_jsonl
+from hadron_anki.domain.batch_validator import validate_catalog
+from hadron_anki.domain.canonical_validator import validate_particle_record
+
+
+def _load_example() -> dict:
+    with open("data/examples/hadron_schema_example.yaml", "r", encoding="utf-8") as f:
+        return yaml.safe_load(f)
+
+
+def _proton() -> dict:
+    return deepcopy(next(p for p in _load_example()["particles"] if p["id"] == "proton"))
+
+
+def _pi0() -> dict:
+    return deepcopy(next(p for p in _load_example()["particles"] if p["id"] == "pi0"))
+
+
+def _set(path, value):
+    def mutate(record):
+        *parents, last = path
+        target = record
+        for key in parents:
+            target = target[key]
+        if value is _DELETE:
+            del target[last]
+        else:
+            target[last] = value
+        return record
+    return mutate
+
+
+_DELETE = object()
+
+MUTATIONS = {
+    "not_a_mapping": lambda r: ["proton"],
+    "missing_id": _set(("id",), _DELETE),
+    "blank_id": _set(("id",), "  "),
+    "exact_not_mapping": _set(("exact",), "nope"),
+    "missing_family": _set(("exact", "family"), _DELETE),
+    "empty_symbol": _set(("exact", "symbol"), ""),
+    "bad_hadron_type": _set(("exact", "hadron_type"), "lepton"),
+    "negative_mass": _set(("exact", "mass_mev_exact"), -1),
+    "string_mass": _set(("exact", "mass_mev_exact"), "938"),
+    "bad_mode": _set(("exact", "quark_model", "mode"), "bag"),
+    "no_constituents": _set(("exact", "quark_model", "constituents"), []),
+    "constituent_not_mapping": _set(("exact", "quark_model", "constituents", 0), "u"),
+    "constituent_without_role": _set(("exact", "quark_model", "constituents", 1, "role"), _DELETE),
+    "bad_role": _set(("exact", "quark_model", "constituents", 2, "role"), "gluon"),
+    "qnums_not_mapping": _set(("exact", "quantum_numbers"), 3),
+    "missing_charge": _set(("exact", "quantum_numbers", "charge"), _DELETE),
+    "pedagogical_not_mapping": _set(("pedagogical",), "x"),
+    "bad_diagram_mode": _set(("pedagogical", "diagram_mode"), "cube"),
+}
+
+
+@pytest.mark.parametrize("name", sorted(MUTATIONS))
+def test_first_issue_matches_scalar_validator(name):
+    record = MUTATIONS[name](_proton())
+    with pytest.raises(ValueError) as excinfo:
+        validate_particle_record(record)
+
+    issues = validate_catalog({"schema_version": 1, "particles": [record]})
+    assert issues
+    assert issues[0].message == str(excinfo.value)
+
+
+@pytest.mark.parametrize(
+    "mutate",
+    [
+        _set(("exact", "quark_model", "terms"), []),
+        _set(("exact", "quark_model", "terms", 0, "pair"), "uu"),
+        _set(("exact", "quark_model", "terms", 1, "pair", "antiquark"), _DELETE),
+        _set(("exact", "quark_model", "terms", 0, "coefficient"), _DELETE),
+    ],
+)
+def test_flavor_superposition_issues_match_scalar_validator(mutate):
+    record = mutate(_pi0())
+    with pytest.raises(ValueError) as excinfo:
+        validate_particle_record(record)
+    assert validate_catalog({"schema_version": 1, "particles": [record]})[0].message == str(excinfo.value)
+
+
+def test_valid_example_has_no_issues():
+    assert validate_catalog(_load_example()) == []
+    assert validate_catalog_file("catalogs/core_particles.canonical.yaml") == []
+
+
+def test_collects_every_issue_in_one_pass():
+    catalog = _load_example()
+    first = catalog["particles"][0]
+    del first["exact"]["family"]
+    first["exact"]["mass_mev_exact"] = 0
+    catalog["particles"][2]["exact"]["hadron_type"] = "lepton"
+    catalog["particles"][3]["id"] = catalog["particles"][1]["id"]
+
+    issues = validate_catalog(catalog)
+    assert [(i.path, i.message) for i in issues] == [
+        ("particles[0].exact", "canonical particle missing exact.family"),
+        ("particles[0].exact.mass_mev_exact", "exact.mass_mev_exact must be a positive number"),
+        ("particles[2].exact.hadron_type", issues[2].message),
+        ("particles[3].id", f"duplicate particle id {catalog['particles'][1]['id']!r} (first defined at particles[1])"),
+    ]
+    assert issues[2].message.startswith("exact.hadron_type must be one of")
+
+
+@pytest.mark.parametrize(
+    "mutate, path, message",
+    [
+        (_set(("exact", "hadron_type"), ["baryon"]), "exact.hadron_type", "exact.hadron_type must be a string, got list"),
+        (_set(("exact", "quark_model", "mode"), {"a": 1}), "exact.quark_model.mode",
+         "exact.quark_model.mode must be a string, got dict"),
+        (_set(("exact", "quark_model", "constituents", 0, "role"), ["quark"]),
+         "exact.quark_model.constituents[0].role", "exact.quark_model.constituents[0].role must be a string, got list"),
+        (_set(("pedagogical", "diagram_mode"), [1]), "pedagogical.diagram_mode",
+         "pedagogical.diagram_mode must be a string, got list"),
+    ],
+)
+def test_unhashable_enum_values_are_reported_not_raised(mutate, path, message):
+    record = mutate(_proton())
+    second = _proton()
+    second["id"] = "proton_2"
+    second["exact"]["mass_mev_exact"] = 0
+    issues = validate_catalog({"schema_version": 1, "particles": [record, second]})
+    assert [(i.path, i.message) for i in issues] == [
+        (f"particles[0].{path}", message),
+        ("particles[1].exact.mass_mev_exact", "exact.mass_mev_exact must be a positive number"),
+    ]
+
+
+def test_catalog_level_issues():
+    assert validate_catalog([])[0].message == "canonical catalog root must be an object"
+    issues = validate_catalog({"particles": []})
+    assert [i.message for i in issues] == [
+        "canonical catalog missing schema_version",
+        "canonical catalog 'particles' must be a non-empty list",
+    ]
+
+
+def test_validate_catalog_file_reports_yaml_positions(tmp_path):
+    path = tmp_path / "catalog.yaml"
+    text = open("data/examples/hadron_schema_example.yaml", encoding="utf-8").read()
+    lines = text.splitlines()
+    family_line = next(n for n, line in enumerate(lines, start=1) if "family: nucleon" in line)
+    lines[family_line - 1] = lines[family_line - 1].replace("nucleon", '""')
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    issues = validate_catalog_file(path)
+    assert len(issues) == 1
+    issue = issues[0]
+    assert issue.message == "exact.family must be a non-empty string"
+    assert issue.line == family_line
+    assert issue.column == lines[family_line - 1].index('""') + 1
+    assert str(issue).startswith(f"{family_line}:{issue.column}: particles[0].exact.family")
+
+
+def test_validate_catalog_file_reports_yaml_syntax_error(tmp_path):
+    path = tmp_path / "catalog.yaml"
+    path.write_text("schema_version: 1\nparticles: [\n", encoding="utf-8")
+    issues = validate_catalog_file(path)
+    assert len(issues) == 1
+    assert issues[0].message.startswith("invalid YAML")
+    assert issues[0].line is not None
+
+
+def test_validate_catalog_file_reports_jsonl_lines(tmp_path):
+    catalog = _load_example()
+    catalog["particles"][1]["exact"]["hadron_type"] = "lepton"
+    path = tmp_path / "catalog.jsonl"
+    write_canonical_jsonl(catalog, path)
+    bad_id = catalog["particles"][1]["id"]
+    expected_line = 2 + sorted(p["id"] for p in catalog["particles"]).index(bad_id)
+
+    issues = validate_catalog_file(path)
+    assert [(i.line, i.message.split(" must")[0]) for i in issues] == [(expected_line, "exact.hadron_type")]
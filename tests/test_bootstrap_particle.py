@@ -1,6 +1,12 @@
+from types import SimpleNamespace
+
 import pytest
 
-from hadron_anki.catalog.bootstrap_particle import enrich_particle_metadata
+from hadron_anki.catalog.bootstrap_particle import (
+    ParticleNameIndex,
+    enrich_catalog_metadata,
+    enrich_particle_metadata,
+)
 
 def test_enrich_particle_metadata_proton():
     # We simulate passing the name "proton" or perhaps it finds it via basic querying
@@ -36,3 +42,62 @@ def test_enrich_particle_metadata_missing():
     # Or maybe raises ValueError. The implementation will decide.
     # We will test it expecting unchanged if not found, or None. Let's say unchanged.
     assert "pdg_id" not in enriched
+
+
+# ── Batch enrichment through a prebuilt name index ─────────────────────────
+
+def _fake(pdgid, name, programmatic_name=None, mass=100.0):
+    return SimpleNamespace(pdgid=pdgid, name=name, programmatic_name=programmatic_name or name, mass=mass)
+
+
+def test_enrich_catalog_matches_per_particle_enrichment():
+    pytest.importorskip("particle")
+    catalog = [
+        {"id": "proton", "name": "Proton"},
+        {"id": "neutron", "name": "Neutron"},
+        {"id": "pi_plus", "name": "Pion+"},
+        {"id": "k_minus", "name": "Kaon-"},
+        {"id": "lambda_0", "name": "Lambda"},
+    ]
+    names = {"proton": "p", "neutron": "n", "pi_plus": "pi+", "k_minus": "K-"}
+    enriched, report = enrich_catalog_metadata(catalog, pdg_names=names)
+    expected = [enrich_particle_metadata(p, pdg_name=names.get(p["id"])) for p in catalog]
+    assert enriched == expected
+    assert report.matched["proton"] == 2212
+    assert report.ambiguous == {}
+    assert report.missing == []
+
+
+def test_enrich_catalog_uses_aliases_and_reports_missing_and_ambiguous():
+    index = ParticleNameIndex([
+        _fake(211, "pi+", "pi_plus", mass=139.57),
+        _fake(9000111, "a(0)(980)0", "a_0_980_0"),
+        _fake(10111, "a(0)(980)0", "a_0_980_0"),
+        _fake(2212, "p"),
+        _fake(1000010010, "p"),
+    ])
+    catalog = [
+        {"id": "pi_plus", "name": "Pion"},
+        {"id": "a0", "name": "a(0)(980)0"},
+        {"id": "proton", "name": "p", "aliases": ["proton"]},
+        {"id": "nope", "name": "Nope"},
+    ]
+    enriched, report = enrich_catalog_metadata(catalog, pdg_names={"pi_plus": "pi_plus"}, index=index)
+    assert enriched[0]["pdg_id"] == 211 and enriched[0]["aliases"] == ["pi+"]
+    assert enriched[1]["pdg_id"] == 9000111
+    assert report.ambiguous == {"a0": [(9000111, "a(0)(980)0"), (10111, "a(0)(980)0")]}
+    assert enriched[2]["pdg_id"] == 2212 and enriched[2]["aliases"] == ["proton"]
+    assert "proton" not in report.ambiguous
+    assert report.missing == ["nope"] and "pdg_id" not in enriched[3]
+    assert catalog[0] == {"id": "pi_plus", "name": "Pion"}
+
+
+def test_enrich_catalog_builds_the_index_once(monkeypatch):
+    particle = pytest.importorskip("particle")
+    calls = []
+    real_all = particle.Particle.all
+    monkeypatch.setattr(particle.Particle, "all", classmethod(lambda cls: calls.append(1) or real_all()))
+    monkeypatch.setattr(particle.Particle, "findall", classmethod(lambda cls, *a, **k: pytest.fail("per-particle scan")))
+    enriched, _ = enrich_catalog_metadata([{"id": "x", "name": "pi+"}, {"id": "y", "name": "K+"}])
+    assert len(calls) == 1
+    assert [p["pdg_id"] for p in enriched] == [211, 321]
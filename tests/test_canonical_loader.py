@@ -1,11 +1,18 @@
+import json
 from pathlib import Path
 
 import pytest
+import yaml
 
+from hadron_anki.catalog.build import build_specs
 from hadron_anki.catalog.canonical_loader import (
+    iter_canonical_records,
     load_canonical_catalog,
     load_canonical_particles,
+    write_canonical_jsonl,
 )
+from hadron_anki.domain import canonical_validator, legacy_adapter
+from hadron_anki.domain.canonical_validator import ValidatedParticleRecord
 
 
 EXAMPLE_PATH = Path("data/examples/hadron_schema_example.yaml")
@@ -37,3 +44,127 @@ def test_load_canonical_catalog_rejects_jsonc_suffix(tmp_path):
 
     with pytest.raises(ValueError, match="Unsupported catalog format"):
         load_canonical_catalog(path)
+
+
+def test_load_canonical_catalog_marks_records_validated():
+    catalog = load_canonical_catalog(EXAMPLE_PATH)
+    assert all(isinstance(p, ValidatedParticleRecord) for p in catalog["particles"])
+
+
+def test_catalog_build_validates_each_record_once(monkeypatch):
+    calls: list[str] = []
+    original = canonical_validator.validate_particle_record
+
+    def _counting(record):
+        calls.append(record["id"])
+        original(record)
+
+    monkeypatch.setattr(canonical_validator, "validate_particle_record", _counting)
+    monkeypatch.setattr(legacy_adapter, "validate_particle_record", _counting)
+
+    catalog = load_canonical_catalog(EXAMPLE_PATH, use_cache=False)
+    specs = build_specs(catalog)
+
+    assert len(specs) == len(catalog["particles"])
+    assert sorted(calls) == sorted(p["id"] for p in catalog["particles"])
+
+
+def _write_shards(directory, particles_by_shard, schema_version=1):
+    directory.mkdir()
+    for name, particles in particles_by_shard.items():
+        (directory / name).write_text(
+            yaml.safe_dump({"schema_version": schema_version, "particles": particles}, sort_keys=False),
+            encoding="utf-8",
+        )
+
+
+def _example_particles() -> list[dict]:
+    return load_canonical_catalog(EXAMPLE_PATH, use_cache=False)["particles"]
+
+
+def test_sharded_directory_merges_by_id(tmp_path):
+    particles = [dict(p) for p in _example_particles()]
+    shard_dir = tmp_path / "canonical"
+    _write_shards(shard_dir, {
+        "mesons.yaml": [p for p in particles if p["exact"]["hadron_type"] == "meson"],
+        "baryons.yaml": [p for p in particles if p["exact"]["hadron_type"] == "baryon"],
+    })
+
+    serial = load_canonical_catalog(shard_dir)
+    parallel = load_canonical_catalog(shard_dir, use_cache=False, jobs=2)
+
+    assert serial == parallel
+    assert serial["schema_version"] == 1
+    assert [p["id"] for p in serial["particles"]] == sorted(p["id"] for p in particles)
+    assert all(isinstance(p, ValidatedParticleRecord) for p in parallel["particles"])
+
+
+def test_sharded_directory_rejects_duplicate_ids(tmp_path):
+    particles = [dict(p) for p in _example_particles()]
+    shard_dir = tmp_path / "canonical"
+    _write_shards(shard_dir, {"a.yaml": particles[:2], "b.yaml": particles[1:3]})
+
+    with pytest.raises(ValueError, match=rf"duplicate particle id '{particles[1]['id']}'.*a\.yaml and b\.yaml"):
+        load_canonical_catalog(shard_dir)
+
+
+def test_sharded_directory_rejects_mixed_schema_versions(tmp_path):
+    particles = [dict(p) for p in _example_particles()]
+    shard_dir = tmp_path / "canonical"
+    _write_shards(shard_dir, {"a.yaml": particles[:1]})
+    (shard_dir / "b.yaml").write_text(
+        yaml.safe_dump({"schema_version": 2, "particles": particles[1:2]}), encoding="utf-8"
+    )
+
+    with pytest.raises(ValueError, match="disagree on schema_version"):
+        load_canonical_catalog(shard_dir)
+
+
+def test_sharded_directory_reports_invalid_shard(tmp_path):
+    shard_dir = tmp_path / "canonical"
+    _write_shards(shard_dir, {"broken.yaml": []})
+
+    with pytest.raises(ValueError, match=r"broken\.yaml: canonical catalog 'particles'"):
+        load_canonical_catalog(shard_dir, jobs=2)
+
+
+def test_sharded_directory_without_shards(tmp_path):
+    with pytest.raises(ValueError, match="contains no"):
+        load_canonical_catalog(tmp_path)
+
+
+def test_jsonl_catalog_round_trip(tmp_path):
+    catalog = load_canonical_catalog(EXAMPLE_PATH, use_cache=False)
+    path = tmp_path / "catalog.jsonl"
+    write_canonical_jsonl(catalog, path)
+
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert json.loads(lines[0]) == {"schema_version": 1}
+    streamed = list(iter_canonical_records(path))
+    assert [p["id"] for p in streamed] == sorted(p["id"] for p in catalog["particles"])
+    assert all(isinstance(p, ValidatedParticleRecord) for p in streamed)
+    assert load_canonical_catalog(path)["particles"] == streamed
+
+
+def test_jsonl_catalog_reports_line_numbers(tmp_path):
+    catalog = load_canonical_catalog(EXAMPLE_PATH, use_cache=False)
+    path = tmp_path / "catalog.jsonl"
+    write_canonical_jsonl(catalog, path)
+    lines = path.read_text(encoding="utf-8").splitlines()
+    broken = json.loads(lines[2])
+    del broken["exact"]["family"]
+    lines[2] = json.dumps(broken)
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    records = iter_canonical_records(path)
+    next(records)
+    with pytest.raises(ValueError, match=r"catalog\.jsonl:3: canonical particle missing exact\.family"):
+        next(records)
+
+
+def test_jsonl_catalog_requires_header(tmp_path):
+    path = tmp_path / "catalog.jsonl"
+    record = load_canonical_catalog(EXAMPLE_PATH, use_cache=False)["particles"][0]
+    path.write_text(json.dumps(record) + "\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="header object with schema_version"):
+        list(iter_canonical_records(path))
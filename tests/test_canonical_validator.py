@@ -3,7 +3,11 @@ from copy import deepcopy
 import pytest
 import yaml
 
-from hadron_anki.domain.canonical_validator import validate_particle_record
+from hadron_anki.domain.canonical_validator import (
+    ValidatedParticleRecord,
+    validate_particle_record,
+    validated_particle_record,
+)
 
 
 def _load_example_particles() -> list[dict]:
@@ -93,3 +97,21 @@ def test_simple_valence_role_must_be_quark_or_antiquark():
 
     with pytest.raises(ValueError, match="simple_valence constituent.role must be one of"):
         validate_particle_record(proton)
+
+
+def test_validated_particle_record_validates_once_and_marks():
+    particles = _load_example_particles()
+    proton = next(p for p in particles if p["id"] == "proton")
+
+    validated = validated_particle_record(proton)
+    assert isinstance(validated, ValidatedParticleRecord)
+    assert validated == proton
+    assert validated_particle_record(validated) is validated
+
+
+def test_validated_particle_record_rejects_invalid():
+    particles = _load_example_particles()
+    proton = deepcopy(next(p for p in particles if p["id"] == "proton"))
+    del proton["exact"]["family"]
+    with pytest.raises(ValueError, match="exact.family"):
+        validated_particle_record(proton)
@@ -37,3 +37,18 @@ def test_identity_card_reverses_mapping():
     assert "d" in id_card.front_html
     # Back has particle name
     assert "Proton" in id_card.back_html
+
+def test_inline_svgs_embed_markup_and_drop_media():
+    spec = ParticleSpec(id="p", name="Proton", type="baryon", quarks=["u", "u", "d"])
+    svg = '<?xml version="1.0"?>\n<svg xmlns="http://www.w3.org/2000/svg" width="10" height="10"></svg>\n'
+    cards = generate_cards(spec, "p.svg", include_types=["composition", "summary"], inline_svgs={"p.svg": svg})
+
+    for card in cards:
+        assert card.media is None
+        assert "p.svg" not in card.back_html
+        assert '<svg role="img" aria-label="Composition diagram"' in card.back_html
+        assert "<?xml" not in card.back_html
+
+    referenced = generate_cards(spec, "p.svg", include_types=["composition"], inline_svgs={"other.svg": svg})
+    assert referenced[0].media == "p.svg"
+    assert referenced[0].back_html == generate_cards(spec, "p.svg", include_types=["composition"])[0].back_html
@@ -0,0 +1,122 @@
+import pickle
+import shutil
+from pathlib import Path
+
+import pytest
+
+from hadron_anki.catalog import canonical_loader, compiled
+from hadron_anki.catalog.canonical_loader import load_canonical_catalog
+from hadron_anki.catalog.compiled import compiled_path, load_compiled
+from hadron_anki.catalog.loader import load_catalog
+from hadron_anki.domain.canonical_validator import ValidatedParticleRecord
+
+
+EXAMPLE_PATH = Path("data/examples/hadron_schema_example.yaml")
+
+
+@pytest.fixture
+def example_copy(tmp_path) -> Path:
+    path = tmp_path / "catalog.yaml"
+    shutil.copyfile(EXAMPLE_PATH, path)
+    return path
+
+
+def test_load_canonical_catalog_writes_and_reuses_compiled_cache(example_copy, monkeypatch):
+    first = load_canonical_catalog(example_copy)
+    assert compiled_path(example_copy).exists()
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("source should not be parsed again")
+
+    monkeypatch.setattr(canonical_loader, "_parse_raw", _fail)
+    second = load_canonical_catalog(example_copy)
+
+    assert second == first
+    assert second is not first
+    assert all(isinstance(p, ValidatedParticleRecord) for p in second["particles"])
+
+
+def test_compiled_cache_invalidated_by_source_change(example_copy):
+    load_canonical_catalog(example_copy)
+    text = example_copy.read_text(encoding="utf-8")
+    example_copy.write_text(text.replace("name: Proton\n", "name: Proton (edited)\n", 1), encoding="utf-8")
+
+    reloaded = load_canonical_catalog(example_copy)
+    proton = next(p for p in reloaded["particles"] if p["id"] == "proton")
+    assert proton["exact"]["name"] == "Proton (edited)"
+
+
+def test_compiled_cache_invalidated_by_schema_fingerprint(example_copy, monkeypatch):
+    load_canonical_catalog(example_copy)
+    calls = []
+    monkeypatch.setattr(compiled, "_schema_digest", "other-schema")
+    load_compiled(example_copy, "canonical", lambda source: calls.append(source) or {"schema_version": 1})
+    assert len(calls) == 1
+
+
+def test_corrupt_compiled_cache_is_ignored(example_copy):
+    expected = load_canonical_catalog(example_copy, use_cache=False)
+    compiled_path(example_copy).write_bytes(b"not a pickle")
+
+    assert load_canonical_catalog(example_copy) == expected
+    with compiled_path(example_copy).open("rb") as f:
+        assert pickle.load(f)["kind"] == "canonical"
+
+
+def test_invalid_catalog_is_not_cached(tmp_path):
+    path = tmp_path / "catalog.yaml"
+    path.write_text("schema_version: 1\nparticles: []\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="non-empty list"):
+        load_canonical_catalog(path)
+    assert not compiled_path(path).exists()
+
+
+def test_load_catalog_uses_separate_cache_kind(tmp_path):
+    path = tmp_path / "decays.yaml"
+    path.write_text("proton:\n  stable: true\n", encoding="utf-8")
+
+    assert load_catalog(str(path)) == {"proton": {"stable": True}}
+    assert load_catalog(str(path)) == {"proton": {"stable": True}}
+    with compiled_path(path).open("rb") as f:
+        assert pickle.load(f)["kind"] == "catalog"
+
+
+def test_compiled_cache_lives_outside_the_source_directory(example_copy):
+    load_canonical_catalog(example_copy)
+    assert compiled_path(example_copy).parent == Path(compiled.CACHE_DIR)
+    assert [p.name for p in example_copy.parent.iterdir()] == ["catalog.yaml"]
+
+    other = example_copy.parent / "other" / "catalog.yaml"
+    other.parent.mkdir()
+    shutil.copyfile(example_copy, other)
+    assert compiled_path(other) != compiled_path(example_copy)
+
+
+def test_default_cache_dir_is_relative_to_the_working_directory(example_copy, monkeypatch):
+    monkeypatch.setattr(compiled, "CACHE_DIR", ".cache/compiled")
+    monkeypatch.chdir(example_copy.parent)
+    load_canonical_catalog(example_copy)
+    assert compiled_path(example_copy).parent == Path(".cache/compiled")
+    assert compiled_path(example_copy).resolve().is_file()
+
+
+def test_unwritable_cache_dir_falls_back_to_no_cache(example_copy, monkeypatch):
+    blocker = example_copy.parent / "blocker"
+    blocker.write_text("not a directory", encoding="utf-8")
+    monkeypatch.setattr(compiled, "CACHE_DIR", blocker / "compiled")
+    expected = load_canonical_catalog(example_copy, use_cache=False)
+    assert load_canonical_catalog(example_copy) == expected
+    assert not compiled_path(example_copy).exists()
+
+
+def test_cache_dir_none_disables_caching(example_copy, monkeypatch):
+    monkeypatch.setattr(compiled, "CACHE_DIR", None)
+    calls = []
+    assert load_compiled(example_copy, "raw", lambda source: calls.append(source) or len(calls)) == 1
+    assert load_compiled(example_copy, "raw", lambda source: calls.append(source) or len(calls)) == 2
+
+
+def test_schema_fingerprint_covers_parser_and_derivations():
+    names = {path.name for path in compiled._SCHEMA_SOURCES}
+    assert {"yaml_loader.py", "pedagogical_derivations.py", "canonical_validator.py"} <= names
+    assert all(path.is_file() for path in compiled._SCHEMA_SOURCES)
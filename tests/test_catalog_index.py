@@ -0,0 +1,171 @@
+import json
+import shutil
+from pathlib import Path
+
+import pytest
+
+from hadron_anki.catalog import index as catalog_index
+from hadron_anki.catalog.canonical_loader import load_canonical_catalog, write_canonical_jsonl
+from hadron_anki.catalog.index import (
+    ParticleFilter,
+    build_catalog_index,
+    index_path_for,
+    load_canonical_subset,
+    open_catalog_index,
+)
+from hadron_anki.domain.canonical_validator import ValidatedParticleRecord
+
+
+CORE_PATH = Path("catalogs/core_particles.canonical.yaml")
+
+
+@pytest.fixture
+def core_copy(tmp_path) -> Path:
+    path = tmp_path / "core.canonical.yaml"
+    shutil.copyfile(CORE_PATH, path)
+    return path
+
+
+def _expected_ids(particle_filter: ParticleFilter) -> list[str]:
+    particles = load_canonical_catalog(CORE_PATH, use_cache=False)["particles"]
+    return sorted(p["id"] for p in particles if particle_filter.matches(p))
+
+
+def test_parse_filter():
+    f = ParticleFilter.parse("hadron_type=baryon, strange=true, max_mass=1500, charge=-1")
+    assert f == ParticleFilter(hadron_type="baryon", strange=True, max_mass=1500.0, charge=-1)
+    assert ParticleFilter.parse("").is_empty()
+
+
+def test_every_filter_field_has_a_parser():
+    from dataclasses import fields
+
+    assert [f.name for f in fields(ParticleFilter)] == list(catalog_index._FILTER_PARSERS)
+    f = ParticleFilter.parse("family=strange_bottom, multiplet=int_octet, min_mass=1e3, charm=0, strange=no")
+    assert f == ParticleFilter(family="strange_bottom", multiplet="int_octet", min_mass=1000.0, charm=0, strange=False)
+
+
+@pytest.mark.parametrize("text", ["mass=3", "hadron_type", "charge=one", "strange=maybe"])
+def test_parse_filter_rejects_bad_terms(text):
+    with pytest.raises(ValueError, match="particle filter"):
+        ParticleFilter.parse(text)
+
+
+def test_strange_baryons_under_1500_mev(core_copy):
+    wanted = ParticleFilter.parse("hadron_type=baryon,strange=true,max_mass=1500")
+    with open_catalog_index(core_copy) as index:
+        ids = index.ids(wanted)
+        assert ids == _expected_ids(wanted)
+        assert "lambda_0" in ids and "proton" not in ids
+        assert index.count(wanted) == len(ids)
+        assert index.count() == len(load_canonical_catalog(CORE_PATH)["particles"])
+
+
+@pytest.mark.parametrize(
+    "text",
+    ["hadron_type=meson", "family=nucleon", "min_mass=500,max_mass=1200", "strange=false,charge=0", "strangeness=-2"],
+)
+def test_sql_and_in_memory_filters_agree(core_copy, text):
+    wanted = ParticleFilter.parse(text)
+    with open_catalog_index(core_copy) as index:
+        assert index.ids(wanted) == _expected_ids(wanted)
+
+
+def test_records_are_materialized_lazily(core_copy, monkeypatch):
+    open_catalog_index(core_copy).close()
+    decoded = []
+    real_loads = json.loads
+
+    def _counting(blob, *args, **kwargs):
+        decoded.append(blob)
+        return real_loads(blob, *args, **kwargs)
+
+    monkeypatch.setattr(catalog_index.json, "loads", _counting)
+    with open_catalog_index(core_copy) as index:
+        records = index.records()
+        first = next(records)
+        assert isinstance(first, ValidatedParticleRecord)
+        assert len(decoded) == 1
+
+
+def test_index_does_not_reparse_unchanged_source(core_copy, monkeypatch):
+    open_catalog_index(core_copy).close()
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("unchanged catalog must not be loaded again")
+
+    monkeypatch.setattr(catalog_index, "load_canonical_catalog", _fail)
+    with open_catalog_index(core_copy) as index:
+        assert index.record("proton")["exact"]["family"] == "nucleon"
+
+
+def test_index_rebuilt_when_source_changes(core_copy):
+    open_catalog_index(core_copy).close()
+    text = core_copy.read_text(encoding="utf-8")
+    core_copy.write_text(text.replace("family: nucleon", "family: nucleon_edited", 1), encoding="utf-8")
+
+    with open_catalog_index(core_copy) as index:
+        assert "nucleon_edited" in {r["exact"]["family"] for r in index.records()}
+
+
+def test_index_from_jsonl_and_subset_loader(core_copy, tmp_path):
+    jsonl_path = tmp_path / "core.jsonl"
+    write_canonical_jsonl(load_canonical_catalog(core_copy), jsonl_path)
+    build_catalog_index(jsonl_path)
+    assert index_path_for(jsonl_path).exists()
+
+    wanted = ParticleFilter(hadron_type="meson")
+    subset = load_canonical_subset(jsonl_path, wanted)
+    assert subset["schema_version"] == 1
+    assert [p["id"] for p in subset["particles"]] == _expected_ids(wanted)
+
+
+@pytest.mark.parametrize("text", ["strange=true", "strange=false", "strangeness=0"])
+def test_filters_agree_on_records_without_strangeness(tmp_path, text):
+    catalog = json.loads(json.dumps(load_canonical_catalog(CORE_PATH, use_cache=False)))
+    proton = next(p for p in catalog["particles"] if p["id"] == "proton")
+    proton["exact"]["quantum_numbers"]["strangeness"] = None
+    path = tmp_path / "core.json"
+    path.write_text(json.dumps(catalog), encoding="utf-8")
+
+    wanted = ParticleFilter.parse(text)
+    expected = sorted(p["id"] for p in load_canonical_catalog(path, use_cache=False)["particles"] if wanted.matches(p))
+    assert "proton" not in expected
+    with open_catalog_index(path) as index:
+        assert index.ids(wanted) == expected
+
+
+def test_index_rebuilt_when_code_fingerprint_changes(core_copy, monkeypatch):
+    from hadron_anki.catalog import compiled
+
+    open_catalog_index(core_copy).close()
+    rebuilt = []
+    real_build = catalog_index.build_catalog_index
+    monkeypatch.setattr(catalog_index, "build_catalog_index", lambda *a: rebuilt.append(a) or real_build(*a))
+    open_catalog_index(core_copy).close()
+    assert rebuilt == []
+
+    monkeypatch.setattr(compiled, "_schema_digest", "other-code")
+    monkeypatch.setattr(catalog_index, "schema_fingerprint", lambda: "other-code")
+    with open_catalog_index(core_copy) as index:
+        assert index.meta("code") == "other-code"
+    assert len(rebuilt) == 1
+
+
+def test_corrupt_index_is_closed_and_rebuilt(core_copy, monkeypatch):
+    index_path_for(core_copy).write_bytes(b"not a database" * 100)
+    opened = []
+    real_init = catalog_index.CatalogIndex.__init__
+
+    def tracking(self, path):
+        real_init(self, path)
+        opened.append(self)
+
+    closed = []
+    real_close = catalog_index.CatalogIndex.close
+    monkeypatch.setattr(catalog_index.CatalogIndex, "__init__", tracking)
+    monkeypatch.setattr(catalog_index.CatalogIndex, "close", lambda self: closed.append(self) or real_close(self))
+
+    with open_catalog_index(core_copy) as index:
+        assert index.record("proton")["id"] == "proton"
+    assert opened[0] in closed
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import sys
+
+import pytest
+import yaml
+
+from hadron_anki.domain.pedagogical_derivations import (
+    derive_mass_bucket,
+    derive_mass_display,
+    derive_mass_summary,
+)
+from hadron_anki.domain import columnar
+
+
+def _load_example_particles() -> list[dict]:
+    with open("data/examples/hadron_schema_example.yaml", "r", encoding="utf-8") as f:
+        data = yaml.safe_load(f)
+    return data["particles"]
+
+
+_EDGE_MASSES = [
+    0.511, 139.57039, 199.999, 200.0, 499.5, 500.5, 599.99, 600.0, 938.272088,
+    999.4, 999.5, 1000.0, 1005.0, 1015.0, 1199.99, 1200.0, 1314.86, 2.675, 5279.65,
+]
+
+
+def test_from_records_builds_columns():
+    np = pytest.importorskip("numpy")
+    particles = _load_example_particles()
+    catalog = columnar.ColumnarCatalog.from_records(particles)
+
+    assert len(catalog) == len(particles)
+    assert catalog.ids == [p["id"] for p in particles]
+    assert catalog.mass.dtype == np.float64
+    assert catalog.charge.tolist() == [p["exact"]["quantum_numbers"]["charge"] for p in particles]
+    assert catalog.strangeness.dtype == np.int64
+
+
+def test_from_records_rejects_non_positive_mass():
+    pytest.importorskip("numpy")
+    particles = _load_example_particles()
+    particles[0] = {**particles[0], "exact": {**particles[0]["exact"], "mass_mev_exact": 0}}
+    with pytest.raises(ValueError, match=r"records\[0\]\.exact\.mass_mev_exact"):
+        columnar.ColumnarCatalog.from_records(particles)
+
+
+def test_batch_mass_functions_match_scalar():
+    pytest.importorskip("numpy")
+    displays = columnar.batch_mass_display(_EDGE_MASSES)
+    buckets = columnar.batch_mass_bucket(_EDGE_MASSES)
+    summaries = columnar.batch_mass_summary(buckets, displays, _EDGE_MASSES)
+
+    assert displays == [derive_mass_display(m) for m in _EDGE_MASSES]
+    assert buckets == [derive_mass_bucket(m) for m in _EDGE_MASSES]
+    assert summaries == [
+        derive_mass_summary(derive_mass_bucket(m), derive_mass_display(m), m) for m in _EDGE_MASSES
+    ]
+
+
+def test_batch_mass_fields_match_scalar_on_catalog():
+    pytest.importorskip("numpy")
+    particles = _load_example_particles()
+    fields = columnar.batch_mass_fields(columnar.ColumnarCatalog.from_records(particles))
+
+    for idx, particle in enumerate(particles):
+        mass = particle["exact"]["mass_mev_exact"]
+        assert fields["mass_display"][idx] == derive_mass_display(mass)
+        assert fields["mass_bucket"][idx] == derive_mass_bucket(mass)
+
+
+def test_batch_mass_display_rejects_non_positive():
+    pytest.importorskip("numpy")
+    with pytest.raises(ValueError, match="positive"):
+        columnar.batch_mass_display([938.0, -1.0])
+
+
+def test_missing_numpy_raises_import_error(monkeypatch):
+    monkeypatch.setitem(sys.modules, "numpy", None)
+    with pytest.raises(ImportError, match="pip install numpy"):
+        columnar.batch_mass_bucket([938.0])
@@ -58,3 +58,16 @@ def test_hand_authored_diagram_overrides_generated_one():
     # pi_plus has a hand-authored W-boson diagram in the catalog.
     edge_types = {e["type"] for e in specs["pi_plus"].decay_diagram["edges"]}
     assert "boson" in edge_types
+
+
+def test_build_specs_carries_listed_decay_modes():
+    catalog = load_canonical_catalog(CANONICAL_PATH)
+    decays = dict(load_catalog(DECAYS_PATH))
+    decays["k_plus"] = dict(decays["k_plus"], modes=[
+        {"children": ["mu_plus", "nu_mu"], "branching_ratio": 0.6356, "description": "K+ --> mu+ nu_mu"},
+        {"children": ["pi_plus", "pi_zero"], "branching_ratio": 0.2067, "description": "K+ --> pi+ pi0"},
+    ])
+    specs = {s.id: s for s in build_specs(catalog, decays)}
+    assert [m["children"] for m in specs["k_plus"].decay_modes] == [["mu_plus", "nu_mu"], ["pi_plus", "pi_zero"]]
+    assert specs["k_plus"].decay["children"] == ["mu_plus", "nu_mu"]
+    assert specs["lambda_0"].decay_modes is None
@@ -4,8 +4,16 @@ TDD tests for src/hadron_anki/catalog/bootstrap_decays.py
 Fetch layer is isolated: parser/normalization are unit-tested with
 fixed fixtures so tests work offline.
 """
+import sys
+import types
+
 import pytest
+import yaml
+from hadron_anki.catalog import bootstrap_decays
+from hadron_anki.catalog.generate_core_decays import _render_yaml
 from hadron_anki.catalog.bootstrap_decays import (
+    PDGSession,
+    bootstrap_all_decays,
     normalize_pdg_name,
     is_effectively_stable,
     parse_dominant_decay,
@@ -177,3 +185,274 @@ def test_decay_record_has_source_fields():
     assert hasattr(record, "source")
     assert hasattr(record, "source_kind")
     assert record.source_kind in ("pdg_python_api", "fixture", "manual")
+
+
+# ── Tests: batched PDG session (fake API, offline) ─────────────────────────
+
+class _FakeItem:
+    def __init__(self, name):
+        self.item = types.SimpleNamespace(name=name)
+
+
+class _FakeBF:
+    def __init__(self, description, value, products, is_limit=False):
+        self.description = description
+        self.value = value
+        self.is_limit = is_limit
+        self.decay_products = [_FakeItem(p) for p in products]
+
+
+class _FakeParticle:
+    def __init__(self, bfs):
+        self._bfs = bfs
+
+    def exclusive_branching_fractions(self):
+        return iter(self._bfs)
+
+
+class _FakeAPI:
+    PARTICLES = {
+        "p": _FakeParticle([]),
+        "pi+": _FakeParticle([
+            _FakeBF("pi+ --> mu+ nu_mu", 0.999877, ["mu+", "nu_mu"]),
+            _FakeBF("pi+ --> e+ nu_e", 1.23e-4, ["e+", "nu_e"]),
+        ]),
+        "Lambda": _FakeParticle([_FakeBF("Lambda --> p pi-", 0.641, ["p", "pi-"])]),
+    }
+
+    def __init__(self):
+        self.name_lookups = []
+        self.engine = types.SimpleNamespace(disposed=0)
+        self.engine.dispose = lambda: setattr(self.engine, "disposed", self.engine.disposed + 1)
+
+    def get_particle_by_name(self, name):
+        self.name_lookups.append(name)
+        return self.PARTICLES[name]
+
+    def get_particle_by_mcid(self, mcid):
+        raise KeyError(mcid)
+
+
+@pytest.fixture
+def fake_pdg(monkeypatch):
+    connections = []
+
+    def connect():
+        api = _FakeAPI()
+        connections.append(api)
+        return api
+
+    monkeypatch.setitem(sys.modules, "pdg", types.SimpleNamespace(connect=connect))
+    monkeypatch.setattr(
+        bootstrap_decays,
+        "_skhep_ctau_table",
+        lambda names: {n: {"p": float("inf"), "pi+": 7804.42, "Lambda": 78.9}.get(n, 0.0) for n in names},
+    )
+    return connections
+
+
+def test_bootstrap_all_decays_opens_one_connection(fake_pdg):
+    results = bootstrap_all_decays(["proton", "pi_plus", "lambda_0"])
+    assert len(fake_pdg) == 1
+    assert results["proton"]["stable"] is True
+    assert results["pi_plus"]["main_decay"].children == ["mu_plus", "nu_mu"]
+    assert results["pi_plus"]["raw_bf_count"] == 2
+    assert results["lambda_0"]["main_decay"].children == ["proton", "pi_minus"]
+    assert results["lambda_0"]["source_kind"] == "pdg_python_api"
+
+
+def test_decay_source_names_the_session_edition(fake_pdg, monkeypatch):
+    monkeypatch.setattr(_FakeAPI, "edition", "2024", raising=False)
+    results = bootstrap_all_decays(["pi_plus"])
+    assert results["pi_plus"]["main_decay"].source == "PDG Python API 2024"
+    assert results["pi_plus"]["main_decay"].source_kind == "pdg_python_api"
+
+
+def test_bootstrap_all_decays_reports_unresolved_ids(fake_pdg, capsys):
+    results = bootstrap_all_decays(["pi_plus", "k_minus"])
+    assert results["k_minus"]["source_kind"] == "unknown"
+    assert results["k_minus"]["main_decay"] is None
+    assert results["pi_plus"]["source_kind"] == "pdg_python_api"
+    assert "[k_minus] fetch failed" in capsys.readouterr().out
+
+
+def test_session_memoizes_resolution_and_ctau(fake_pdg, monkeypatch):
+    scans = []
+    table = bootstrap_decays._skhep_ctau_table
+    monkeypatch.setattr(bootstrap_decays, "_skhep_ctau_table", lambda names: scans.append(1) or table(names))
+
+    session = PDGSession()
+    session.fetch_many(["pi_plus", "proton"])
+    session.fetch_many(["pi_plus", "proton"])
+    assert len(scans) == 1
+    assert fake_pdg[0].name_lookups == ["pi+", "p"]
+    assert session.fetch("pi_plus")["ctau_mm"] == 7804.42
+
+
+def test_fetch_particle_data_pdg_matches_session(fake_pdg):
+    session = PDGSession()
+    data = bootstrap_decays.fetch_particle_data_pdg("pi_plus", session=session)
+    assert data == session.fetch_many(["pi_plus"])["pi_plus"]
+    assert data["pdg_name"] == "pi+"
+    with pytest.raises(ValueError, match="k_minus"):
+        session.fetch("k_minus")
+
+
+def test_bootstrap_without_pdg_marks_every_id_unknown(monkeypatch):
+    monkeypatch.setitem(sys.modules, "pdg", None)
+    results = bootstrap_all_decays(["pi_plus", "proton"])
+    assert {entry["source_kind"] for entry in results.values()} == {"unknown"}
+
+
+def test_skhep_ctau_table_matches_from_name():
+    Particle = pytest.importorskip("particle").Particle
+    table = bootstrap_decays._skhep_ctau_table(["p", "n", "pi+", "K(S)0", "not-a-particle"])
+    for name in ("p", "n", "pi+", "K(S)0"):
+        assert table[name] == float(Particle.from_name(name).ctau)
+    assert table["not-a-particle"] == 0.0
+
+
+# ── Tests: concurrent bootstrap ────────────────────────────────────────────
+
+def test_concurrent_bootstrap_matches_bulk_and_keeps_order(fake_pdg):
+    ids = ["lambda_0", "proton", "k_minus", "pi_plus"]
+    bulk = bootstrap_all_decays(ids)
+    report = bootstrap_decays.BootstrapReport()
+    concurrent = bootstrap_all_decays(ids, workers=3, report=report)
+    assert list(concurrent) == ids
+    assert concurrent == bulk
+    assert report.workers == 3
+    assert list(report.timings) == ids
+    assert all(seconds >= 0 for seconds in report.timings.values())
+    assert report.failed_ids == ["k_minus"]
+    assert report.failures[0].error_type == "ValueError"
+
+
+def test_concurrent_bootstrap_uses_one_session_per_thread(fake_pdg):
+    created = []
+
+    def factory():
+        created.append(PDGSession())
+        return created[-1]
+
+    bootstrap_all_decays(["proton", "pi_plus", "lambda_0"] * 2, workers=2, session_factory=factory)
+    assert 1 <= len(created) <= 2
+    assert len(fake_pdg) == len(created)
+
+
+def test_bootstrap_closes_the_connections_it_opens(fake_pdg):
+    bootstrap_all_decays(["proton", "pi_plus", "lambda_0"] * 2, workers=3)
+    assert fake_pdg
+    assert [api.engine.disposed for api in fake_pdg] == [1] * len(fake_pdg)
+
+    fake_pdg.clear()
+    bootstrap_all_decays(["pi_plus"])
+    assert [api.engine.disposed for api in fake_pdg] == [1]
+
+
+def test_session_leaves_a_passed_in_api_open(fake_pdg):
+    api = _FakeAPI()
+    with PDGSession(api=api) as session:
+        session.fetch_many(["pi_plus"])
+    assert api.engine.disposed == 0
+    bootstrap_all_decays(["pi_plus"], session=session)
+    assert api.engine.disposed == 0
+
+
+def test_concurrent_bootstrap_rejects_shared_session(fake_pdg):
+    with pytest.raises(ValueError, match="session_factory"):
+        bootstrap_all_decays(["pi_plus"], session=PDGSession(), workers=2)
+
+
+def test_bulk_report_collects_failures(fake_pdg):
+    report = bootstrap_decays.BootstrapReport()
+    bootstrap_all_decays(["pi_plus", "k_minus"], report=report)
+    assert report.failed_ids == ["k_minus"]
+    assert report.timings == {}
+    assert report.elapsed >= 0
+
+
+def test_branching_fraction_read_failure_only_fails_that_particle(fake_pdg, monkeypatch):
+    read = bootstrap_decays._exclusive_branching_fractions
+
+    def flaky(particle):
+        if particle is _FakeAPI.PARTICLES["Lambda"]:
+            raise RuntimeError("database is locked")
+        return read(particle)
+
+    monkeypatch.setattr(bootstrap_decays, "_exclusive_branching_fractions", flaky)
+    assert isinstance(PDGSession().fetch_many(["lambda_0"])["lambda_0"], RuntimeError)
+
+    report = bootstrap_decays.BootstrapReport()
+    results = bootstrap_all_decays(["pi_plus", "lambda_0"], report=report)
+    assert results["pi_plus"]["main_decay"].children == ["mu_plus", "nu_mu"]
+    assert results["lambda_0"]["source_kind"] == "unknown"
+    assert [(f.repo_id, f.error_type) for f in report.failures] == [("lambda_0", "RuntimeError")]
+
+
+def test_connection_error_marks_every_id_failed(monkeypatch):
+    def connect():
+        raise OSError("cannot open PDG database")
+
+    monkeypatch.setitem(sys.modules, "pdg", types.SimpleNamespace(connect=connect))
+    report = bootstrap_decays.BootstrapReport()
+    results = bootstrap_all_decays(["pi_plus", "proton"], report=report)
+    assert {entry["source_kind"] for entry in results.values()} == {"unknown"}
+    assert report.failed_ids == ["pi_plus", "proton"]
+
+
+# ── Tests: full decay tables ───────────────────────────────────────────────
+
+K_PLUS_FIXTURE = {
+    "pdg_name": "K+",
+    "ctau_mm": 3711.0,
+    "branching_fractions": [
+        {"description": "K+ --> pi+ pi0", "value": 0.2067, "is_limit": False, "decay_products": ["pi+", "pi0"]},
+        {"description": "K+ --> mu+ nu_mu", "value": 0.6356, "is_limit": False, "decay_products": ["mu+", "nu_mu"]},
+        {"description": "K+ --> pi+ pi+ pi-", "value": 0.0558, "is_limit": False,
+         "decay_products": ["pi+", "pi+", "pi-"]},
+        {"description": "K+ --> e+ nu_e", "value": 1.6e-5, "is_limit": True, "decay_products": ["e+", "nu_e"]},
+        {"description": "K+ --> pi0 e+ nu_e", "value": 0.0507, "is_limit": False,
+         "decay_products": ["pi0", "e+", "nu_e"]},
+    ],
+}
+
+
+def test_decay_table_sorts_every_valid_mode():
+    table = bootstrap_decays.parse_decay_table("k_plus", K_PLUS_FIXTURE)
+    assert [m.branching_ratio for m in table.modes] == [0.6356, 0.2067, 0.0558, 0.0507]
+    assert table.dominant == parse_dominant_decay("k_plus", K_PLUS_FIXTURE)
+    assert len(table) == 4
+
+
+def test_decay_table_top_k_and_coverage_cutoff():
+    table = bootstrap_decays.parse_decay_table("k_plus", K_PLUS_FIXTURE)
+    assert [m.children for m in table.top(2)] == [["mu_plus", "nu_mu"], ["pi_plus", "pi_zero"]]
+    assert table.top(0) == []
+    assert len(table.covering(0.8)) == 2
+    assert len(table.covering(0.95)) == 4      # table only reaches 94.88%
+    assert table.covering(0.5) == table.top(1)
+    assert table.coverage() == pytest.approx(0.9488)
+
+
+def test_top_decays_heap_selection_matches_full_sort():
+    table = bootstrap_decays.parse_decay_table("k_plus", K_PLUS_FIXTURE)
+    for k in range(6):
+        assert bootstrap_decays.top_decays("k_plus", K_PLUS_FIXTURE, k) == table.top(k)
+    assert bootstrap_decays.top_decays("proton", STABLE_FIXTURE, 3) == []
+    assert bootstrap_decays.parse_decay_table("proton", STABLE_FIXTURE) is None
+
+
+def test_core_decays_yaml_lists_modes_within_coverage():
+    class _Session:
+        edition = "2025"
+
+        def fetch_many(self, ids):
+            return {"k_plus": K_PLUS_FIXTURE, "pi_plus": PI_PLUS_FIXTURE}
+
+    results = bootstrap_all_decays(["k_plus", "pi_plus"], session=_Session())
+    data = yaml.safe_load(_render_yaml(results, coverage=0.8, max_modes=5))
+    assert [m["branching_ratio"] for m in data["k_plus"]["modes"]] == [0.6356, 0.2067]
+    assert "modes" not in data["pi_plus"]       # one mode already covers 80%
+    capped = yaml.safe_load(_render_yaml(results, coverage=0.99, max_modes=3))
+    assert len(capped["k_plus"]["modes"]) == 3
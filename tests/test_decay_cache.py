@@ -0,0 +1,246 @@
+"""
+Tests for src/hadron_anki/catalog/decay_cache.py, replayed and incremental core_decays.yaml generation.
+"""
+import json
+import sys
+
+import pytest
+
+from hadron_anki.catalog import generate_core_decays
+from hadron_anki.catalog.bootstrap_decays import bootstrap_all_decays
+from hadron_anki.catalog.decay_cache import DECAY_CACHE_VERSION, DecayFetchCache, ReplaySession
+
+
+PI_PLUS = {
+    "pdg_name": "pi+",
+    "ctau_mm": 7804.42,
+    "branching_fractions": [
+        {"description": "pi+ --> mu+ nu_mu", "value": 0.999877, "is_limit": False,
+         "decay_products": ["mu+", "nu_mu"]},
+    ],
+}
+PROTON = {"pdg_name": "p", "ctau_mm": float("inf"), "branching_fractions": []}
+
+
+class _FixtureSession:
+    edition = "2025"
+
+    def __init__(self, data):
+        self.data = data
+        self.calls = 0
+
+    def fetch_many(self, repo_ids):
+        self.calls += 1
+        return {rid: self.data.get(rid, ValueError(rid)) for rid in repo_ids}
+
+
+def test_put_get_roundtrip_keeps_infinite_ctau(tmp_path):
+    cache = DecayFetchCache(tmp_path, "2025")
+    cache.put("proton", PROTON)
+    cache.put("pi_plus", PI_PLUS)
+    assert cache.get("proton") == PROTON
+    assert cache.get("pi_plus") == PI_PLUS
+    assert cache.ids() == ["pi_plus", "proton"]
+    assert cache.path("proton") == tmp_path / f"v{DECAY_CACHE_VERSION}" / "2025" / "proton.json"
+    assert cache.get("neutron") is None
+
+
+def test_entries_are_keyed_by_edition_and_version(tmp_path):
+    DecayFetchCache(tmp_path, "2024").put("pi_plus", PI_PLUS)
+    DecayFetchCache(tmp_path, "2025").put("pi_plus", PROTON)
+    assert DecayFetchCache.editions(tmp_path) == ["2024", "2025"]
+    assert DecayFetchCache.latest(tmp_path).get("pi_plus") == PROTON
+
+    cache = DecayFetchCache(tmp_path, "2024")
+    entry = json.loads(cache.path("pi_plus").read_text(encoding="utf-8"))
+    entry["format_version"] = DECAY_CACHE_VERSION + 1
+    cache.path("pi_plus").write_text(json.dumps(entry), encoding="utf-8")
+    assert cache.get("pi_plus") is None
+
+    cache.path("pi_plus").write_text("{not json", encoding="utf-8")
+    assert cache.get("pi_plus") is None
+
+
+def test_latest_prefers_numbered_editions_over_unknown(tmp_path):
+    DecayFetchCache(tmp_path, "unknown").put("pi_plus", PI_PLUS)
+    assert DecayFetchCache.latest(tmp_path).edition == "unknown"
+
+    for edition in ("2025", "2024", "999"):
+        DecayFetchCache(tmp_path, edition).put("pi_plus", PROTON)
+    assert DecayFetchCache.editions(tmp_path) == ["unknown", "999", "2024", "2025"]
+    assert DecayFetchCache.latest(tmp_path).edition == "2025"
+
+
+def test_latest_without_cache_raises(tmp_path):
+    with pytest.raises(ValueError, match="no cached PDG decay data"):
+        DecayFetchCache.latest(tmp_path)
+
+
+def test_bootstrap_records_fetched_data_and_replays_it(tmp_path, monkeypatch):
+    session = _FixtureSession({"pi_plus": PI_PLUS, "proton": PROTON})
+    live = bootstrap_all_decays(["pi_plus", "proton", "k_plus"], session=session, cache_dir=tmp_path)
+    cache = DecayFetchCache(tmp_path, "2025")
+    assert cache.ids() == ["pi_plus", "proton"]
+
+    monkeypatch.setitem(sys.modules, "pdg", None)
+    monkeypatch.setitem(sys.modules, "particle", None)
+    replayed = bootstrap_all_decays(["pi_plus", "proton"], session=ReplaySession(cache))
+    assert replayed == {rid: live[rid] for rid in ("pi_plus", "proton")}
+
+
+def test_replay_session_reports_missing_ids(tmp_path):
+    session = ReplaySession(DecayFetchCache(tmp_path, "2025"))
+    assert isinstance(session.fetch_many(["pi_plus"])["pi_plus"], ValueError)
+    with pytest.raises(ValueError, match="not in the decay cache"):
+        session.fetch("pi_plus")
+
+
+def test_main_replay_regenerates_yaml_offline(tmp_path, monkeypatch):
+    monkeypatch.setattr(generate_core_decays, "CORE_PARTICLE_IDS", ["pi_plus", "proton"])
+    cache_dir = tmp_path / "cache"
+    bootstrap_all_decays(["pi_plus", "proton"], session=_FixtureSession({"pi_plus": PI_PLUS, "proton": PROTON}),
+                         cache_dir=cache_dir)
+    expected = generate_core_decays._render_yaml(
+        bootstrap_all_decays(["pi_plus", "proton"], session=_FixtureSession({"pi_plus": PI_PLUS, "proton": PROTON}))
+    )
+
+    monkeypatch.setitem(sys.modules, "pdg", None)
+    out = tmp_path / "core_decays.yaml"
+    assert generate_core_decays.main(["--replay", "--cache", str(cache_dir), "--output", str(out)]) == 0
+    assert out.read_text(encoding="utf-8") == expected
+
+
+def test_default_cache_dir_is_relative_to_the_working_directory(tmp_path, monkeypatch):
+    monkeypatch.setattr(generate_core_decays, "CORE_PARTICLE_IDS", ["pi_plus", "proton"])
+    monkeypatch.chdir(tmp_path)
+    cache = DecayFetchCache(tmp_path / ".cache" / "pdg_decays", "2025")
+    cache.put("pi_plus", PI_PLUS)
+    cache.put("proton", PROTON)
+
+    out = tmp_path / "core_decays.yaml"
+    assert generate_core_decays.main(["--replay", "--output", str(out)]) == 0
+    assert "PDG Python API 2025" in out.read_text(encoding="utf-8")
+
+
+def test_replay_names_the_cached_edition_and_source(tmp_path, monkeypatch):
+    monkeypatch.setattr(generate_core_decays, "CORE_PARTICLE_IDS", ["pi_plus", "proton"])
+    old = DecayFetchCache(tmp_path, "2024")
+    old.put("pi_plus", PI_PLUS, source_kind="pdg_sqlite")
+    old.put("proton", PROTON, source_kind="pdg_sqlite")
+    DecayFetchCache(tmp_path, "2025").put("pi_plus", PI_PLUS)
+    assert old.source_kind("pi_plus") == "pdg_sqlite"
+
+    out = tmp_path / "core_decays.yaml"
+    argv = ["--replay", "--edition", "2024", "--cache", str(tmp_path), "--output", str(out)]
+    assert generate_core_decays.main(argv) == 0
+    text = out.read_text(encoding="utf-8")
+    assert "# Source: PDG SQLite 2024  (https://pdg.lbl.gov/api)" in text
+    assert 'source: "PDG SQLite 2024"' in text
+    assert 'source_kind: "pdg_sqlite"' in text
+    assert "2025" not in text
+
+
+def test_main_replay_refuses_incomplete_cache(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(generate_core_decays, "CORE_PARTICLE_IDS", ["pi_plus", "proton"])
+    DecayFetchCache(tmp_path, "2025").put("pi_plus", PI_PLUS)
+    out = tmp_path / "core_decays.yaml"
+    assert generate_core_decays.main(["--replay", "--cache", str(tmp_path), "--output", str(out)]) == 1
+    assert "lacks: proton" in capsys.readouterr().err
+    assert not out.exists()
+
+
+# ── Incremental regeneration ───────────────────────────────────────────────
+
+K_PLUS = {
+    "pdg_name": "K+",
+    "ctau_mm": 3711.0,
+    "branching_fractions": [
+        {"description": "K+ --> mu+ nu_mu", "value": 0.6356, "is_limit": False, "decay_products": ["mu+", "nu_mu"]},
+    ],
+}
+
+
+def _seed_cache(cache_dir, data):
+    cache = DecayFetchCache(cache_dir, "2025")
+    for repo_id, particle_data in data.items():
+        cache.put(repo_id, particle_data)
+    return cache
+
+
+def test_shipped_core_decays_round_trips_through_blocks():
+    text = open("catalogs/core_decays.yaml", encoding="utf-8").read()
+    assert generate_core_decays._join_blocks(generate_core_decays._split_blocks(text)) == text
+
+
+def test_merge_yaml_replaces_only_given_entries():
+    results = bootstrap_all_decays(["pi_plus", "proton"], session=_FixtureSession({"pi_plus": PI_PLUS, "proton": PROTON}))
+    full = generate_core_decays._render_yaml(results)
+    assert generate_core_decays.merge_yaml(full, {}) == full
+    assert generate_core_decays.merge_yaml("", results) == full
+
+    k_results = bootstrap_all_decays(["k_plus"], session=_FixtureSession({"k_plus": K_PLUS}))
+    merged = generate_core_decays.merge_yaml(full, k_results)
+    assert merged == generate_core_decays._render_yaml({**results, **k_results})
+
+
+def test_incremental_fetches_only_new_ids_and_skips_unchanged_write(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(generate_core_decays, "CORE_PARTICLE_IDS", ["pi_plus", "proton", "k_plus"])
+    cache_dir = tmp_path / "cache"
+    cache = _seed_cache(cache_dir, {"pi_plus": PI_PLUS, "proton": PROTON, "k_plus": K_PLUS})
+    out = tmp_path / "core_decays.yaml"
+    seed = bootstrap_all_decays(["pi_plus", "proton"], session=ReplaySession(cache))
+    out.write_text(generate_core_decays._render_yaml(seed), encoding="utf-8")
+
+    fetched = []
+    replay_fetch = ReplaySession.fetch_many
+    monkeypatch.setattr(ReplaySession, "fetch_many", lambda self, ids: fetched.extend(ids) or replay_fetch(self, ids))
+
+    argv = ["--replay", "--incremental", "--cache", str(cache_dir), "--output", str(out)]
+    assert generate_core_decays.main(argv) == 0
+    assert fetched == ["k_plus"]
+    assert "+ k_plus: new" in capsys.readouterr().out
+    full = bootstrap_all_decays(["pi_plus", "proton", "k_plus"], session=ReplaySession(cache))
+    assert out.read_text(encoding="utf-8") == generate_core_decays._render_yaml(full)
+
+    mtime = out.stat().st_mtime_ns
+    assert generate_core_decays.main(argv) == 0
+    assert "up to date" in capsys.readouterr().out
+    assert generate_core_decays.main(argv + ["--stale", "pi_plus"]) == 0
+    assert "Unchanged" in capsys.readouterr().out
+    assert out.stat().st_mtime_ns == mtime
+
+
+def test_stale_refetch_prints_branching_ratio_diff(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(generate_core_decays, "CORE_PARTICLE_IDS", ["k_plus"])
+    cache_dir = tmp_path / "cache"
+    cache = _seed_cache(cache_dir, {"k_plus": K_PLUS})
+    out = tmp_path / "core_decays.yaml"
+    out.write_text(
+        generate_core_decays._render_yaml(bootstrap_all_decays(["k_plus"], session=ReplaySession(cache))),
+        encoding="utf-8",
+    )
+    updated = dict(K_PLUS, branching_fractions=[
+        dict(K_PLUS["branching_fractions"][0], value=0.6358),
+        {"description": "K+ --> pi+ pi0", "value": 0.2067, "is_limit": False, "decay_products": ["pi+", "pi0"]},
+        {"description": "K+ --> pi+ pi+ pi-", "value": 0.1500, "is_limit": False,
+         "decay_products": ["pi+", "pi+", "pi-"]},
+    ])
+    cache.put("k_plus", updated)
+
+    argv = ["--replay", "--stale", "k_plus", "--cache", str(cache_dir), "--output", str(out)]
+    assert generate_core_decays.main(argv) == 0
+    printed = capsys.readouterr().out
+    assert "~ k_plus: K+ --> mu+ nu_mu  BR 0.6356 -> 0.6358" in printed
+    assert "+ k_plus: K+ --> pi+ pi0  BR 0.2067" in printed
+    assert "Written to" in printed
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_diff_decays_reports_stability_and_removed_entries():
+    old = {"x": {"stable": False, "main_decay": {"description": "x --> a b", "branching_ratio": 1.0}}}
+    new = {"x": {"stable": True}}
+    assert generate_core_decays.diff_decays(old, new, ["x"]) == [
+        "  ~ x: stable False -> True",
+        "  - x: x --> a b  BR 1",
+    ]
+    assert generate_core_decays.diff_decays(old, {}, ["x"])[0] == "  - x: removed"
@@ -0,0 +1,79 @@
+"""Tests for the memoized decay-chain closure (domain/decay_chains.py)."""
+import pytest
+
+from hadron_anki.catalog.loader import load_catalog
+from hadron_anki.domain.decay_chains import DecayChainEngine, format_cascade
+
+
+MODES = {
+    "xi_minus": [(["lambda_0", "pi_minus"], 0.9989)],
+    "omega_minus": [(["lambda_0", "k_minus"], 0.678), (["xi_zero", "pi_minus"], 0.236)],
+    "xi_zero": [(["lambda_0", "pi_zero"], 0.9952)],
+    "lambda_0": [(["proton", "pi_minus"], 0.641), (["neutron", "pi_zero"], 0.359)],
+    "pi_zero": [(["gamma", "gamma"], 0.988), (["e_plus", "e_minus", "gamma"], 0.0117)],
+    "pi_minus": [(["mu_minus", "nu_mu_bar"], 0.9999)],
+}
+
+
+def test_xi_minus_cascades_to_stable_final_state():
+    engine = DecayChainEngine(MODES)
+    best = engine.chains("xi_minus")[0]
+    assert best.final_state == ("pi_minus", "pi_minus", "proton")
+    assert best.probability == pytest.approx(0.9989 * 0.641)
+    assert format_cascade(best) == "Ξ⁻ → Λ⁰ + π⁻ → p + π⁻ + π⁻"
+
+
+def test_chain_probabilities_are_products_and_sorted():
+    engine = DecayChainEngine(MODES, threshold=0.0)
+    chains = engine.chains("xi_zero")
+    probabilities = [chain.probability for chain in chains]
+    assert probabilities == sorted(probabilities, reverse=True)
+    assert sum(probabilities) == pytest.approx(0.9952 * (0.641 + 0.359 * (0.988 + 0.0117)) * (0.988 + 0.0117))
+
+
+def test_threshold_prunes_unlikely_chains():
+    loose = DecayChainEngine(MODES, threshold=0.0).chains("omega_minus")
+    pruned = DecayChainEngine(MODES, threshold=0.05).chains("omega_minus")
+    assert len(pruned) < len(loose)
+    assert all(chain.probability >= 0.05 for chain in pruned)
+    kept = {chain.steps for chain in pruned}
+    assert kept == {chain.steps for chain in loose if chain.probability >= 0.05}
+
+
+def test_shared_subchains_are_expanded_once():
+    engine = DecayChainEngine(MODES)
+    engine.closure()
+    # One expansion per particle with modes, however often Λ and π⁰ recur.
+    assert engine.expansions == len(MODES) - 1     # pi_minus is a final state
+    engine.chains("omega_minus")
+    assert engine.expansions == len(MODES) - 1
+
+
+def test_final_states_and_particles_without_modes_are_not_expanded():
+    engine = DecayChainEngine(MODES, final_states={"lambda_0", "pi_minus"})
+    (chain,) = engine.chains("xi_minus")
+    assert chain.final_state == ("lambda_0", "pi_minus")
+    assert engine.chains("gamma")[0].steps == ()
+    assert engine.final_states_of("pi_minus") == {("pi_minus",): 1.0}
+
+
+def test_final_states_of_sums_chains_reaching_the_same_state():
+    modes = {"x": [(["a", "b"], 0.5), (["y"], 0.5)], "y": [(["b", "a"], 1.0)]}
+    assert DecayChainEngine(modes).final_states_of("x") == {("a", "b"): 1.0}
+
+
+def test_cycles_are_rejected():
+    engine = DecayChainEngine({"a": [(["b"], 1.0)], "b": [(["a"], 1.0)]})
+    with pytest.raises(ValueError, match="decay cycle: a -> b -> a"):
+        engine.chains("a")
+
+
+def test_invalid_threshold():
+    with pytest.raises(ValueError, match="threshold"):
+        DecayChainEngine(MODES, threshold=1.0)
+
+
+def test_engine_over_core_decays_catalog():
+    engine = DecayChainEngine.from_decay_catalog(load_catalog("catalogs/core_decays.yaml"))
+    assert format_cascade(engine.chains("xi_minus")[0]) == "Ξ⁻ → Λ⁰ + π⁻ → p + π⁻ + π⁻"
+    assert engine.chains("proton")[0].steps == ()
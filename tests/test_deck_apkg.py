@@ -90,3 +90,113 @@ def test_build_apkg_contract(catalog_min):
                 
                 svg_values = [v for k, v in media_data.items() if k.isdigit() and v.endswith(".svg")]
                 assert "proton.svg" in svg_values
+
+def test_build_apkg_writes_deterministic_zip_in_one_pass(catalog_min, monkeypatch):
+    import genanki
+
+    def _no_genanki_zip(*args, **kwargs):
+        raise AssertionError("genanki.Package.write_to_file must not be used")
+
+    monkeypatch.setattr(genanki.Package, "write_to_file", _no_genanki_zip)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        out_path = os.path.join(tmpdir, "test.apkg")
+        build_apkg(
+            catalog=catalog_min,
+            out_path=out_path,
+            deck_name="test_deck",
+            template_version="1.0.0",
+            model_version="v1",
+        )
+
+        with zipfile.ZipFile(out_path, "r") as z:
+            infos = z.infolist()
+            names = [i.filename for i in infos]
+            assert names[:2] == ["collection.anki2", "media"]
+            numeric = names[2:]
+            assert numeric == [str(i) for i in range(len(numeric))]
+            assert all(i.date_time == (1980, 1, 1, 0, 0, 0) for i in infos)
+            assert all(i.compress_type == zipfile.ZIP_DEFLATED for i in infos)
+
+            media = json.loads(z.read("media"))
+            assert sorted(media.values()) == list(media.values())
+
+
+def test_build_apkg_streaming_matches_build_apkg(tmp_path):
+    from hadron_anki.catalog.build import build_specs, iter_specs
+    from hadron_anki.catalog.canonical_loader import (
+        iter_canonical_records,
+        load_canonical_catalog,
+        write_canonical_jsonl,
+    )
+    from hadron_anki.catalog.loader import load_catalog
+    from hadron_anki.deck.apkg import build_apkg_streaming
+
+    canonical = load_canonical_catalog("catalogs/core_particles.canonical.yaml", use_cache=False)
+    decays_by_id = load_catalog("catalogs/core_decays.yaml", use_cache=False)
+    jsonl_path = tmp_path / "catalog.jsonl"
+    write_canonical_jsonl(canonical, jsonl_path)
+
+    kwargs = dict(deck_name="Stream", template_version="v1", model_version="v1")
+    full_path = tmp_path / "full.apkg"
+    stream_path = tmp_path / "stream.apkg"
+    build_apkg(specs=build_specs(canonical, decays_by_id), out_path=str(full_path), **kwargs)
+    notes = build_apkg_streaming(
+        iter_specs(iter_canonical_records(jsonl_path), decays_by_id), str(stream_path), **kwargs
+    )
+
+    assert stream_path.read_bytes() == full_path.read_bytes()
+    with zipfile.ZipFile(stream_path) as z:
+        (tmp_path / "c.anki2").write_bytes(z.read("collection.anki2"))
+    conn = sqlite3.connect(tmp_path / "c.anki2")
+    try:
+        assert conn.execute("SELECT COUNT(*) FROM notes").fetchone()[0] == notes
+    finally:
+        conn.close()
+
+
+def test_build_apkg_streaming_requires_sorted_specs(catalog_min, tmp_path):
+    from hadron_anki.deck.apkg import _particle_spec_from_mapping, build_apkg_streaming
+
+    specs = sorted((_particle_spec_from_mapping(p) for p in catalog_min["particles"]), key=lambda s: s.id)
+    with pytest.raises(ValueError, match="sorted by unique id"):
+        build_apkg_streaming(
+            list(reversed(specs)), str(tmp_path / "x.apkg"),
+            deck_name="d", template_version="v1", model_version="v1",
+        )
+
+
+def test_build_apkg_inlines_small_svgs_and_reports_tradeoff(catalog_min, tmp_path):
+    kwargs = dict(catalog=catalog_min, deck_name="test_deck", template_version="1.0.0", model_version="v1")
+    media_path = tmp_path / "media.apkg"
+    inline_path = tmp_path / "inline.apkg"
+    plain = build_apkg(out_path=str(media_path), **kwargs)
+    assert plain.inlined_svgs == 0 and plain.media_files > 0
+    assert "inline SVG" not in plain.summary()
+
+    inlined = build_apkg(out_path=str(inline_path), inline_svg_max_bytes=1 << 20, **kwargs)
+    assert inlined.inlined_svgs == plain.media_files
+    assert inlined.inlined_bytes == plain.media_bytes
+    assert inlined.media_files == inlined.media_bytes == 0
+    assert inlined.package_bytes == inline_path.stat().st_size
+    assert f"{inlined.inlined_svgs} inlined" in inlined.summary()
+
+    with zipfile.ZipFile(inline_path) as z:
+        assert json.loads(z.read("media")) == {}
+        (tmp_path / "c.anki2").write_bytes(z.read("collection.anki2"))
+    conn = sqlite3.connect(tmp_path / "c.anki2")
+    try:
+        fields = [row[0] for row in conn.execute("SELECT flds FROM notes")]
+    finally:
+        conn.close()
+    assert any("<svg role=\"img\"" in flds for flds in fields)
+    assert not any("<img src=" in flds for flds in fields)
+
+    none_inlined = build_apkg(out_path=str(inline_path), inline_svg_max_bytes=0, **kwargs)
+    assert none_inlined.inlined_svgs == 0
+    assert inline_path.read_bytes() == media_path.read_bytes()
+
+
+def test_build_apkg_rejects_negative_inline_threshold(catalog_min, tmp_path):
+    with pytest.raises(ValueError, match="inline_svg_max_bytes"):
+        build_apkg(catalog=catalog_min, out_path=str(tmp_path / "x.apkg"), deck_name="d",
+                   template_version="1", model_version="v1", inline_svg_max_bytes=-1)
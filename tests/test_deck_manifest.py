@@ -0,0 +1,105 @@
+"""Tests for incremental deck builds driven by the per-note manifest."""
+import dataclasses
+import json
+
+from hadron_anki.deck import media as media_mod
+from hadron_anki.deck.apkg import build_apkg
+from hadron_anki.deck.manifest import manifest_path
+from hadron_anki.domain.spec import ParticleSpec
+
+
+DECAY = {
+    "nodes": [{"id": "a", "x": 50, "y": 90}, {"id": "b", "x": 270, "y": 90}],
+    "edges": [{"from": "a", "to": "b", "type": "fermion", "label": "e-"}],
+}
+KWARGS = dict(deck_name="d", template_version="1", model_version="v1")
+
+
+def _specs():
+    return [
+        ParticleSpec(id="p1", name="P1", type="baryon", quarks=["u", "u", "d"], mass=938.0,
+                     decay_diagram=DECAY),
+        ParticleSpec(id="m1", name="M1", type="meson", quarks=["u", "anti-d"], mass=139.6),
+    ]
+
+
+def test_full_build_reports_every_note_as_added(tmp_path):
+    out = str(tmp_path / "deck.apkg")
+    report = build_apkg(specs=_specs(), out_path=out, incremental=True, **KWARGS)
+
+    assert sorted(report.added) == ["m1:composition", "m1:identity", "m1:mass",
+                                    "p1:composition", "p1:decay", "p1:identity", "p1:mass"]
+    manifest = json.loads(open(manifest_path(out)).read())
+    assert len(manifest["notes"]) == 7
+    assert set(manifest["media"]) == {"m1.svg", "p1.svg", "p1_decay.svg"}
+
+
+def test_unchanged_rebuild_reuses_everything_and_is_byte_identical(tmp_path, monkeypatch):
+    out = tmp_path / "deck.apkg"
+    build_apkg(specs=_specs(), out_path=str(out), incremental=True, **KWARGS)
+    first = out.read_bytes()
+
+    rendered = []
+    real = media_mod.render_specs
+    monkeypatch.setattr(media_mod, "render_specs", lambda specs, **kw: rendered.extend(specs) or real(specs, **kw))
+    report = build_apkg(specs=_specs(), out_path=str(out), incremental=True, **KWARGS)
+
+    assert out.read_bytes() == first
+    assert rendered == []
+    assert (report.added, report.changed, report.removed, report.unchanged) == ([], [], [], 7)
+    assert report.reused_media == 3
+
+
+def test_incremental_rebuild_only_touches_edited_particle(tmp_path):
+    out = tmp_path / "deck.apkg"
+    build_apkg(specs=_specs(), out_path=str(out), incremental=True, **KWARGS)
+
+    edited = _specs()
+    edited[1] = dataclasses.replace(edited[1], quarks=["d", "anti-u"])
+    report = build_apkg(specs=edited, out_path=str(out), incremental=True, **KWARGS)
+
+    assert report.changed == ["m1:composition", "m1:identity", "m1:mass"]
+    assert report.unchanged == 4
+    assert report.reused_media == 2 and report.rendered_media == 1
+
+    full = tmp_path / "full.apkg"
+    build_apkg(specs=edited, out_path=str(full), **KWARGS)
+    assert out.read_bytes() == full.read_bytes()
+
+
+def test_incremental_rebuild_reports_removed_notes(tmp_path):
+    out = str(tmp_path / "deck.apkg")
+    build_apkg(specs=_specs(), out_path=out, incremental=True, **KWARGS)
+    report = build_apkg(specs=_specs()[:1], out_path=out, incremental=True, **KWARGS)
+
+    assert report.removed == ["m1:composition", "m1:identity", "m1:mass"]
+    assert report.unchanged == 4
+
+
+def test_corrupt_manifest_falls_back_to_full_build(tmp_path):
+    out = str(tmp_path / "deck.apkg")
+    build_apkg(specs=_specs(), out_path=out, incremental=True, **KWARGS)
+    with open(manifest_path(out), "w") as f:
+        f.write("{not json")
+
+    report = build_apkg(specs=_specs(), out_path=out, incremental=True, **KWARGS)
+    assert len(report.added) == 7
+
+
+def test_card_code_fingerprint_covers_domain_formatters(monkeypatch):
+    from pathlib import Path
+
+    from hadron_anki.deck import manifest
+
+    monkeypatch.setattr(manifest, "_card_code_digest", None)
+    before = manifest._card_code_fingerprint()
+    real = Path.read_bytes
+
+    def edited(path):
+        data = real(path)
+        return data + b"\n# edited\n" if path.name == "particle_symbols.py" else data
+
+    monkeypatch.setattr(Path, "read_bytes", edited)
+    monkeypatch.setattr(manifest, "_card_code_digest", None)
+    assert manifest._card_code_fingerprint() != before
+    assert "domain/composer.py" in manifest._CARD_CODE_MODULES
@@ -0,0 +1,77 @@
+"""Tests for the shared render stage (render once, package many)."""
+import os
+import zipfile
+
+import pytest
+
+from hadron_anki.deck.apkg import build_apkg
+from hadron_anki.deck.media import render_media_set
+from hadron_anki.domain.spec import ParticleSpec
+
+
+DECAY = {
+    "nodes": [{"id": "a", "x": 50, "y": 90}, {"id": "b", "x": 270, "y": 90}],
+    "edges": [{"from": "a", "to": "b", "type": "fermion", "label": "e-"}],
+}
+
+
+def _specs():
+    return [
+        ParticleSpec(id="p1", name="P1", type="baryon", quarks=["u", "u", "d"], mass=938.0,
+                     decay_diagram=DECAY),
+        ParticleSpec(id="m1", name="M1", type="meson", quarks=["u", "anti-d"], mass=139.6),
+    ]
+
+
+def test_render_media_set_writes_each_svg_once(tmp_path):
+    media = render_media_set(_specs(), tmp_path / "media")
+
+    assert media.svg_filenames == {"m1": "m1.svg", "p1": "p1.svg"}
+    assert media.decay_svg_filenames == {"p1": "p1_decay.svg"}
+    for name in ["m1.svg", "p1.svg", "p1_decay.svg"]:
+        assert (tmp_path / "media" / name).exists()
+
+
+def test_build_apkg_with_shared_media_matches_standalone_build(tmp_path):
+    specs = _specs()
+    media = render_media_set(specs, tmp_path / "media")
+
+    kwargs = dict(specs=specs, deck_name="d", template_version="1", model_version="v1")
+    standalone = tmp_path / "standalone.apkg"
+    shared = tmp_path / "shared.apkg"
+    build_apkg(out_path=str(standalone), **kwargs)
+    build_apkg(out_path=str(shared), media=media, **kwargs)
+
+    assert standalone.read_bytes() == shared.read_bytes()
+    with zipfile.ZipFile(shared) as z:
+        assert len([n for n in z.namelist() if n.isdigit()]) == 3
+
+
+def test_build_apkg_rejects_media_set_missing_a_spec(tmp_path):
+    specs = _specs()
+    media = render_media_set(specs[:1], tmp_path / "media")
+
+    with pytest.raises(ValueError, match="no rendered SVG"):
+        build_apkg(
+            specs=specs,
+            out_path=os.path.join(tmp_path, "x.apkg"),
+            deck_name="d",
+            template_version="1",
+            model_version="v1",
+            media=media,
+        )
+
+
+def test_shared_media_served_from_render_cache_counts_as_reused(tmp_path):
+    from hadron_anki.render.cache import RenderCache
+
+    specs = _specs()
+    cache = RenderCache(tmp_path / "cache")
+    cold = render_media_set(specs, tmp_path / "cold", cache=cache)
+    assert cold.reused == set()
+
+    warm = render_media_set(specs, tmp_path / "warm", cache=cache)
+    assert warm.reused == {"m1.svg", "p1.svg", "p1_decay.svg"}
+    report = build_apkg(specs=specs, out_path=str(tmp_path / "d.apkg"), deck_name="d",
+                        template_version="1", model_version="v1", media=warm)
+    assert (report.reused_media, report.rendered_media) == (3, 0)
@@ -140,3 +140,72 @@ def test_feynman_renderer_falls_back_safely_when_no_cache_dir():
     assert svg.count("<svg") == 1  # No nested SVGs
     assert "<text" in svg
     assert ">pi+<" in svg
+
+
+def test_repeated_math_labels_are_parsed_once_per_process(tmp_path, monkeypatch):
+    from hadron_anki.render import feynman
+
+    feynman.clear_label_fragment_cache()
+    calls = []
+    real = feynman.generate_math_label_asset
+
+    def counting(expr_tex, **kwargs):
+        calls.append(expr_tex)
+        return real(expr_tex, **kwargs)
+
+    monkeypatch.setattr(feynman, "generate_math_label_asset", counting)
+    out = tmp_path / "math_labels"
+
+    first = render_feynman_svg(PI_PLUS_DECAY, math_cache_dir=out)
+    second = render_feynman_svg(PI_PLUS_DECAY, math_cache_dir=out)
+
+    assert first == second
+    assert sorted(calls) == sorted([r"\pi^+", r"\mu^+", r"\nu_\mu"])
+
+
+def test_cached_math_label_fragments_still_materialize_in_new_dirs(tmp_path):
+    from hadron_anki.render import feynman
+
+    feynman.clear_label_fragment_cache()
+    render_feynman_svg(PI_PLUS_DECAY, math_cache_dir=tmp_path / "a")
+    render_feynman_svg(PI_PLUS_DECAY, math_cache_dir=tmp_path / "b")
+
+    assert len(list((tmp_path / "b").glob("mathlabel_*.svg"))) == 3
+
+
+def test_repeated_math_labels_do_no_filesystem_io(tmp_path, monkeypatch):
+    from pathlib import Path
+    from hadron_anki.render import feynman
+
+    feynman.clear_label_fragment_cache()
+    out = tmp_path / "math_labels"
+    first = render_feynman_svg(PI_PLUS_DECAY, math_cache_dir=out)
+
+    def no_io(*args, **kwargs):
+        raise AssertionError("label cache hit touched the filesystem")
+
+    for name in ("exists", "is_file", "stat", "read_text"):
+        monkeypatch.setattr(Path, name, no_io)
+    monkeypatch.setattr(feynman, "generate_math_label_asset", no_io)
+    assert render_feynman_svg(PI_PLUS_DECAY, math_cache_dir=out) == first
+
+
+def test_math_label_assets_are_rewritten_after_cache_dir_is_cleared(tmp_path, monkeypatch):
+    import shutil
+    from hadron_anki.render import feynman
+
+    feynman.clear_label_fragment_cache()
+    out = tmp_path / "math_labels"
+    first = render_feynman_svg(PI_PLUS_DECAY, math_cache_dir=out)
+    shutil.rmtree(out)
+    out.mkdir()
+    feynman.clear_label_fragment_cache()
+
+    assert render_feynman_svg(PI_PLUS_DECAY, math_cache_dir=out) == first
+    assert len(list(out.glob("mathlabel_*.svg"))) == 3
+
+    # With the fragments evicted as well, the assets must be re-created, not read.
+    shutil.rmtree(out)
+    feynman.clear_label_fragment_cache()
+    assert render_feynman_svg(PI_PLUS_DECAY, math_cache_dir=out) == first
+    assert len(list(out.glob("mathlabel_*.svg"))) == 3
@@ -0,0 +1,149 @@
+"""
+Tests for src/hadron_anki/catalog/pdg_sql.py against a miniature PDG SQLite file.
+"""
+import sqlite3
+
+import pytest
+
+from hadron_anki.catalog import pdg_sql
+from hadron_anki.catalog.bootstrap_decays import bootstrap_all_decays
+from hadron_anki.catalog.pdg_sql import PDGSQLSession
+
+
+_SCHEMA = """
+CREATE TABLE pdgparticle (name TEXT, mcid INTEGER, pdgid TEXT);
+CREATE TABLE pdgid (
+    id INTEGER PRIMARY KEY, pdgid TEXT, parent_pdgid TEXT,
+    description TEXT, data_type TEXT, sort INTEGER
+);
+CREATE TABLE pdgdata (pdgid_id INTEGER, value REAL, limit_type TEXT, in_summary_table INTEGER, sort INTEGER);
+CREATE TABLE pdgdecay (pdgid_id INTEGER, pdgitem_id INTEGER, is_outgoing INTEGER, sort INTEGER);
+CREATE TABLE pdgitem (id INTEGER PRIMARY KEY, name TEXT);
+"""
+
+_ITEMS = {1: "mu+", 2: "nu_mu", 3: "e+", 4: "nu_e", 5: "p", 6: "pi-", 7: "pi+", 8: "pi0", 9: "Lambda"}
+
+
+@pytest.fixture
+def pdg_db(tmp_path):
+    path = tmp_path / "pdg.sqlite"
+    conn = sqlite3.connect(path)
+    conn.executescript(_SCHEMA)
+    conn.executemany("INSERT INTO pdgitem VALUES (?, ?)", _ITEMS.items())
+    conn.executemany("INSERT INTO pdgparticle VALUES (?, ?, ?)", [
+        ("p", 2212, "S016"),
+        ("pi+", 211, "S008"),
+        ("pi-", -211, "S008"),
+        ("K(S)0", 310, "S012"),
+        ("Lambda", 3122, "S018"),
+    ])
+    conn.executemany("INSERT INTO pdgid VALUES (?, ?, ?, ?, ?, ?)", [
+        (10, "S008.1", "S008", "pi+ --> mu+ nu_mu", "BFX", 1),
+        (11, "S008.2", "S008", "pi+ --> e+ nu_e", "BFX", 2),
+        (12, "S008.3", "S008", "pi+ --> e+ nu_e gamma", "BFI", 3),
+        (13, "S008.4", "S008", "pi+ --> mu+ nu_e", "BFX", 4),
+        (20, "S012.1", "S012", "K(S)0 --> pi+ pi-", "BFX", 1),
+        (21, "S012.2", "S012", "K(S)0 --> pi0 pi0", "BFX", 2),
+        (30, "S018.1", "S018", "Lambda --> p pi-", "BFX", 1),
+        (40, "S016M", "S016", "p MASS", "M", 1),
+    ])
+    conn.executemany("INSERT INTO pdgdata VALUES (?, ?, ?, ?, ?)", [
+        (10, 0.99, None, 0, 1),
+        (10, 0.999877, None, 1, 2),      # summary value wins
+        (11, 1.23e-4, None, 1, 1),
+        (13, 8.0e-3, "U", 1, 1),         # upper limit
+        (20, 0.692, "", 1, 1),
+        (21, 0.307, None, 1, 1),
+        # Lambda --> p pi- has no value row at all
+    ])
+    conn.executemany("INSERT INTO pdgdecay VALUES (?, ?, ?, ?)", [
+        (10, 7, 0, 0), (10, 1, 1, 1), (10, 2, 1, 2),
+        (11, 3, 1, 1), (11, 4, 1, 2),
+        (13, 1, 1, 1), (13, 4, 1, 2),
+        (20, 7, 1, 1), (20, 6, 1, 2),
+        (21, 8, 1, 1),
+        (30, 5, 1, 1), (30, 6, 1, 2),
+    ])
+    conn.commit()
+    conn.close()
+    return path
+
+
+@pytest.fixture(autouse=True)
+def fixed_ctau(monkeypatch):
+    table = {"p": float("inf"), "pi+": 7804.42, "K(S)0": 26.84, "Lambda": 78.9}
+    monkeypatch.setattr(pdg_sql, "_skhep_ctau_table", lambda names: {n: table.get(n, 0.0) for n in names})
+
+
+def test_fetch_many_returns_particle_data_shape(pdg_db):
+    with PDGSQLSession(pdg_db) as session:
+        data = session.fetch_many(["pi_plus"])["pi_plus"]
+    assert data == {
+        "pdg_name": "pi+",
+        "ctau_mm": 7804.42,
+        "branching_fractions": [
+            {"description": "pi+ --> mu+ nu_mu", "value": 0.999877, "is_limit": False,
+             "decay_products": ["mu+", "nu_mu"]},
+            {"description": "pi+ --> e+ nu_e", "value": 1.23e-4, "is_limit": False,
+             "decay_products": ["e+", "nu_e"]},
+            {"description": "pi+ --> mu+ nu_e", "value": 8.0e-3, "is_limit": True,
+             "decay_products": ["mu+", "nu_e"]},
+        ],
+    }
+
+
+def test_resolution_uses_names_then_mcid(pdg_db):
+    with PDGSQLSession(pdg_db) as session:
+        resolved = session.resolve_many(["k_zero", "lambda_0", "proton", "omega_minus"])
+    assert resolved["k_zero"] == "S012"
+    assert resolved["lambda_0"] == "S018"
+    assert resolved["proton"] == "S016"
+    assert isinstance(resolved["omega_minus"], ValueError)
+
+
+def test_modes_without_value_and_empty_limit_type(pdg_db):
+    with PDGSQLSession(pdg_db) as session:
+        data = session.fetch_many(["lambda_0", "k_zero", "proton"])
+    assert data["lambda_0"]["branching_fractions"][0]["value"] is None
+    assert data["k_zero"]["branching_fractions"][0]["is_limit"] is False
+    assert data["proton"]["branching_fractions"] == []
+    with pytest.raises(ValueError, match="omega_minus"):
+        PDGSQLSession(pdg_db).fetch("omega_minus")
+
+
+def test_bootstrap_all_decays_with_sql_session(pdg_db, capsys):
+    with PDGSQLSession(pdg_db) as session:
+        results = bootstrap_all_decays(["proton", "pi_plus", "k_zero", "lambda_0", "xi_minus"], session=session)
+    assert results["proton"]["stable"] is True
+    assert results["pi_plus"]["main_decay"].children == ["mu_plus", "nu_mu"]
+    assert results["k_zero"]["main_decay"].branching_ratio == pytest.approx(0.692)
+    assert results["lambda_0"]["main_decay"].branching_ratio == 1.0
+    assert results["xi_minus"]["source_kind"] == "unknown"
+    assert "[xi_minus] fetch failed" in capsys.readouterr().out
+    assert results["pi_plus"]["source_kind"] == "pdg_sqlite"
+    assert results["pi_plus"]["main_decay"].source == "PDG SQLite unknown"
+    assert results["pi_plus"]["main_decay"].source_kind == "pdg_sqlite"
+
+
+def test_concurrent_bootstrap_closes_every_sql_session(pdg_db):
+    created = []
+
+    def factory():
+        created.append(PDGSQLSession(pdg_db))
+        return created[-1]
+
+    results = bootstrap_all_decays(["proton", "pi_plus", "k_zero", "lambda_0"], workers=2, session_factory=factory)
+    assert results["pi_plus"]["main_decay"].source == "PDG SQLite unknown"
+    assert created
+    for session in created:
+        with pytest.raises(sqlite3.ProgrammingError, match="closed"):
+            session._conn.execute("SELECT 1")
+
+
+def test_rejects_missing_or_foreign_database(tmp_path):
+    with pytest.raises(ValueError, match="not found"):
+        PDGSQLSession(tmp_path / "nope.sqlite")
+    other = tmp_path / "other.sqlite"
+    sqlite3.connect(other).executescript("CREATE TABLE pdgparticle (name TEXT);")
+    with pytest.raises(ValueError, match="missing tables: pdgid"):
+        PDGSQLSession(other)
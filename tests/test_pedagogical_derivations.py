@@ -5,11 +5,14 @@ from copy import deepcopy
 import pytest
 import yaml
 
+import hadron_anki.domain.pedagogical_derivations as pedagogical_derivations
+
 from hadron_anki.domain.legacy_adapter import canonical_to_legacy_particlespec
 from hadron_anki.domain.pedagogical_derivations import (
     derive_catalog_pedagogical_fields,
     derive_diagram_mode,
     derive_display_quark_summary,
+    derive_family_mass_ranks,
     derive_mass_bucket,
     derive_mass_display,
     derive_mass_rank_in_family,
@@ -142,6 +145,47 @@ def test_derive_catalog_pedagogical_fields_enriches_and_keeps_exact():
     )
 
 
+def test_derive_family_mass_ranks_groups_by_family():
+    particles = _load_example_particles()
+    ranks = derive_family_mass_ranks(particles)
+
+    families = {p["exact"]["family"] for p in particles}
+    assert set(ranks) == families
+    for family, rank_map in ranks.items():
+        members = [p for p in particles if p["exact"]["family"] == family]
+        assert rank_map == derive_mass_rank_in_family(members)
+
+
+def test_derive_catalog_pedagogical_fields_matches_per_record_ranking():
+    particles = _load_example_particles()
+    by_family: dict[str, list[dict]] = {}
+    for p in particles:
+        by_family.setdefault(p["exact"]["family"], []).append(p)
+
+    enriched = derive_catalog_pedagogical_fields(particles)
+    for record in enriched:
+        expected = derive_pedagogical_fields(
+            record, family_records=by_family[record["exact"]["family"]]
+        )
+        assert record["pedagogical"] == expected
+
+
+def test_derive_catalog_pedagogical_fields_ranks_each_family_once(monkeypatch):
+    particles = _load_example_particles()
+    calls: list[int] = []
+    original = pedagogical_derivations.derive_mass_rank_in_family
+
+    def _counting(records):
+        calls.append(len(records))
+        return original(records)
+
+    monkeypatch.setattr(pedagogical_derivations, "derive_mass_rank_in_family", _counting)
+    derive_catalog_pedagogical_fields(particles)
+
+    assert len(calls) == len({p["exact"]["family"] for p in particles})
+    assert sum(calls) == len(particles)
+
+
 def test_legacy_adapter_supports_flavor_superposition_pi0():
     particles = _load_example_particles()
     pi0 = _particle_by_id(particles, "pi0")
@@ -0,0 +1,85 @@
+"""Tests for batch / parallel rendering and its determinism guarantee."""
+import pytest
+
+from hadron_anki.deck.apkg import verify_build_determinism
+from hadron_anki.domain.spec import ParticleSpec
+from hadron_anki.preview.generator import generate_preview
+from hadron_anki.render.batch import render_specs
+from hadron_anki.render.cache import RenderCache
+from hadron_anki.render.config import DEFAULT_STYLE
+
+
+DECAY = {
+    "nodes": [{"id": "a", "x": 50, "y": 90}, {"id": "b", "x": 270, "y": 90}],
+    "edges": [{"from": "a", "to": "b", "type": "boson", "label": "W+", "label_tex": "W^+"}],
+}
+
+
+def _specs(n=6):
+    specs = []
+    for i in range(n):
+        specs.append(ParticleSpec(
+            id=f"x{i}", name=f"X{i}", type="baryon" if i % 2 else "meson",
+            quarks=["u", "d", "s"] if i % 2 else ["u", "anti-s"], mass=100.0 + i,
+            decay_diagram=DECAY if i % 3 == 0 else None,
+        ))
+    return specs
+
+
+def test_render_specs_parallel_matches_serial(tmp_path):
+    serial = render_specs(_specs(), math_cache_dir=tmp_path / "a", style=DEFAULT_STYLE, jobs=1)
+    parallel = render_specs(_specs(), math_cache_dir=tmp_path / "b", style=DEFAULT_STYLE, jobs=3)
+    assert serial == parallel
+    assert sorted(serial.decay) == ["x0", "x3"]
+
+
+def test_render_specs_can_skip_decays():
+    out = render_specs(_specs(), style=DEFAULT_STYLE, decays=False)
+    assert out.decay == {}
+    assert len(out.composition) == 6
+
+
+def test_render_specs_merges_worker_cache_stats(tmp_path):
+    cache = RenderCache(tmp_path / "cache")
+    render_specs(_specs(), math_cache_dir=tmp_path / "m", style=DEFAULT_STYLE, cache=cache, jobs=2)
+    # x0 and x3 share one decay diagram, so it may hit depending on scheduling.
+    assert cache.stats.hits + cache.stats.misses == 8
+    assert cache.stats.entries == 7
+
+    warm = RenderCache(tmp_path / "cache")
+    render_specs(_specs(), math_cache_dir=tmp_path / "m", style=DEFAULT_STYLE, cache=warm, jobs=2)
+    assert (warm.stats.hits, warm.stats.misses) == (8, 0)
+
+
+def test_render_specs_merges_worker_evictions(tmp_path):
+    # A one-byte budget makes every worker evict its older entries; the parent
+    # handle never writes, so any evictions it reports came from the workers.
+    cache = RenderCache(tmp_path / "cache", max_bytes=1)
+    render_specs(_specs(), math_cache_dir=tmp_path / "m", style=DEFAULT_STYLE, cache=cache, jobs=2)
+    assert cache.stats.writes >= 7
+    assert cache.stats.evictions > 0
+    assert f"{cache.stats.evictions} evictions" in cache.report()
+
+
+def test_render_specs_rejects_invalid_jobs():
+    with pytest.raises(ValueError):
+        render_specs(_specs(), jobs=0)
+
+
+def test_verify_build_determinism_for_parallel_build():
+    assert verify_build_determinism(
+        _specs(), 2, deck_name="d", template_version="1", model_version="v1",
+        card_types=["composition", "decay"],
+    )
+
+
+def test_generate_preview_is_identical_for_any_jobs(tmp_path):
+    kwargs = dict(card_types=["summary", "composition", "mass"], style=DEFAULT_STYLE)
+    generate_preview(_specs(), tmp_path / "serial", jobs=1, **kwargs)
+    generate_preview(_specs(), tmp_path / "parallel", jobs=2, **kwargs)
+
+    serial = sorted(p.relative_to(tmp_path / "serial") for p in (tmp_path / "serial").rglob("*") if p.is_file())
+    parallel = sorted(p.relative_to(tmp_path / "parallel") for p in (tmp_path / "parallel").rglob("*") if p.is_file())
+    assert serial == parallel
+    for rel in serial:
+        assert (tmp_path / "serial" / rel).read_bytes() == (tmp_path / "parallel" / rel).read_bytes()
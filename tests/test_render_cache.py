@@ -0,0 +1,109 @@
+"""Tests for the persistent content-addressed render cache."""
+import os
+
+import pytest
+
+from hadron_anki.domain.spec import ParticleSpec
+from hadron_anki.render.cache import RenderCache, render_cache_key
+from hadron_anki.render.config import DEFAULT_STYLE
+from hadron_anki.render.feynman import render_feynman_svg
+from hadron_anki.render.svg import render_svg
+
+
+DIAGRAM = {
+    "nodes": [{"id": "a", "x": 50, "y": 90}, {"id": "b", "x": 270, "y": 90}],
+    "edges": [{"from": "a", "to": "b", "type": "boson", "label": "W-", "label_tex": "W^-"}],
+}
+
+
+def _proton(**kwargs):
+    return ParticleSpec(id="p", name="Proton", type="baryon", quarks=["u", "u", "d"], **kwargs)
+
+
+def test_render_cache_key_is_stable_and_order_independent():
+    k1 = render_cache_key("r", "1", {"a": 1, "b": [1, 2]})
+    k2 = render_cache_key("r", "1", {"b": [1, 2], "a": 1})
+    assert k1 == k2
+    assert render_cache_key("r", "2", {"a": 1, "b": [1, 2]}) != k1
+
+
+def test_render_svg_cache_hit_matches_uncached_output(tmp_path):
+    cache = RenderCache(tmp_path)
+    first = render_svg(_proton(), DEFAULT_STYLE, cache=cache)
+    second = render_svg(_proton(), DEFAULT_STYLE, cache=cache)
+
+    assert first == second == render_svg(_proton(), DEFAULT_STYLE)
+    assert (cache.stats.hits, cache.stats.misses, cache.stats.entries) == (1, 1, 1)
+
+
+def test_render_svg_cache_ignores_non_render_fields(tmp_path):
+    cache = RenderCache(tmp_path)
+    render_svg(_proton(mass=938.0), DEFAULT_STYLE, cache=cache)
+    render_svg(_proton(mass=1.0, symbol="p"), DEFAULT_STYLE, cache=cache)
+    assert cache.stats.hits == 1
+
+
+def test_render_svg_cache_misses_on_style_change(tmp_path):
+    cache = RenderCache(tmp_path)
+    render_svg(_proton(), DEFAULT_STYLE, cache=cache)
+    restyled = {**DEFAULT_STYLE, "connector": {"stroke": "red", "stroke-width": "2"}}
+    out = render_svg(_proton(), restyled, cache=cache)
+    assert 'stroke="red"' in out
+    assert cache.stats.misses == 2
+
+
+def test_feynman_cache_persists_across_instances_and_writes_math_assets(tmp_path):
+    cache_dir = tmp_path / "cache"
+    expected = render_feynman_svg(DIAGRAM, math_cache_dir=tmp_path / "m0")
+
+    render_feynman_svg(DIAGRAM, math_cache_dir=tmp_path / "m1", cache=RenderCache(cache_dir))
+    warm = RenderCache(cache_dir)
+    out = render_feynman_svg(DIAGRAM, math_cache_dir=tmp_path / "m2", cache=warm)
+
+    assert out == expected
+    assert warm.stats.hits == 1 and warm.stats.misses == 0
+    assert len(list((tmp_path / "m2").glob("mathlabel_*.svg"))) == 1
+
+
+def test_render_cache_evicts_least_recently_used(tmp_path):
+    cache = RenderCache(tmp_path, max_bytes=250)
+    cache.put("a" * 64, "x" * 100)
+    cache.put("b" * 64, "y" * 100)
+    old = tmp_path / "aa" / f"{'a' * 64}.svg"
+    os.utime(old, ns=(0, 0))
+    os.utime(tmp_path / "bb" / f"{'b' * 64}.svg", ns=(10**9, 10**9))
+    assert cache.get("a" * 64) == "x" * 100  # refreshes "a"; "b" is now LRU
+
+    cache.put("c" * 64, "z" * 100)
+
+    assert cache.stats.evictions == 1
+    assert cache.get("b" * 64) is None
+    assert cache.get("a" * 64) is not None
+    assert cache.stats.bytes <= 250
+
+
+def test_render_cache_full_cache_is_not_rescanned_on_every_put(tmp_path, monkeypatch):
+    cache = RenderCache(tmp_path, max_bytes=1000)
+    scans = []
+    entry_paths = cache._entry_paths
+    monkeypatch.setattr(cache, "_entry_paths", lambda: scans.append(1) or entry_paths())
+
+    for i in range(300):
+        cache.put(f"{i:064x}", "x" * 10)
+
+    # 200 puts land over the bound; each eviction pass frees 10% of it (10 entries).
+    assert len(scans) <= 25
+    assert cache.stats.evictions == 300 - cache.stats.entries
+    assert cache.low_water < cache.stats.bytes <= cache.max_bytes
+
+
+def test_render_cache_report_mentions_counts(tmp_path):
+    cache = RenderCache(tmp_path)
+    render_svg(_proton(), DEFAULT_STYLE, cache=cache)
+    report = cache.report()
+    assert "0 hits" in report and "1 misses" in report and "1 entries" in report
+
+
+def test_render_cache_rejects_non_positive_size(tmp_path):
+    with pytest.raises(ValueError):
+        RenderCache(tmp_path, max_bytes=0)
@@ -56,3 +56,81 @@ def test_load_style_config_preserves_comment_markers_in_strings(tmp_path, monkey
     config = load_style_config()
     assert config["url"] == "https://example.com/not/a/comment"
     assert config["nested"]["path"] == "//still/not/a/comment"
+
+def test_get_style_config_reuses_parsed_style_until_file_changes(tmp_path, monkeypatch):
+    import os
+    from hadron_anki.render import config as config_mod
+    from hadron_anki.render.config import get_style_config
+
+    monkeypatch.chdir(tmp_path)
+    config_file = tmp_path / "hadron.json"
+    config_file.write_text(json.dumps({"label": {"font-size": "10"}}))
+
+    loads = []
+    load = config_mod.load_style_config
+    monkeypatch.setattr(config_mod, "load_style_config", lambda path=None: loads.append(path) or load(path))
+    first = get_style_config()
+    assert get_style_config() == first
+    assert len(loads) == 1
+    assert first["label"]["font-size"] == "10"
+
+    config_file.write_text(json.dumps({"label": {"font-size": "20"}}))
+    st = config_file.stat()
+    os.utime(config_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+    second = get_style_config()
+    assert len(loads) == 2
+    assert second["label"]["font-size"] == "20"
+
+def test_get_style_config_skips_reparse_when_only_mtime_changes(tmp_path, monkeypatch):
+    import os
+    from hadron_anki.render import config as config_mod
+
+    monkeypatch.chdir(tmp_path)
+    config_file = tmp_path / "hadron.json"
+    config_file.write_text(json.dumps({"url": "x"}))
+    first = config_mod.get_style_config()
+
+    st = config_file.stat()
+    os.utime(config_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    monkeypatch.setattr(config_mod, "load_style_config", lambda path=None: pytest.fail("reparsed"))
+    assert config_mod.get_style_config() == first
+
+def test_get_style_config_missing_file_uses_defaults(tmp_path, monkeypatch):
+    from hadron_anki.render.config import get_style_config, DEFAULT_STYLE
+
+    monkeypatch.chdir(tmp_path)
+    assert get_style_config() == DEFAULT_STYLE
+
+def test_get_style_config_mutation_does_not_leak_into_defaults(tmp_path, monkeypatch):
+    import copy
+    from hadron_anki.render.config import get_style_config, load_style_config, DEFAULT_STYLE
+
+    pristine = copy.deepcopy(DEFAULT_STYLE)
+    monkeypatch.chdir(tmp_path)
+    missing = get_style_config()
+    assert missing is not DEFAULT_STYLE
+    missing["flavors"]["u"] = "#000000"
+    missing["label"]["font-size"] = "99"
+
+    (tmp_path / "hadron.json").write_text(json.dumps({"url": "x"}))
+    merged = load_style_config()
+    for section in ("flavors", "label"):
+        merged[section]["mutated"] = True
+
+    assert DEFAULT_STYLE == pristine
+
+
+def test_get_style_config_mutation_does_not_leak_into_the_cache(tmp_path, monkeypatch):
+    from hadron_anki.render.config import get_style_config
+
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "hadron.json").write_text(json.dumps({"label": {"font-size": "10"}}))
+    first = get_style_config()
+    first["label"]["font-size"] = "99"
+    first["flavors"]["u"] = "#000000"
+
+    second = get_style_config()
+    assert second is not first
+    assert second["label"]["font-size"] == "10"
+    assert "u" not in second["flavors"]
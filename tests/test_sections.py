@@ -47,6 +47,15 @@ def test_composition_section_uses_summary_and_image():
     assert '<img src="lambda_0.svg"' in html
 
 
+def test_render_image_inlines_only_listed_svgs():
+    svg = '<!DOCTYPE svg>\n<svg xmlns="http://www.w3.org/2000/svg"><circle r="1"/></svg>'
+    assert sections.render_image("a.svg", "Diagram") == '<img src="a.svg" alt="Diagram" />'
+    assert sections.render_image("a.svg", "Diagram", {"b.svg": svg}) == '<img src="a.svg" alt="Diagram" />'
+    inline = sections.render_image("a.svg", "Diagram", {"a.svg": svg})
+    assert inline.startswith('<svg role="img" aria-label="Diagram" style="')
+    assert inline.endswith('<circle r="1"/></svg>')
+
+
 def test_decay_section_renders_line():
     spec = _spec(decay={"branching_ratio": 0.641, "children": ["proton", "pi_minus"]})
     html = sections.render_decay_section(spec)
@@ -55,3 +64,24 @@ def test_decay_section_renders_line():
 
 def test_feynman_section_empty_without_diagram_file():
     assert sections.render_feynman_section(_spec()) == ""
+
+
+def test_decay_section_lists_several_modes():
+    spec = _spec(
+        id="k_plus",
+        decay={"branching_ratio": 0.6356, "children": ["mu_plus", "nu_mu"]},
+        decay_modes=[
+            {"branching_ratio": 0.6356, "children": ["mu_plus", "nu_mu"]},
+            {"branching_ratio": 0.2067, "children": ["pi_plus", "pi_zero"]},
+        ],
+    )
+    html = sections.render_decay_section(spec)
+    assert "Decay modes" in html
+    assert html.count('class="decay-line"') == 2
+    assert sections.format_decay_lines(spec) == ["64% → μ⁺ + ν_μ", "21% → π⁺ + π⁰"]
+
+
+def test_format_decay_lines_falls_back_to_main_decay():
+    spec = _spec(decay={"branching_ratio": 0.641, "children": ["proton", "pi_minus"]})
+    assert sections.format_decay_lines(spec) == ["64% → p + π⁻"]
+    assert "Main decay" in sections.render_decay_section(spec)
@@ -0,0 +1,37 @@
+import importlib
+from pathlib import Path
+
+import pytest
+import yaml
+
+from hadron_anki.catalog import yaml_loader
+
+
+SHIPPED_CATALOGS = sorted(Path("catalogs").glob("*.yaml"))
+
+
+@pytest.mark.parametrize("path", SHIPPED_CATALOGS, ids=lambda p: p.name)
+def test_safe_load_yaml_matches_pure_python_loader(path):
+    text = path.read_text(encoding="utf-8")
+    assert yaml_loader.safe_load_yaml(text) == yaml.load(text, Loader=yaml.SafeLoader)
+
+
+def test_uses_libyaml_when_available():
+    assert yaml_loader.HAS_LIBYAML == bool(getattr(yaml, "__with_libyaml__", False))
+
+
+def test_safe_load_yaml_rejects_unsafe_tags():
+    with pytest.raises(yaml.YAMLError):
+        yaml_loader.safe_load_yaml("!!python/object/apply:os.system ['true']")
+
+
+def test_falls_back_without_libyaml(monkeypatch):
+    monkeypatch.delattr(yaml, "CSafeLoader", raising=False)
+    try:
+        reloaded = importlib.reload(yaml_loader)
+        assert reloaded.SafeLoader is yaml.SafeLoader
+        assert reloaded.HAS_LIBYAML is False
+        assert reloaded.safe_load_yaml("a: [1, 2]") == {"a": [1, 2]}
+    finally:
+        monkeypatch.undo()
+        importlib.reload(yaml_loader)
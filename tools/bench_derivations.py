@@ -0,0 +1,107 @@
+"""
+Benchmark catalog-level pedagogical derivations on a synthetic catalog.
+
+Times ``derive_catalog_pedagogical_fields`` (family ranks precomputed once)
+and, with ``--compare``, the previous per-record path that re-ranks the whole
+family for every record. With ``--columnar`` (needs NumPy), the vectorized
+mass derivations of ``domain.columnar`` are timed against the scalar ones.
+Run from the repo root:
+
+    python tools/bench_derivations.py --records 50000 --compare --columnar
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from hadron_anki.domain.pedagogical_derivations import (
+    derive_catalog_pedagogical_fields,
+    derive_mass_bucket,
+    derive_mass_display,
+    derive_mass_summary,
+    derive_pedagogical_fields,
+)
+from tools.synthetic_catalog import make_synthetic_records
+
+
+def _legacy_catalog_fields(records):
+    """Per-record family re-ranking, as derive_catalog_pedagogical_fields used to do."""
+    by_family = {}
+    for record in records:
+        by_family.setdefault(record["exact"]["family"], []).append(record)
+    out = []
+    for record in records:
+        enriched = dict(record)
+        enriched["pedagogical"] = derive_pedagogical_fields(
+            record, family_records=by_family[record["exact"]["family"]]
+        )
+        out.append(enriched)
+    return out
+
+
+def _scalar_mass_fields(records):
+    fields = {"mass_display": [], "mass_bucket": [], "mass_summary": []}
+    for record in records:
+        mass = record["exact"]["mass_mev_exact"]
+        display = derive_mass_display(mass)
+        bucket = derive_mass_bucket(mass)
+        fields["mass_display"].append(display)
+        fields["mass_bucket"].append(bucket)
+        fields["mass_summary"].append(derive_mass_summary(bucket, display, mass))
+    return fields
+
+
+def _timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, default=50_000)
+    parser.add_argument("--families", type=int, default=100)
+    parser.add_argument(
+        "--compare",
+        action="store_true",
+        help="Also time the per-record re-ranking path (quadratic in family size)",
+    )
+    parser.add_argument(
+        "--columnar",
+        action="store_true",
+        help="Also time vectorized mass derivations over a columnar view (needs numpy)",
+    )
+    args = parser.parse_args()
+
+    records = make_synthetic_records(args.records, args.families)
+    print(f"{args.records} records in {args.families} families")
+
+    indexed, t_indexed = _timed(derive_catalog_pedagogical_fields, records)
+    print(f"  precomputed rank index : {t_indexed:8.3f} s")
+
+    if args.compare:
+        legacy, t_legacy = _timed(_legacy_catalog_fields, records)
+        print(f"  per-record re-ranking  : {t_legacy:8.3f} s  ({t_legacy / t_indexed:.1f}x slower)")
+        if legacy != indexed:
+            print("ERROR: results differ between the two paths", file=sys.stderr)
+            return 1
+
+    if args.columnar:
+        from hadron_anki.domain.columnar import ColumnarCatalog, batch_mass_fields
+
+        scalar, t_scalar = _timed(_scalar_mass_fields, records)
+        columns, t_pack = _timed(ColumnarCatalog.from_records, records)
+        vectorized, t_vectorized = _timed(batch_mass_fields, columns)
+        print(f"  scalar mass fields     : {t_scalar:8.3f} s")
+        print(f"  columnar view (build)  : {t_pack:8.3f} s")
+        print(f"  columnar mass fields   : {t_vectorized:8.3f} s  ({t_scalar / t_vectorized:.1f}x faster)")
+        if scalar != vectorized:
+            print("ERROR: columnar mass fields differ from the scalar ones", file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
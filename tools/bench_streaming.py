@@ -0,0 +1,73 @@
+"""
+Peak-memory benchmark for the streaming .jsonl build path.
+
+For each catalog size, writes a synthetic canonical catalog as .jsonl
+(``tools/synthetic_catalog.py``), streams it through ``iter_canonical_records``,
+``iter_specs`` and ``build_apkg_streaming`` and reports the traced peak
+allocation. With ``--compare`` the in-memory ``build_apkg`` path is measured
+too. A flat streaming peak across sizes is the expected result:
+
+    python tools/bench_streaming.py --records 1000 10000 100000
+"""
+import argparse
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from hadron_anki.catalog.build import build_specs, iter_specs
+from hadron_anki.catalog.canonical_loader import (
+    iter_canonical_records,
+    load_canonical_catalog,
+    write_canonical_jsonl,
+)
+from hadron_anki.deck.apkg import build_apkg, build_apkg_streaming
+from tools.synthetic_catalog import make_synthetic_catalog
+
+DECK_KWARGS = dict(deck_name="Bench", template_version="bench", model_version="bench")
+
+
+def _streaming(jsonl_path, out_path):
+    build_apkg_streaming(iter_specs(iter_canonical_records(jsonl_path)), str(out_path), **DECK_KWARGS)
+
+
+def _in_memory(jsonl_path, out_path):
+    catalog = load_canonical_catalog(jsonl_path, use_cache=False)
+    build_apkg(specs=build_specs(catalog), out_path=str(out_path), **DECK_KWARGS)
+
+
+def _measure(fn, *args):
+    tracemalloc.start()
+    start = time.perf_counter()
+    fn(*args)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, nargs="+", default=[1000, 10_000])
+    parser.add_argument("--compare", action="store_true", help="Also measure build_apkg")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for n in args.records:
+            jsonl_path = Path(tmpdir) / f"catalog_{n}.jsonl"
+            write_canonical_jsonl(make_synthetic_catalog(n), jsonl_path)
+
+            peak, elapsed = _measure(_streaming, jsonl_path, Path(tmpdir) / "stream.apkg")
+            line = f"{n:>8} records  streaming peak {peak / 2**20:8.1f} MiB ({elapsed:6.1f} s)"
+            if args.compare:
+                peak, elapsed = _measure(_in_memory, jsonl_path, Path(tmpdir) / "full.apkg")
+                line += f"   build_apkg peak {peak / 2**20:8.1f} MiB ({elapsed:6.1f} s)"
+            print(line)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,70 @@
+"""
+Benchmark catalog YAML parsing: libyaml ``CSafeLoader`` vs pure-Python ``SafeLoader``.
+
+Parses the shipped catalogs and a synthetic canonical catalog (10k particles by
+default, see ``tools/synthetic_catalog.py``) with both loaders, checks that the
+results are identical and reports the speedup. Run from the repo root:
+
+    python tools/bench_yaml.py --records 10000
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import yaml
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from tools.synthetic_catalog import make_synthetic_catalog
+
+SHIPPED_CATALOGS = [
+    ROOT / "catalogs" / "core_particles.canonical.yaml",
+    ROOT / "catalogs" / "core_decays.yaml",
+    ROOT / "catalogs" / "core_particles.yaml",
+]
+
+
+def _best_of(repeat, fn, *args):
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+def _bench(label, text, repeat):
+    pure, t_pure = _best_of(repeat, yaml.load, text, yaml.SafeLoader)
+    fast, t_fast = _best_of(repeat, yaml.load, text, yaml.CSafeLoader)
+    print(f"  {label:<36} SafeLoader {t_pure * 1000:9.1f} ms   CSafeLoader {t_fast * 1000:9.1f} ms   ({t_pure / t_fast:.1f}x)")
+    return pure == fast
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=3, help="Best of N runs per loader")
+    args = parser.parse_args()
+
+    if not getattr(yaml, "__with_libyaml__", False):
+        print("PyYAML was built without libyaml; CSafeLoader is unavailable.", file=sys.stderr)
+        return 1
+
+    identical = True
+    for path in SHIPPED_CATALOGS:
+        identical &= _bench(path.name, path.read_text(encoding="utf-8"), args.repeat)
+
+    synthetic = yaml.dump(make_synthetic_catalog(args.records), Dumper=yaml.CSafeDumper, sort_keys=False)
+    identical &= _bench(f"synthetic ({args.records} particles)", synthetic, args.repeat)
+
+    if not identical:
+        print("ERROR: loaders disagree on at least one catalog", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,37 @@
+"""
+Report every problem in a canonical catalog in one pass.
+
+Prints one ``file:line:column: path: message`` line per violation (see
+``hadron_anki.domain.batch_validator``) and exits 1 if there are any:
+
+    python tools/validate_catalog.py catalogs/core_particles.canonical.yaml
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from hadron_anki.catalog.canonical_loader import validate_catalog_file
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("catalogs", nargs="+", help="Canonical catalog files (.yaml/.yml/.json/.jsonl)")
+    args = parser.parse_args()
+
+    total = 0
+    for path in args.catalogs:
+        start = time.perf_counter()
+        issues = validate_catalog_file(path)
+        elapsed = time.perf_counter() - start
+        for issue in issues:
+            print(f"{path}:{issue}")
+        print(f"{path}: {len(issues)} issue(s) in {elapsed:.2f} s", file=sys.stderr)
+        total += len(issues)
+    return 1 if total else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())